@@ -9,6 +9,7 @@ This example shows:
 - Multiple output formats
 """
 
+import asyncio
 from pathlib import Path
 
 from pencraft import Settings
@@ -19,28 +20,23 @@ from pencraft.formatters.citations import CitationFormatter
 from pencraft.formatters.frontmatter import FrontmatterGenerator
 from pencraft.generator import BlogGenerator
 from pencraft.llm.client import LLMClient
+from pencraft.utils.files import write_text_parts
+from pencraft.utils.text import count_words
 
 
-def step_by_step_generation() -> None:
+async def step_by_step_generation(llm: LLMClient) -> None:
     """Generate a blog post step by step with more control."""
 
     print("=" * 60)
     print("Step-by-Step Blog Generation")
     print("=" * 60)
 
-    # Create LLM client
-    llm = LLMClient(
-        base_url="http://localhost:3030",
-        api_key="dummy-key",
-        model="gpt-4",
-    )
-
     topic = "Best Practices for REST API Design"
 
     # Step 1: Research
     print("\n📚 Step 1: Researching topic...")
     research_agent = ResearchAgent(llm_client=llm)
-    research_result = research_agent.execute(
+    research_result = await research_agent.aexecute(
         topic=topic,
         additional_context="Focus on modern best practices and common mistakes to avoid.",
     )
@@ -54,7 +50,7 @@ def step_by_step_generation() -> None:
     # Step 2: Create outline
     print("\n📝 Step 2: Creating outline...")
     planner_agent = PlannerAgent(llm_client=llm)
-    outline_result = planner_agent.execute(
+    outline_result = await planner_agent.aexecute(
         topic=topic,
         research_summary=research_result.content,
         target_word_count=3000,
@@ -83,7 +79,7 @@ def step_by_step_generation() -> None:
         categories=outline.get("categories", []),
     )
 
-    write_result = writer_agent.execute(
+    write_result = await writer_agent.aexecute(
         outline=blog_outline,
         research_summary=research_result.content,
         sources=research_result.metadata["research_data"]["sources"],
@@ -104,20 +100,19 @@ def step_by_step_generation() -> None:
         author="Pencraft",
     )
 
-    full_content = frontmatter + "\n" + write_result.content
-
     output_path = Path("./output/step-by-step-blog.md")
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(full_content, encoding="utf-8")
+    # Write the parts directly instead of concatenating them into one string first
+    write_text_parts(output_path, [frontmatter, "\n", write_result.content])
 
-    word_count = len(write_result.content.split())
+    word_count = count_words(write_result.content)
     print("\n✅ Complete!")
     print(f"   Title: {blog_outline.title}")
     print(f"   Words: {word_count}")
     print(f"   File: {output_path}")
 
 
-async def async_generation() -> None:
+async def async_generation(llm: LLMClient) -> None:
     """Generate a blog post asynchronously."""
 
     print("\n" + "=" * 60)
@@ -128,7 +123,8 @@ async def async_generation() -> None:
         llm={"base_url": "http://localhost:3030", "api_key": "dummy-key"},
     )
 
-    generator = BlogGenerator(settings=settings)
+    # Reuse the shared client (and its connection pool) instead of creating a new one
+    generator = BlogGenerator(settings=settings, llm_client=llm)
 
     print("\n🚀 Generating blog post asynchronously...")
 
@@ -169,26 +165,33 @@ def custom_citation_styles() -> None:
         },
     ]
 
+    # Parse once, render in every style
+    formatter = CitationFormatter(citations=CitationFormatter.parse(sources))
     for style in ["markdown", "apa", "mla", "chicago"]:
         print(f"\n{style.upper()} Style:")
         print("-" * 40)
-        formatter = CitationFormatter.from_sources(sources, style=style)
-        print(formatter.generate_references_section())
+        print(formatter.render(style))
 
 
-def main() -> None:
-    """Run all examples."""
+async def main() -> None:
+    """Run all examples on a single event loop."""
 
     print("\n🎯 Pencraft Advanced Examples\n")
 
-    # Step-by-step generation
-    step_by_step_generation()
+    # One LLM client (one connection pool) shared by every example
+    async with LLMClient(
+        base_url="http://localhost:3030",
+        api_key="dummy-key",
+        model="gpt-4",
+    ) as llm:
+        # Step-by-step generation
+        await step_by_step_generation(llm)
 
-    # Citation styles
-    custom_citation_styles()
+        # Citation styles
+        custom_citation_styles()
 
-    # Async generation (uncomment to run)
-    # asyncio.run(async_generation())
+        # Async generation
+        await async_generation(llm)
 
     print("\n" + "=" * 60)
     print("All examples completed!")
@@ -196,4 +199,4 @@ def main() -> None:
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -7,87 +7,552 @@ Focusing on:
 3. LLM Internals & Fine-Tuning
 4. Agentic Workflows & Orchestration
 5. Production-Ready AI Systems
+
+Topics are read from topics.jsonl next to this script.
 """
 
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import os
+import shutil
+import statistics
+import sys
+import threading
 import time
 import warnings
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field, replace
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+from json import dumps as json_dumps
+
+# Pencraft and rich are imported where they are used, so --help and --dry-run
+# answer immediately instead of waiting for the generator's import graph
+if TYPE_CHECKING:
+    from rich.progress import Progress
 
-from pencraft import Settings
-from pencraft.generator import BlogGenerator
+    from pencraft.generator import BlogGenerator, GeneratedBlog
 
 warnings.filterwarnings("ignore", message="This package.*has been renamed")
 
-# 30 High-CPC Tutorial Topics for 2026 (LLMs, Agents, MCP - Build Your Own)
-BLOG_TOPICS = [
-    # --- 1. Building AI Agents from Scratch (High CPC: Developer Tools, AI SaaS) ---
-    {"topic": "Build Your First AI Agent in Python: A Complete Step-by-Step Tutorial", "tags": ["ai-agents", "python", "tutorial", "from-scratch"], "categories": ["Agents", "Tutorial"], "cover_image": ""},
-    {"topic": "How to Build a ReAct Agent from Scratch: Reasoning + Acting Loop Explained", "tags": ["react-agent", "reasoning", "ai-agents", "implementation"], "categories": ["Agents", "Tutorial"], "cover_image": ""},
-    {"topic": "Building an Autonomous Coding Agent: From Prompt to Pull Request", "tags": ["coding-agent", "automation", "github", "devtools"], "categories": ["Agents", "Dev Tools"], "cover_image": ""},
-    {"topic": "Create a Multi-Agent System: Orchestrating Specialized AI Agents in Python", "tags": ["multi-agent", "orchestration", "python", "architecture"], "categories": ["Agents", "Architecture"], "cover_image": ""},
-    {"topic": "Building an AI Research Agent: Web Search, Summarization, and Citation", "tags": ["research-agent", "web-search", "rag", "automation"], "categories": ["Agents", "Research"], "cover_image": ""},
-    {"topic": "How to Add Memory to Your AI Agent: Short-Term, Long-Term, and Episodic", "tags": ["agent-memory", "rag", "vector-db", "architecture"], "categories": ["Agents", "Memory"], "cover_image": ""},
-    {"topic": "Building a Tool-Using Agent: Function Calling Implementation from Scratch", "tags": ["function-calling", "tool-use", "openai-api", "implementation"], "categories": ["Agents", "Tools"], "cover_image": ""},
-    {"topic": "Create Your Own AutoGPT: Building a Goal-Oriented Autonomous Agent", "tags": ["autogpt", "autonomous-agents", "goal-planning", "python"], "categories": ["Agents", "Automation"], "cover_image": ""},
-    {"topic": "Building a Customer Support Agent: RAG + Intent Classification + Handoff", "tags": ["support-agent", "chatbot", "enterprise", "production"], "categories": ["Agents", "Enterprise"], "cover_image": ""},
-    {"topic": "How to Build an Agent Evaluation Framework: Testing AI Agents at Scale", "tags": ["agent-testing", "evaluation", "benchmarks", "quality"], "categories": ["Agents", "Evaluation"], "cover_image": ""},
-
-    # --- 2. MCP (Model Context Protocol) Servers & Tools (Emerging High CPC) ---
-    {"topic": "What is MCP (Model Context Protocol)? The Complete Developer Guide", "tags": ["mcp", "model-context-protocol", "anthropic", "ai-tools"], "categories": ["MCP", "Guide"], "cover_image": ""},
-    {"topic": "Build Your First MCP Server: A Step-by-Step Python Tutorial", "tags": ["mcp-server", "python", "tutorial", "from-scratch"], "categories": ["MCP", "Tutorial"], "cover_image": ""},
-    {"topic": "Creating Custom MCP Tools: Extend Claude and Other AI Assistants", "tags": ["mcp-tools", "claude", "extensibility", "integration"], "categories": ["MCP", "Tools"], "cover_image": ""},
-    {"topic": "Build an MCP Server for Database Access: SQL Queries via AI", "tags": ["mcp-database", "sql", "postgres", "data-access"], "categories": ["MCP", "Data"], "cover_image": ""},
-    {"topic": "MCP Server for File System Operations: Read, Write, Search Files", "tags": ["mcp-filesystem", "file-operations", "automation", "tools"], "categories": ["MCP", "Filesystem"], "cover_image": ""},
-    {"topic": "Building an MCP Server for API Integration: Connect Any REST API to AI", "tags": ["mcp-api", "rest-api", "integration", "automation"], "categories": ["MCP", "API"], "cover_image": ""},
-    {"topic": "MCP vs Function Calling: When to Use Each for AI Tool Integration", "tags": ["mcp", "function-calling", "comparison", "architecture"], "categories": ["MCP", "Architecture"], "cover_image": ""},
-    {"topic": "Deploy MCP Servers in Production: Docker, Security, and Scaling", "tags": ["mcp-production", "docker", "security", "deployment"], "categories": ["MCP", "Production"], "cover_image": ""},
-    {"topic": "Build a Code Execution MCP Server: Safe Sandboxed Python Runner", "tags": ["mcp-code-execution", "sandbox", "security", "python"], "categories": ["MCP", "Security"], "cover_image": ""},
-    {"topic": "Creating MCP Resources and Prompts: Beyond Simple Tools", "tags": ["mcp-resources", "mcp-prompts", "advanced", "patterns"], "categories": ["MCP", "Advanced"], "cover_image": ""},
-
-    # --- 3. LLM Internals & Production Systems (Highest CPC: Enterprise AI) ---
-    {"topic": "Build Your Own LLM from Scratch: Transformer Implementation in PyTorch", "tags": ["llm-from-scratch", "transformers", "pytorch", "deep-learning"], "categories": ["LLM", "Tutorial"], "cover_image": ""},
-    {"topic": "Fine-Tuning LLMs on Custom Data: LoRA, QLoRA, and Full Fine-Tuning", "tags": ["fine-tuning", "lora", "qlora", "training"], "categories": ["LLM", "Training"], "cover_image": ""},
-    {"topic": "Build a Production RAG System: Vector Search, Reranking, and Caching", "tags": ["rag", "vector-db", "production", "enterprise"], "categories": ["LLM", "RAG"], "cover_image": ""},
-    {"topic": "Deploying LLMs at Scale: vLLM, TGI, and Inference Optimization", "tags": ["llm-deployment", "vllm", "inference", "scaling"], "categories": ["LLM", "Production"], "cover_image": ""},
-    {"topic": "Build Your Own Embeddings Model: Sentence Transformers from Scratch", "tags": ["embeddings", "sentence-transformers", "nlp", "from-scratch"], "categories": ["LLM", "Embeddings"], "cover_image": ""},
-    {"topic": "LLM Prompt Engineering: Systematic Approaches for Production Systems", "tags": ["prompt-engineering", "production", "best-practices", "enterprise"], "categories": ["LLM", "Prompting"], "cover_image": ""},
-    {"topic": "Build a Streaming LLM API: Server-Sent Events and Token-by-Token Output", "tags": ["streaming", "sse", "api", "real-time"], "categories": ["LLM", "API"], "cover_image": ""},
-    {"topic": "LLM Caching Strategies: Semantic Cache, KV Cache, and Prompt Caching", "tags": ["caching", "optimization", "performance", "cost-reduction"], "categories": ["LLM", "Optimization"], "cover_image": ""},
-    {"topic": "Building LLM Guardrails: Content Filtering, PII Detection, and Safety", "tags": ["guardrails", "safety", "content-moderation", "enterprise"], "categories": ["LLM", "Safety"], "cover_image": ""},
-    {"topic": "LLM Observability: Tracing, Logging, and Debugging AI Applications", "tags": ["observability", "tracing", "logging", "debugging"], "categories": ["LLM", "Observability"], "cover_image": ""},
-
-    # --- 4. LLM Neologisms: Naming AI Behaviors (Viral, High Engagement) ---
-    {"topic": "The 'Context Amnesia' Problem: Why LLMs Forget What You Just Said", "tags": ["neologism", "context-window", "llm-behavior", "psychology"], "categories": ["AI", "Neologisms"], "cover_image": ""},
-    {"topic": "Neologism 'Sycophancy Spiral': When Your AI Agrees With Everything", "tags": ["neologism", "sycophancy", "alignment", "ai-behavior"], "categories": ["AI", "Neologisms"], "cover_image": ""},
-    {"topic": "The 'Hallucination Cascade': Why One Wrong Fact Spawns Ten More", "tags": ["neologism", "hallucinations", "llm-failures", "psychology"], "categories": ["AI", "Neologisms"], "cover_image": ""},
-    {"topic": "Neologism 'Prompt Bleed': When Instructions Leak Between Conversations", "tags": ["neologism", "prompt-injection", "security", "llm-quirks"], "categories": ["AI", "Neologisms"], "cover_image": ""},
-    {"topic": "The 'Confidence Cliff': Why LLMs Sound Sure About Wrong Answers", "tags": ["neologism", "calibration", "uncertainty", "ai-psychology"], "categories": ["AI", "Neologisms"], "cover_image": ""},
-    {"topic": "Neologism 'Token Anxiety': The Hidden Cost of Long Conversations", "tags": ["neologism", "context-limits", "performance", "llm-behavior"], "categories": ["AI", "Neologisms"], "cover_image": ""},
-    {"topic": "The 'Refusal Roulette': Why AI Sometimes Blocks Innocent Requests", "tags": ["neologism", "safety", "over-alignment", "ai-behavior"], "categories": ["AI", "Neologisms"], "cover_image": ""},
-    {"topic": "Neologism 'Loop Lock': When LLMs Get Stuck Repeating Themselves", "tags": ["neologism", "repetition", "decoding", "llm-failures"], "categories": ["AI", "Neologisms"], "cover_image": ""},
-    {"topic": "The 'Persona Collapse': Why Your Custom AI Personality Fades Over Time", "tags": ["neologism", "system-prompts", "persona", "alignment"], "categories": ["AI", "Neologisms"], "cover_image": ""},
-    {"topic": "Neologism 'Knowledge Cutoff Hallucination': Inventing Facts Beyond Training Data", "tags": ["neologism", "knowledge-cutoff", "hallucinations", "temporal"], "categories": ["AI", "Neologisms"], "cover_image": ""},
-]
-
-
-def main() -> None:
-    """Generate 200 High-Impact Technical Deep Dives."""
-
-    # Create output directory
-    output_dir = Path("./output/high-cpc-2026-blogs")
+# Number of posts generated concurrently. Every post is bound on LLM and web
+# round-trips, so running several at once hides that latency; keep it within
+# what your LLM endpoint and the search providers tolerate. For batching servers
+# (vLLM, llama.cpp) match the server's parallel slots, e.g. vLLM --max-num-seqs.
+# Default for --concurrency.
+MAX_CONCURRENCY = int(os.environ.get("PENCRAFT_CONCURRENCY", "5"))
+
+# Words to aim for in every post
+TARGET_WORD_COUNT = 4000
+
+# Attempts per post. Only posts that failed on a timeout, a dropped connection or a
+# server error are retried, after an exponential backoff (research is cheap to redo:
+# searches and scraped pages are cached); anything else is reported right away
+POST_ATTEMPTS = 3
+RETRY_MIN_DELAY = 2.0
+RETRY_MAX_DELAY = 30.0
+
+# After this many posts fail in a row, stop starting new ones for BREAKER_COOLDOWN
+# seconds; abort the batch if the LLM server is still unreachable after that
+MAX_CONSECUTIVE_FAILURES = 5
+BREAKER_COOLDOWN = 60.0
+
+
+@dataclass(frozen=True, slots=True)
+class BlogSpec:
+    """One post to generate (immutable, safe to share between concurrent tasks)."""
+
+    topic: str
+    tags: tuple[str, ...]
+    categories: tuple[str, ...]
+    cover_image: str | None = None
+
+    @property
+    def primary_category(self) -> str:
+        """First category, used to group related posts ("" for uncategorized topics)."""
+        return self.categories[0] if self.categories else ""
+
+
+# Context: Engineering Authority & Deep Dive.
+# Identical for every topic, so it is appended to the agents' system prompts once: the
+# byte-identical prefix lets the provider's prompt cache reuse it across all calls.
+ENGINEERING_BRIEF = """\
+CRITICAL INSTRUCTIONS FOR 2026 ENGINEERING DEEP DIVE:
+
+**Goal:** Create the single best resource on the internet for this specific technical topic.
+**Audience:** Senior Engineers, CTOs, System Architects, Researchers. Target Tier 1 Geographies (US/UK/DE).
+**Tone:** "Engineering Authority." No fluff. No "In today's fast-paced digital world." Start interacting with complexity immediately.
+
+**Depth Level:** Kernel/Protocol/Math level.
+
+**Mandatory Elements for High CPC & Authority:**
+1.  **First Principles**: Explain *how* it works internally (e.g., "Don't just say X is fast; explain the memory access pattern").
+2.  **Comparison Tables**: Include specs, costs, latency numbers, or feature comparisons (e.g., "Latency vs Throughput table").
+3.  **Code/Config Snippets**: Must include relevant code (Python/C/Rust/Bash) or configuration (YAML/JSON) to demonstrate realism.
+4.  **Opinionated & Forward Looking**: Is this tech dying? Is it hype? Give a verdict for 2026 strategies.
+5.  **Monetization Hooks**: Mention "Enterprise Pricing," "Cost Analysis," "Hardware Specs" where relevant (attracts high-value B2B/Tech ads).
+
+**Structure Guidelines:**
+-   **Introduction**: define the problem space technically.
+-   **The Architecture/Internals**: The "meat" of the post.
+-   **Real World Performance**: Benchmarks, costs, trade-offs.
+-   **2026 Outlook**: What's changing? (e.g., "Post-Quantum," "AI integration").
+
+Use "we," "I," and direct address to build connection. Make it feel like a Senior Staff Engineer explaining a concept to a peer.
+"""
+
+# Per-topic context passed to the agents; the topic is appended to this constant prefix
+TOPIC_CONTEXT_PREFIX = "**Topic:** "
+
+
+def cache_key(spec: BlogSpec, additional_context: str) -> str:
+    """Hash everything that determines a post, so identical requests can be reused."""
+    request = "|".join(
+        (
+            spec.topic,
+            ",".join(sorted(spec.tags)),
+            ",".join(sorted(spec.categories)),
+            spec.cover_image or "",
+            str(TARGET_WORD_COUNT),
+            additional_context,
+        )
+    )
+    return hashlib.blake2b(request.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def copy_atomic(source: Path, target: Path) -> Path:
+    """Copy a post so that readers see either the old file or the whole new one."""
+    tmp = target.with_name(f"{target.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        shutil.copy2(source, tmp)
+        os.replace(tmp, target)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return target
+
+
+def is_transient(error: BaseException) -> bool:
+    """Check whether a post failed on a timeout, dropped connection or LLM server error.
+
+    The generator chains the agent's original exception, so the whole cause chain
+    is searched.
+    """
+    import openai
+
+    transient = (openai.APIConnectionError, openai.InternalServerError)
+    cause: BaseException | None = error
+    while cause is not None:
+        if isinstance(cause, transient):
+            return True
+        cause = cause.__cause__
+    return False
+
+
+def restore_cached(cache_entry: Path, output_dir: Path) -> Path | None:
+    """Copy a previously generated post into the output directory, if cached."""
+    cached = next(cache_entry.glob("*.md"), None) if cache_entry.is_dir() else None
+    if cached is None:
+        return None
+    target = output_dir / cached.name
+    if not target.exists():
+        copy_atomic(cached, target)
+    return target
+
+
+def load_topics(path: Path) -> tuple[BlogSpec, ...]:
+    """Load post specs from a JSON Lines file (one object per line).
+
+    Tags and categories repeat across many posts; they are interned so every spec
+    shares one string object per label instead of a fresh copy per line.
+    """
+    topics = []
+    with path.open("rb") as f:
+        for line in f:
+            if line.strip():
+                entry = json_loads(line)
+                topics.append(
+                    BlogSpec(
+                        topic=entry["topic"],
+                        tags=tuple(map(sys.intern, entry.get("tags", ()))),
+                        categories=tuple(map(sys.intern, entry.get("categories", ()))),
+                        cover_image=entry.get("cover_image"),
+                    )
+                )
+    return tuple(topics)
+
+
+# High-CPC tutorial topics for 2026 (LLMs, Agents, MCP - Build Your Own), kept as
+# data next to this script so the list can be edited without touching the code
+TOPICS_FILE = Path(__file__).with_name("topics.jsonl")
+
+
+def load_journal(path: Path) -> dict[str, Path]:
+    """Read the resume journal: topic -> saved file, for posts that still exist.
+
+    A torn last line left by an interrupted run is cut off, so this run's first
+    entry starts on a line of its own instead of being appended to it.
+    """
+    if not path.exists():
+        return {}
+    done = {}
+    with path.open("r+b") as f:
+        data = f.read()
+        if not data.endswith(b"\n"):
+            f.truncate(data.rfind(b"\n") + 1)
+        for line in data.splitlines():
+            try:
+                entry = json_loads(line)
+                saved = Path(entry["file"])
+                topic = entry["topic"]
+            except (ValueError, KeyError, TypeError):
+                continue  # torn or malformed line
+            if saved.exists():
+                done[topic] = saved
+    return done
+
+
+def append_journal(path: Path, index: int, topic: str, file_path: str) -> None:
+    """Record a finished post durably so a restarted run skips it."""
+    line = json_dumps({"index": index, "topic": topic, "file": file_path}, ensure_ascii=False)
+    with path.open("a", encoding="utf-8") as f:
+        f.write(line + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+
+async def validate_cover_images(specs: Sequence[BlogSpec]) -> tuple[BlogSpec, ...]:
+    """Check every distinct cover image URL at once, before any LLM tokens are spent.
+
+    Specs whose image does not answer a HEAD request with 2xx/3xx keep their
+    topic but lose the cover image.
+    """
+    import httpx
+
+    urls = {spec.cover_image for spec in specs if spec.cover_image}
+    if not urls:
+        return tuple(specs)
+
+    async with httpx.AsyncClient(timeout=5.0, follow_redirects=True) as client:
+
+        async def reachable(url: str) -> bool:
+            try:
+                response = await client.head(url)
+            except httpx.HTTPError:
+                return False
+            return response.is_success
+
+        checked = await asyncio.gather(*(reachable(url) for url in urls))
+
+    broken = {url for url, ok in zip(urls, checked) if not ok}
+    for url in sorted(broken):
+        print(f"⚠️  Cover image unreachable, dropping it: {url}")
+    return tuple(
+        replace(spec, cover_image=None) if spec.cover_image in broken else spec for spec in specs
+    )
+
+
+@dataclass
+class BatchSummary:
+    """Outcome of one generate_batch() run."""
+
+    successful: int = 0
+    cached: int = 0
+    failed: int = 0
+    skipped: int = 0
+    # Wall-clock time of each generated post (monotonic clock)
+    durations_ns: list[int] = field(default_factory=list)
+
+    def timing_report(self) -> str:
+        """Summarize post durations as total / median / p95 seconds."""
+        if not self.durations_ns:
+            return "no posts generated"
+        median = statistics.median(self.durations_ns)
+        p95 = (
+            statistics.quantiles(self.durations_ns, n=20, method="inclusive")[18]
+            if len(self.durations_ns) > 1
+            else self.durations_ns[0]
+        )
+        return (
+            f"median {median / 1e9:.1f}s, p95 {p95 / 1e9:.1f}s, "
+            f"sum {sum(self.durations_ns) / 1e9:.0f}s"
+        )
+
+
+async def generate_batch(
+    generator: BlogGenerator,
+    specs: Sequence[BlogSpec],
+    output_dir: Path,
+    progress: Progress,
+    concurrency: int = MAX_CONCURRENCY,
+) -> BatchSummary:
+    """Generate every spec concurrently, reusing posts finished by earlier runs.
+
+    Args:
+        generator: Generator shared by all posts.
+        specs: Posts to generate.
+        output_dir: Directory posts are saved to (cached copies live in .cache,
+            the resume journal in .progress.jsonl).
+        progress: Progress display; the caller starts and stops it.
+        concurrency: Posts generated at a time.
+
+    Returns:
+        Counts of generated, reused, failed and skipped posts.
+    """
+    from rich.traceback import Traceback
+
+    cache_dir = output_dir / ".cache"
+    # Posts finished by an interrupted earlier run
+    journal_path = output_dir / ".progress.jsonl"
+    finished_before = load_journal(journal_path)
+    semaphore = asyncio.Semaphore(concurrency)
+    total = len(specs)
+    # Shortened titles for log lines, computed once per post
+    short_titles = [spec.topic[:60] for spec in specs]
+    overall = progress.add_task("Generating", total=total)
+
+    # Simple progress callback (the agents are shared, so one callback serves every post)
+    def on_progress(msg: str) -> None:
+        progress.log(f"   ► {msg}")
+
+    async def generate_one(i: int, spec: BlogSpec) -> tuple[int, GeneratedBlog | Path | Exception]:
+        topic = spec.topic
+        if topic in finished_before:
+            return i, finished_before[topic]
+
+        # Only the topic varies per call; the brief lives in the system prompts
+        additional_context = TOPIC_CONTEXT_PREFIX + topic
+
+        # Identical request generated by an earlier run: reuse it
+        cache_entry = cache_dir / cache_key(spec, additional_context)
+        restored = restore_cached(cache_entry, output_dir)
+        if restored is not None:
+            return i, restored
+
+        for attempt in range(1, POST_ATTEMPTS + 1):
+            await breaker_closed.wait()
+            async with semaphore:
+                progress.log(f"[{i}/{total}] Generating: {short_titles[i - 1]}...")
+
+                start_ns = time.perf_counter_ns()
+
+                try:
+                    blog = await generator.agenerate(
+                        topic=topic,
+                        additional_context=additional_context,
+                        target_word_count=TARGET_WORD_COUNT,
+                        tags=spec.tags,
+                        categories=spec.categories,
+                        author="Suhaib Bin Younis",
+                        draft=False,
+                        output_dir=output_dir,
+                        skip_research=False,
+                        cover_image=spec.cover_image,
+                        progress_callback=on_progress,
+                    )
+                except Exception as e:
+                    if attempt == POST_ATTEMPTS or not is_transient(e):
+                        # Don't stop the whole train for one failure; it is reported below
+                        return i, e
+                    error = e
+                else:
+                    break
+
+            # Back off outside the semaphore so other posts keep its slot busy
+            delay = min(RETRY_MIN_DELAY * 2 ** (attempt - 1), RETRY_MAX_DELAY)
+            progress.log(
+                f"   🔁 [{i}/{total}] Attempt {attempt} failed ({error}), retrying in {delay:g}s"
+            )
+            await asyncio.sleep(delay)
+
+        elapsed_ns = time.perf_counter_ns() - start_ns
+        summary.durations_ns.append(elapsed_ns)
+        progress.log(
+            f"   ✅ [{i}/{total}] Complete: {blog.word_count} words in {elapsed_ns / 1e9:.1f}s"
+        )
+
+        cache_entry.mkdir(parents=True, exist_ok=True)
+        saved = Path(blog.file_path)
+        copy_atomic(saved, cache_entry / saved.name)
+        append_journal(journal_path, i, topic, blog.file_path)
+        return i, blog
+
+    summary = BatchSummary()
+    # Circuit breaker: cleared while the batch cools down after repeated failures
+    breaker_closed = asyncio.Event()
+    breaker_closed.set()
+
+    # No fixed delay between posts: the semaphore bounds how hard we hit the APIs,
+    # and rate limiting is handled per request by llm.max_retries (see main()).
+    tasks = [asyncio.ensure_future(generate_one(i, spec)) for i, spec in enumerate(specs, 1)]
+
+    # Report posts as they finish rather than in submission order
+    consecutive_failures = 0
+    reported: set[int] = set()
+    for done, finished in enumerate(asyncio.as_completed(tasks), 1):
+        i, result = await finished
+        reported.add(i)
+        title = short_titles[i - 1]
+        progress.advance(overall)
+        if isinstance(result, Exception):
+            progress.log(f"   ❌ [done {done}/{total}] {title}: failed: {result}")
+            progress.log(Traceback.from_exception(type(result), result, result.__traceback__))
+            summary.failed += 1
+            consecutive_failures += 1
+            if consecutive_failures >= MAX_CONSECUTIVE_FAILURES:
+                progress.log(
+                    f"⏸️  {consecutive_failures} posts failed in a row, "
+                    f"pausing for {BREAKER_COOLDOWN:g}s"
+                )
+                breaker_closed.clear()
+                await asyncio.sleep(BREAKER_COOLDOWN)
+                if await generator.llm.acheck_connection():
+                    consecutive_failures = 0
+                    breaker_closed.set()
+                    continue
+                progress.log("🛑 LLM server still unreachable, aborting")
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                # Posts that finished before the abort were saved (and journaled)
+                for j, task in enumerate(tasks, 1):
+                    if j in reported:
+                        continue
+                    if task.cancelled():
+                        summary.skipped += 1
+                    elif task.exception() is not None:
+                        summary.failed += 1
+                    else:
+                        outcome = task.result()[1]
+                        if isinstance(outcome, Exception):
+                            summary.failed += 1
+                        elif isinstance(outcome, Path):
+                            summary.cached += 1
+                        else:
+                            summary.successful += 1
+                break
+            continue
+        consecutive_failures = 0
+        if isinstance(result, Path):
+            progress.log(f"   ♻️  [done {done}/{total}] {title}: reused {result.name}")
+            summary.cached += 1
+        else:
+            saved = os.path.basename(result.file_path)
+            progress.log(f"   📄 [done {done}/{total}] {title}: saved {saved}")
+            summary.successful += 1
+
+    return summary
+
+
+RULE = "=" * 70
+
+
+def write_lines(lines: Iterable[str]) -> None:
+    """Write a block of lines to stdout in one call, so it is never interleaved."""
+    sys.stdout.write("".join(f"{line}\n" for line in lines))
+    sys.stdout.flush()
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--topics", type=Path, default=TOPICS_FILE, help="JSON Lines file of topics"
+    )
+    parser.add_argument(
+        "--output-dir",
+        type=Path,
+        default=Path("./output/high-cpc-2026-blogs"),
+        help="directory posts are written to",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=MAX_CONCURRENCY,
+        help="posts generated at a time (default: $PENCRAFT_CONCURRENCY or 5)",
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="validate the topics file, list it and exit"
+    )
+    return parser.parse_args()
+
+
+async def main(args: argparse.Namespace) -> None:
+    """Generate 200 High-Impact Technical Deep Dives.
+
+    Args:
+        args: Parsed command-line arguments.
+    """
+    # Duplicate specs would only generate the same post twice. Posts of one category
+    # run back to back: they share sources, which the generator's scraper caches.
+    specs = tuple(
+        sorted(dict.fromkeys(load_topics(args.topics)), key=lambda spec: spec.primary_category)
+    )
+    if args.dry_run:
+        write_lines(
+            f"{i:3}. [{spec.primary_category}] {spec.topic}" for i, spec in enumerate(specs, 1)
+        )
+        return
+
+    specs = await validate_cover_images(specs)
+
+    import httpx
+    from rich.progress import (
+        BarColumn,
+        MofNCompleteColumn,
+        Progress,
+        SpinnerColumn,
+        TextColumn,
+        TimeElapsedColumn,
+    )
+
+    from pencraft import Settings
+    from pencraft.config.defaults import (
+        DEFAULT_PLANNER_SYSTEM_PROMPT,
+        DEFAULT_RESEARCH_SYSTEM_PROMPT,
+        DEFAULT_WRITER_SYSTEM_PROMPT,
+    )
+    from pencraft.generator import BlogGenerator
+    from pencraft.llm.client import LLMClient
+
+    # Create output directory (completed posts are also kept in .cache for re-runs)
+    output_dir = args.output_dir
     output_dir.mkdir(parents=True, exist_ok=True)
+    output_abs = str(output_dir.resolve())
 
-    # Create settings for long-form content
+    # Create settings for long-form content (validated once here; the generator and
+    # its agents keep references to it, so it must not be modified during the batch)
     settings = Settings(
         llm={
             "base_url": "http://localhost:3030/v1",
             "api_key": "dummy-key",
             "temperature": 0.7,  # Slightly higher for creative technical analogies
             "max_tokens": 8192,
+            # Backoff only happens on 429/5xx: the client retries with exponential
+            # delay (honouring Retry-After), so successful calls never wait
+            "max_retries": 5,
+            # However many posts run at once, the server never sees more
+            # requests than it has parallel slots
+            "max_concurrency": args.concurrency,
+            # The brief is a shared system-prompt prefix and the topic comes last, so
+            # llama.cpp can reuse the prefix KV cache across posts (vLLM/SGLang do
+            # this automatically; drop this for servers that reject unknown fields)
+            "extra_body": {"cache_prompt": True},
+            # 8192-token responses arrive incrementally instead of in one long wait
+            "stream": True,
         },
         blog={
             "min_word_count": 3000,
-            "max_word_count": 6000, # Allow deep dives to be very long
+            "max_word_count": 6000,  # Allow deep dives to be very long
             "include_toc": True,
             "include_citations": True,
         },
@@ -102,104 +567,81 @@ def main() -> None:
                 "author": "Suhaib Bin Younis",
             },
         },
+        prompts={
+            "research_system": f"{DEFAULT_RESEARCH_SYSTEM_PROMPT}\n\n{ENGINEERING_BRIEF}",
+            "planner_system": f"{DEFAULT_PLANNER_SYSTEM_PROMPT}\n\n{ENGINEERING_BRIEF}",
+            "writer_system": f"{DEFAULT_WRITER_SYSTEM_PROMPT}\n\n{ENGINEERING_BRIEF}",
+        },
     )
 
-    # Create generator
-    generator = BlogGenerator(settings=settings)
-
-    print("=" * 70)
-    print("🚀 Pencraft: 2026 Engineering Authority Generator")
-    print("=" * 70)
-    print(f"📝 Generating {len(BLOG_TOPICS)} Deep Dive posts...")
-    print(f"📂 Output directory: {output_dir.absolute()}")
-    print("=" * 70)
-
-    successful = 0
-    failed = 0
-
-    for i, blog_config in enumerate(BLOG_TOPICS, 1):
-        topic = blog_config["topic"]
-        tags = blog_config["tags"]
-        categories = blog_config["categories"]
-        cover_image = blog_config.get("cover_image", "")
-
-        print(f"\n[{i}/{len(BLOG_TOPICS)}] Generating: {topic[:60]}...")
-
-        # Simple progress callback
-        def on_progress(msg: str) -> None:
-            print(f"   ► {msg}")
-
-        try:
-            start_time = time.time()
-
-            # Context: Engineering Authority & Deep Dive
-            additional_context = f"""
-            CRITICAL INSTRUCTIONS FOR 2026 ENGINEERING DEEP DIVE:
-
-            **Goal:** Create the single best resource on the internet for this specific technical topic.
-            **Audience:** Senior Engineers, CTOs, System Architects, Researchers. Target Tier 1 Geographies (US/UK/DE).
-            **Tone:** "Engineering Authority." No fluff. No "In today's fast-paced digital world." Start interacting with complexity immediately.
-
-            **Topic:** {topic}
-            **Depth Level:** Kernel/Protocol/Math level.
-
-            **Mandatory Elements for High CPC & Authority:**
-            1.  **First Principles**: Explain *how* it works internally (e.g., "Don't just say X is fast; explain the memory access pattern").
-            2.  **Comparison Tables**: Include specs, costs, latency numbers, or feature comparisons (e.g., "Latency vs Throughput table").
-            3.  **Code/Config Snippets**: Must include relevant code (Python/C/Rust/Bash) or configuration (YAML/JSON) to demonstrate realism.
-            4.  **Opinionated & Forward Looking**: Is this tech dying? Is it hype? Give a verdict for 2026 strategies.
-            5.  **Monetization Hooks**: Mention "Enterprise Pricing," "Cost Analysis," "Hardware Specs" where relevant (attracts high-value B2B/Tech ads).
-
-            **Structure Guidelines:**
-            -   **Introduction**: define the problem space technically.
-            -   **The Architecture/Internals**: The "meat" of the post.
-            -   **Real World Performance**: Benchmarks, costs, trade-offs.
-            -   **2026 Outlook**: What's changing? (e.g., "Post-Quantum," "AI integration").
-
-            Use "we," "I," and direct address to build connection. Make it feel like a Senior Staff Engineer explaining a concept to a peer.
-            """
-
-            blog = generator.generate(
-                topic=topic,
-                additional_context=additional_context,
-                target_word_count=4000, # Aim high
-                tags=tags,
-                categories=categories,
-                author="Suhaib Bin Younis",
-                draft=False,
-                output_dir=output_dir,
-                skip_research=False,
-                cover_image=cover_image,
-                progress_callback=on_progress,
+    # Create generator (shared by all concurrent posts). Every LLM call of the batch
+    # goes through one keep-alive pool, so only the first request pays for the connect.
+    http = httpx.AsyncClient(
+        timeout=settings.llm.timeout,
+        limits=httpx.Limits(
+            max_connections=max(2 * args.concurrency, 10),
+            max_keepalive_connections=max(2 * args.concurrency, 10),
+        ),
+    )
+    llm = LLMClient(settings.llm, async_http_client=http)
+    generator = BlogGenerator(settings=settings, llm_client=llm)
+
+    async with http, generator:
+        write_lines(
+            [
+                RULE,
+                "🚀 Pencraft: 2026 Engineering Authority Generator",
+                RULE,
+                f"📝 Generating {len(specs)} Deep Dive posts ({args.concurrency} at a time)...",
+                f"📂 Output directory: {output_abs}",
+                RULE,
+            ]
+        )
+
+        # Fail fast when the server is down instead of timing out once per post
+        if not await generator.llm.acheck_connection():
+            sys.exit(f"LLM server unreachable at {generator.llm.base_url}")
+
+        # Open the connection (and load the model) before the concurrent fan-out
+        await generator.llm.awarmup()
+
+        # One live progress bar; log lines are rendered above it instead of interleaving
+        progress = Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            TimeElapsedColumn(),
+        )
+        with progress:
+            summary = await generate_batch(
+                generator, specs, output_dir, progress, concurrency=args.concurrency
             )
 
-            elapsed = time.time() - start_time
-            print(f"   ✅ Complete: {blog.word_count} words in {elapsed:.1f}s")
-            print(f"   📄 Saved: {Path(blog.file_path).name}")
-            successful += 1
-
-        except Exception as e:
-            print(f"   ❌ Failed: {e}")
-            failed += 1
-            # Don't stop the whole train for one failure, but log it clearly
-            import traceback
-            traceback.print_exc()
-            continue
-
-        # Small delay between posts to be nice to APIs if needed
-        # (Though local API is fine, research tools might need a breather)
-        if i < len(BLOG_TOPICS):
-            time.sleep(1)
-
     # Summary
-    print("\n" + "=" * 70)
-    print("📊 Generation Complete!")
-    print("=" * 70)
-    print(f"   ✅ Successful: {successful}")
-    print(f"   ❌ Failed: {failed}")
-    print(f"   📂 Output: {output_dir.absolute()}")
-    print("=" * 70)
+    search_cache = generator.research_agent.search_tool.cache_info()
+    lines = [
+        "",
+        RULE,
+        "📊 Generation Complete!",
+        RULE,
+        f"   ✅ Successful: {summary.successful}",
+        f"   ♻️  Reused from earlier runs: {summary.cached}",
+        f"   ❌ Failed: {summary.failed}",
+        f"   ⏱️  Per post: {summary.timing_report()}",
+    ]
+    if summary.skipped:
+        lines.append(f"   🛑 Skipped after repeated failures: {summary.skipped}")
+    lines.append(f"   🔎 Search cache: {search_cache.hits} hits, {search_cache.misses} misses")
+    if generator.cache is not None:
+        result_cache = generator.cache.cache_info()
+        lines.append(f"   💾 Result cache: {result_cache.hits} hits, {result_cache.misses} misses")
+    lines += [
+        f"   📂 Output: {output_abs}",
+        RULE,
+    ]
+    write_lines(lines)
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main(parse_args()))
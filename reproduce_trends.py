@@ -1,16 +1,40 @@
 
-from pencraft.tools.trends import TrendsTool
+import asyncio
 import logging
 
+from pencraft.tools.trends import TrendsTool
+
 # Configure logging to print warnings
 logging.basicConfig(level=logging.WARNING)
 
-tool = TrendsTool()
-topic = "The 2026 Recession Playbook: How to Profit When the Market Bleeds"
-print(f"Testing trends for: {topic}")
+TOPICS = [
+    "The 2026 Recession Playbook: How to Profit When the Market Bleeds",
+]
+
+# Concurrent lookups; Google Trends rate-limits aggressively beyond a few
+MAX_CONCURRENT = 4
+
+
+async def probe(tool: TrendsTool, semaphore: asyncio.Semaphore, topic: str) -> None:
+    async with semaphore:
+        data = await tool.aget_trends_data(topic)
+    if data.error:
+        print(f"Failed: {topic}: {data.error}")
+    else:
+        print(f"Success: {topic} (interest {data.interest_score})")
+
+
+async def main() -> None:
+    tool = TrendsTool()
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT)
+    print(f"Testing trends for {len(TOPICS)} topic(s)")
+    results = await asyncio.gather(
+        *(probe(tool, semaphore, topic) for topic in TOPICS), return_exceptions=True
+    )
+    for topic, result in zip(TOPICS, results):
+        if isinstance(result, Exception):
+            print(f"Failed: {topic}: {result}")
+
 
-try:
-    tool.get_trends_data(topic)
-    print("Success")
-except Exception as e:
-    print(f"Failed: {e}")
+if __name__ == "__main__":
+    asyncio.run(main())
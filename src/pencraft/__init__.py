@@ -9,7 +9,30 @@ __version__ = "0.1.0"
 __author__ = "Suhaib Bin Younis"
 __license__ = "MIT"
 
-from pencraft.config.settings import Settings, get_settings
-from pencraft.enhancer import BlogEnhancer, EnhancedBlog
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pencraft.config.settings import Settings, get_settings
+    from pencraft.enhancer import BlogEnhancer, EnhancedBlog
 
 __all__ = ["Settings", "get_settings", "BlogEnhancer", "EnhancedBlog", "__version__"]
+
+# Public names and their modules, imported on first access so that importing
+# a light submodule (such as the CLI) doesn't load the agents and LLM client
+_LAZY_IMPORTS = {
+    "Settings": "pencraft.config.settings",
+    "get_settings": "pencraft.config.settings",
+    "BlogEnhancer": "pencraft.enhancer",
+    "EnhancedBlog": "pencraft.enhancer",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names lazily."""
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
@@ -9,6 +9,7 @@ from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from pencraft.cache import DiskCache
     from pencraft.config.settings import Settings
     from pencraft.llm.client import LLMClient
 
@@ -24,6 +25,8 @@ class AgentResult:
     content: str
     metadata: dict[str, Any] = field(default_factory=dict)
     error: str | None = None
+    # Exception behind a failure, so callers can tell transient errors from bugs
+    exception: Exception | None = None
 
     def __bool__(self) -> bool:
         """Return success status."""
@@ -46,6 +49,7 @@ class BaseAgent(ABC):
         settings: Settings | None = None,
         name: str | None = None,
         on_progress: Callable[[str], None] | None = None,
+        cache: DiskCache | None = None,
     ) -> None:
         """Initialize the base agent.
 
@@ -53,11 +57,13 @@ class BaseAgent(ABC):
             llm_client: LLM client instance for API calls.
             settings: Settings object. If None, uses global settings.
             name: Agent name for logging. Defaults to class name.
+            cache: Optional persistent cache for agent results.
         """
         self.llm = llm_client
         self._settings = settings
         self.name = name or self.__class__.__name__
         self.on_progress = on_progress
+        self.cache = cache
 
         self._logger = logging.getLogger(f"pencraft.agents.{self.name}")
 
@@ -98,16 +104,26 @@ class BaseAgent(ABC):
         """
         ...
 
-    def log(self, message: str, level: int = logging.INFO) -> None:
+    def log(self, message: str, *args: object, level: int = logging.INFO) -> None:
         """Log a message with the agent's logger.
 
+        The message is %-formatted with ``args`` only when it will be logged
+        or reported to the progress callback.
+
         Args:
-            message: Message to log.
+            message: Message to log, a %-style format string if args are given.
+            *args: Arguments merged into the message.
             level: Logging level.
         """
-        self._logger.log(level, f"[{self.name}] {message}")
+        report = self.on_progress is not None and level >= logging.INFO
+        if not report and not self._logger.isEnabledFor(level):
+            return
+        if args:
+            message = message % args
+
+        self._logger.log(level, "[%s] %s", self.name, message)
 
-        if self.on_progress and level >= logging.INFO:
+        if report and self.on_progress is not None:
             self.on_progress(message)
 
     def _handle_error(self, error: Exception, context: str = "") -> AgentResult:
@@ -127,8 +143,57 @@ class BaseAgent(ABC):
             success=False,
             content="",
             error=error_msg,
+            exception=error,
+        )
+
+    def _cache_key(self, **parts: Any) -> str | None:
+        """Build a cache key for a result, or None when caching is disabled.
+
+        Args:
+            **parts: Inputs that determine the result.
+
+        Returns:
+            Cache key, or None without a cache.
+        """
+        if self.cache is None:
+            return None
+        return self.cache.make_key(agent=self.name, model=self.llm.model, **parts)
+
+    def _cached_result(self, key: str | None) -> AgentResult | None:
+        """Look up a previously stored successful result.
+
+        Args:
+            key: Cache key from _cache_key().
+
+        Returns:
+            The cached AgentResult, or None on a miss.
+        """
+        if self.cache is None or key is None:
+            return None
+        payload = self.cache.get(key)
+        if payload is None:
+            return None
+        self.log("Using cached result")
+        return AgentResult(
+            success=True,
+            content=payload.get("content", ""),
+            metadata=payload.get("metadata", {}),
         )
 
+    def _store_result(self, key: str | None, result: AgentResult) -> None:
+        """Store a successful result in the cache.
+
+        Args:
+            key: Cache key from _cache_key().
+            result: Result to store.
+        """
+        if self.cache is None or key is None or not result.success:
+            return
+        try:
+            self.cache.put(key, {"content": result.content, "metadata": result.metadata})
+        except OSError as e:
+            self._logger.warning(f"[{self.name}] Failed to write cache entry: {e}")
+
     def _generate(
         self,
         prompt: str,
@@ -145,8 +210,15 @@ class BaseAgent(ABC):
         Returns:
             Generated content string.
         """
-        self.log(f"Generating content (prompt length: {len(prompt)} chars)")
-        return self.llm.generate(prompt, system_prompt=system_prompt, **kwargs)
+        key = self._completion_key(prompt, system_prompt, kwargs)
+        cached = self._cached_completion(key)
+        if cached is not None:
+            return cached
+
+        self.log("Generating content (prompt length: %d chars)", len(prompt))
+        content = self.llm.generate(prompt, system_prompt=system_prompt, **kwargs)
+        self._store_completion(key, content)
+        return content
 
     async def _agenerate(
         self,
@@ -164,5 +236,67 @@ class BaseAgent(ABC):
         Returns:
             Generated content string.
         """
-        self.log(f"Generating content async (prompt length: {len(prompt)} chars)")
-        return await self.llm.agenerate(prompt, system_prompt=system_prompt, **kwargs)
+        key = self._completion_key(prompt, system_prompt, kwargs)
+        cached = self._cached_completion(key)
+        if cached is not None:
+            return cached
+
+        self.log("Generating content async (prompt length: %d chars)", len(prompt))
+        content = await self.llm.agenerate(prompt, system_prompt=system_prompt, **kwargs)
+        self._store_completion(key, content)
+        return content
+
+    def _completion_key(
+        self, prompt: str, system_prompt: str | None, kwargs: dict[str, Any]
+    ) -> str | None:
+        """Build a cache key for a single completion.
+
+        Args:
+            prompt: User prompt.
+            system_prompt: System prompt.
+            kwargs: Additional arguments for the LLM.
+
+        Returns:
+            Cache key, or None unless completions are cached.
+        """
+        if self.cache is None or not self.settings.cache.llm_responses:
+            return None
+        return self.cache.make_key(
+            kind="completion",
+            model=self.llm.model,
+            temperature=kwargs.get("temperature", self.llm.temperature),
+            system_prompt=system_prompt,
+            prompt=prompt,
+            options=kwargs,
+        )
+
+    def _cached_completion(self, key: str | None) -> str | None:
+        """Look up a stored completion.
+
+        Args:
+            key: Cache key from _completion_key().
+
+        Returns:
+            The cached text, or None on a miss.
+        """
+        if self.cache is None or key is None:
+            return None
+        payload = self.cache.get(key)
+        if payload is None:
+            return None
+        self._logger.debug(f"[{self.name}] Using cached completion")
+        return str(payload.get("content", ""))
+
+    def _store_completion(self, key: str | None, content: str) -> None:
+        """Store a non-empty completion in the cache.
+
+        Args:
+            key: Cache key from _completion_key().
+            content: Generated text.
+        """
+        if self.cache is None or key is None or not content:
+            return
+        try:
+            self.cache.put(key, {"content": content})
+        except OSError as e:
+            self._logger.warning(f"[{self.name}] Failed to write cache entry: {e}")
@@ -2,21 +2,219 @@
 
 from __future__ import annotations
 
-import json
+import io
 import logging
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable, Iterable
+from contextlib import aclosing, closing
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 from pencraft.agents.base import AgentResult, BaseAgent
-from pencraft.llm.prompts import OUTLINE_PROMPT
+from pencraft.llm.prompts import (
+    OUTLINE_INPUT,
+    OUTLINE_INSTRUCTIONS,
+    OUTLINE_JSON_INSTRUCTIONS,
+    OUTLINE_STRUCTURE_INSTRUCTIONS,
+)
+from pencraft.utils import serialization
 
 if TYPE_CHECKING:
+    from pencraft.cache import DiskCache
     from pencraft.config.settings import Settings
     from pencraft.llm.client import LLMClient
 
 logger = logging.getLogger(__name__)
 
+# (title, key points) of the generic outline used when an outline can't be parsed
+_FALLBACK_SECTIONS = (
+    ("Introduction", ("Set the context",)),
+    ("Main Content", ("Core information",)),
+    ("Conclusion", ("Summarize key points",)),
+)
+
+# Instructions for JSON-schema backends, joined once
+_JSON_OUTLINE_INSTRUCTIONS = OUTLINE_INSTRUCTIONS + OUTLINE_JSON_INSTRUCTIONS
+
+
+@lru_cache(maxsize=128)
+def _outline_prompt(instructions: str, topic: str, research_summary: str, word_count: int) -> str:
+    """Format an outline prompt, reusing it when the same inputs are planned again.
+
+    Args:
+        instructions: Shared instructions placed before the per-topic input.
+        topic: Blog topic.
+        research_summary: Summary from research agent.
+        word_count: Target word count.
+
+    Returns:
+        The full outline prompt.
+    """
+    return instructions + OUTLINE_INPUT.format(
+        topic=topic,
+        research_summary=research_summary,
+        word_count=word_count,
+    )
+
+
+def _dedupe(*groups: Iterable[str]) -> list[str]:
+    """Merge labels in order, dropping blanks and case-insensitive duplicates.
+
+    The first spelling of each label is kept, so the result is stable for
+    the same inputs (unlike a set).
+
+    Args:
+        *groups: Label lists, in order of precedence.
+
+    Returns:
+        Unique, stripped labels.
+    """
+    seen: dict[str, str] = {}
+    for group in groups:
+        for label in group:
+            label = label.strip()
+            if label:
+                seen.setdefault(label.casefold(), label)
+    return list(seen.values())
+
+
+class _JsonObjectScanner:
+    """Find the end of the first top-level JSON object in streamed text."""
+
+    def __init__(self) -> None:
+        """Initialize an empty scanner."""
+        self._parts: list[str] = []
+        self._start = -1
+        self._depth = 0
+        self._offset = 0
+        self._in_string = False
+        self._escaped = False
+        self._object: str | None = None
+
+    def feed(self, delta: str) -> bool:
+        """Add a chunk of text.
+
+        Args:
+            delta: Next chunk of the stream.
+
+        Returns:
+            True once the first object is complete (stop reading).
+        """
+        self._parts.append(delta)
+        for index, char in enumerate(delta, self._offset):
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == "{":
+                if self._depth == 0:
+                    self._start = index
+                self._depth += 1
+            elif self._depth and char == "}":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._object = "".join(self._parts)[self._start : index + 1]
+                    return True
+            elif self._depth and char == '"':
+                self._in_string = True
+        self._offset += len(delta)
+        return False
+
+    def result(self) -> str:
+        """Get the JSON object text, or all text received if no object completed."""
+        return self._object if self._object is not None else "".join(self._parts)
+
+
+def _first_json_object(deltas: Iterable[str]) -> str:
+    """Read streamed text until the first top-level JSON object is complete.
+
+    Stops consuming the stream as soon as the object's closing brace
+    arrives, so trailing commentary is never generated.
+
+    Args:
+        deltas: Streamed text chunks.
+
+    Returns:
+        The JSON object text, or all text received if no object completed.
+    """
+    scanner = _JsonObjectScanner()
+    for delta in deltas:
+        if scanner.feed(delta):
+            break
+    return scanner.result()
+
+
+async def _afirst_json_object(deltas: AsyncIterator[str]) -> str:
+    """Read streamed text asynchronously until the first JSON object is complete.
+
+    Args:
+        deltas: Streamed text chunks.
+
+    Returns:
+        The JSON object text, or all text received if no object completed.
+    """
+    scanner = _JsonObjectScanner()
+    async for delta in deltas:
+        if scanner.feed(delta):
+            break
+    return scanner.result()
+
+
+_STRING_ARRAY = {"type": "array", "items": {"type": "string"}}
+
+_SUBSECTION_SCHEMA = {
+    "type": "object",
+    "properties": {"title": {"type": "string"}, "key_points": _STRING_ARRAY},
+    "required": ["title", "key_points"],
+    "additionalProperties": False,
+}
+
+_SECTION_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "title": {"type": "string"},
+        "key_points": _STRING_ARRAY,
+        "subsections": {"type": "array", "items": _SUBSECTION_SCHEMA},
+    },
+    "required": ["title", "key_points", "subsections"],
+    "additionalProperties": False,
+}
+
+# response_format for backends with settings.llm.supports_json_schema (strict
+# mode: every field required, no extra fields)
+_OUTLINE_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "blog_outline",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "title": {"type": "string"},
+                "meta_description": {"type": "string"},
+                "layout_type": {"type": "string"},
+                "tags": _STRING_ARRAY,
+                "categories": _STRING_ARRAY,
+                "seo_keywords": _STRING_ARRAY,
+                "sections": {"type": "array", "items": _SECTION_SCHEMA},
+            },
+            "required": [
+                "title",
+                "meta_description",
+                "layout_type",
+                "tags",
+                "categories",
+                "seo_keywords",
+                "sections",
+            ],
+            "additionalProperties": False,
+        },
+    },
+}
+
 
 @dataclass
 class Section:
@@ -53,10 +251,28 @@ class BlogOutline:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
+        return self._dict([s.to_dict() for s in self.sections])
+
+    def to_markdown(self) -> str:
+        """Convert outline to markdown format."""
+        return self._render(None)
+
+    def serialize(self) -> tuple[dict[str, Any], str]:
+        """Convert to both a dictionary and markdown in one walk over the sections.
+
+        Returns:
+            Tuple of (to_dict() result, to_markdown() result).
+        """
+        sections: list[dict[str, Any]] = []
+        markdown = self._render(sections)
+        return self._dict(sections), markdown
+
+    def _dict(self, sections: list[dict[str, Any]]) -> dict[str, Any]:
+        """Build the dictionary form around already converted sections."""
         return {
             "title": self.title,
             "meta_description": self.meta_description,
-            "sections": [s.to_dict() for s in self.sections],
+            "sections": sections,
             "tags": self.tags,
             "categories": self.categories,
             "target_word_count": self.target_word_count,
@@ -64,33 +280,39 @@ class BlogOutline:
             "layout_type": self.layout_type,
         }
 
-    def to_markdown(self) -> str:
-        """Convert outline to markdown format."""
-        lines = [
-            f"# {self.title}",
-            "",
-            f"**Meta Description:** {self.meta_description}",
-            "",
-            f"**Layout:** {self.layout_type}",
-            f"**Tags:** {', '.join(self.tags)}",
-            f"**Categories:** {', '.join(self.categories)}",
-            f"**Target Word Count:** {self.target_word_count}",
-            "",
-            "## Outline",
-            "",
-        ]
+    def _render(self, section_dicts: list[dict[str, Any]] | None) -> str:
+        """Render markdown, optionally collecting each section's dictionary on the way.
+
+        Args:
+            section_dicts: List to append section dictionaries to, or None.
+
+        Returns:
+            Outline as markdown.
+        """
+        buf = io.StringIO()
+        write = buf.write
+        write(
+            f"# {self.title}\n\n"
+            f"**Meta Description:** {self.meta_description}\n\n"
+            f"**Layout:** {self.layout_type}\n"
+            f"**Tags:** {', '.join(self.tags)}\n"
+            f"**Categories:** {', '.join(self.categories)}\n"
+            f"**Target Word Count:** {self.target_word_count}\n\n"
+            "## Outline\n"
+        )
 
         for i, section in enumerate(self.sections, 1):
-            lines.append(f"### {i}. {section.title}")
+            write(f"\n### {i}. {section.title}\n")
             for point in section.key_points:
-                lines.append(f"- {point}")
+                write(f"- {point}\n")
             for j, subsection in enumerate(section.subsections, 1):
-                lines.append(f"#### {i}.{j}. {subsection.title}")
+                write(f"#### {i}.{j}. {subsection.title}\n")
                 for point in subsection.key_points:
-                    lines.append(f"  - {point}")
-            lines.append("")
+                    write(f"  - {point}\n")
+            if section_dicts is not None:
+                section_dicts.append(section.to_dict())
 
-        return "\n".join(lines)
+        return buf.getvalue()
 
 
 class PlannerAgent(BaseAgent):
@@ -105,6 +327,7 @@ class PlannerAgent(BaseAgent):
         llm_client: LLMClient,
         settings: Settings | None = None,
         on_progress: Callable[[str], None] | None = None,
+        cache: DiskCache | None = None,
     ) -> None:
         """Initialize the planner agent.
 
@@ -112,8 +335,11 @@ class PlannerAgent(BaseAgent):
             llm_client: LLM client for AI operations.
             settings: Settings object.
             on_progress: Callback for progress updates.
+            cache: Persistent cache for outlines.
         """
-        super().__init__(llm_client, settings, name="PlannerAgent", on_progress=on_progress)
+        super().__init__(
+            llm_client, settings, name="PlannerAgent", on_progress=on_progress, cache=cache
+        )
 
     def execute(
         self,
@@ -137,38 +363,38 @@ class PlannerAgent(BaseAgent):
             AgentResult with BlogOutline in metadata.
         """
         try:
-            self.log(f"Creating outline for: {topic}")
+            self.log("Creating outline for: %s", topic)
 
             word_count = target_word_count or self.settings.blog.min_word_count
 
-            # Generate outline using LLM
-            prompt = OUTLINE_PROMPT.format(
+            cache_key = self._cache_key(
                 topic=topic,
                 research_summary=research_summary,
                 word_count=word_count,
+                tags=suggested_tags,
+                categories=suggested_categories,
             )
+            cached = self._cached_result(cache_key)
+            if cached is not None:
+                return cached
 
+            # Generate outline using LLM
+            prompt, options = self._outline_request(topic, research_summary, word_count)
             raw_outline = self._generate(
                 prompt,
                 system_prompt=self.settings.prompts.planner_system,
+                **options,
             )
 
             # Parse the outline
             outline = self._parse_outline(
-                raw_outline=raw_outline,
+                raw_outline,
                 topic=topic,
                 target_word_count=word_count,
                 suggested_tags=suggested_tags or [],
                 suggested_categories=suggested_categories or [],
             )
-
-            self.log(f"Created outline with {len(outline.sections)} sections")
-
-            return AgentResult(
-                success=True,
-                content=outline.to_markdown(),
-                metadata={"outline": outline.to_dict(), "raw_outline": raw_outline},
-            )
+            return self._outline_result(outline, cache_key)
 
         except Exception as e:
             return self._handle_error(e, "Outline creation failed")
@@ -195,38 +421,85 @@ class PlannerAgent(BaseAgent):
             AgentResult with BlogOutline in metadata.
         """
         try:
-            self.log(f"Creating outline async for: {topic}")
+            self.log("Creating outline async for: %s", topic)
 
             word_count = target_word_count or self.settings.blog.min_word_count
 
-            prompt = OUTLINE_PROMPT.format(
+            cache_key = self._cache_key(
                 topic=topic,
                 research_summary=research_summary,
                 word_count=word_count,
+                tags=suggested_tags,
+                categories=suggested_categories,
             )
+            cached = self._cached_result(cache_key)
+            if cached is not None:
+                return cached
 
+            prompt, options = self._outline_request(topic, research_summary, word_count)
             raw_outline = await self._agenerate(
                 prompt,
                 system_prompt=self.settings.prompts.planner_system,
+                **options,
             )
 
-            outline = self._parse_outline(
-                raw_outline=raw_outline,
+            outline = await self._aparse_outline(
+                raw_outline,
                 topic=topic,
                 target_word_count=word_count,
                 suggested_tags=suggested_tags or [],
                 suggested_categories=suggested_categories or [],
             )
-
-            return AgentResult(
-                success=True,
-                content=outline.to_markdown(),
-                metadata={"outline": outline.to_dict(), "raw_outline": raw_outline},
-            )
+            return self._outline_result(outline, cache_key)
 
         except Exception as e:
             return self._handle_error(e, "Async outline creation failed")
 
+    def _outline_request(
+        self, topic: str, research_summary: str, word_count: int
+    ) -> tuple[str, dict[str, Any]]:
+        """Get the outline prompt and request options for the configured backend.
+
+        Backends that enforce a JSON schema return the structured outline
+        directly; others get the plain prompt and are parsed afterwards.
+        Either way the per-topic input comes last, after the shared
+        instructions.
+
+        Args:
+            topic: Blog topic.
+            research_summary: Summary from research agent.
+            word_count: Target word count.
+
+        Returns:
+            Tuple of (prompt, extra LLM arguments).
+        """
+        if not self.settings.llm.supports_json_schema:
+            return _outline_prompt(OUTLINE_INSTRUCTIONS, topic, research_summary, word_count), {}
+        options = {"response_format": _OUTLINE_RESPONSE_FORMAT}
+        prompt = _outline_prompt(_JSON_OUTLINE_INSTRUCTIONS, topic, research_summary, word_count)
+        return prompt, options
+
+    def _outline_result(self, outline: BlogOutline, cache_key: str | None) -> AgentResult:
+        """Wrap a finished outline in a result and cache it.
+
+        Args:
+            outline: Parsed outline.
+            cache_key: Cache key from _cache_key().
+
+        Returns:
+            AgentResult with the outline as markdown and in metadata.
+        """
+        self.log("Created outline with %d sections", len(outline.sections))
+
+        outline_dict, markdown = outline.serialize()
+        result = AgentResult(
+            success=True,
+            content=markdown,
+            metadata={"outline": outline_dict, "raw_outline": outline.raw_outline},
+        )
+        self._store_result(cache_key, result)
+        return result
+
     def _parse_outline(
         self,
         raw_outline: str,
@@ -247,83 +520,89 @@ class PlannerAgent(BaseAgent):
         Returns:
             Structured BlogOutline object.
         """
-        # Try to extract structured data with another LLM call
-        structure_prompt = f"""Extract the following from this blog outline and return as JSON:
-
-Outline:
-{raw_outline}
-
-Return a JSON object with these fields:
-- title: The blog post title
-- meta_description: The meta description (150-160 chars)
-- layout_type: The optimal layout (deep-dive, narrative, analytical, how-to, opinion, listicle)
-- tags: Array of relevant tags
-- categories: Array of categories
-- seo_keywords: Array of SEO keywords
-- sections: Array of section objects, each with:
-  - title: Section title
-  - key_points: Array of key points to cover
-  - subsections: Array of subsection objects (same structure)
-
-Return only valid JSON, no other text."""
-
+        data: dict[str, Any] | None
         try:
-            json_response = self._generate(structure_prompt, temperature=0.3)
-
-            # Clean up response - extract JSON if wrapped in markdown
-            json_str = json_response.strip()
-            if json_str.startswith("```"):
-                # Remove markdown code block
-                lines = json_str.split("\n")
-                json_str = "\n".join(lines[1:-1] if lines[-1] == "```" else lines[1:])
-
-            data = json.loads(json_str)
-
-            sections = []
-            for section_data in data.get("sections", []):
-                subsections = []
-                for sub_data in section_data.get("subsections", []):
-                    subsections.append(
-                        Section(
-                            title=sub_data.get("title", ""),
-                            key_points=sub_data.get("key_points", []),
-                        )
-                    )
-                sections.append(
-                    Section(
-                        title=section_data.get("title", ""),
-                        key_points=section_data.get("key_points", []),
-                        subsections=subsections,
-                    )
-                )
+            data = self._outline_data(raw_outline)
+        except (serialization.JSONDecodeError, KeyError) as e:
+            self.log("Failed to parse structured outline: %s", e, level=logging.WARNING)
+            data = None
+
+        return self._build_outline(
+            data,
+            raw_outline=raw_outline,
+            topic=topic,
+            target_word_count=target_word_count,
+            suggested_tags=suggested_tags,
+            suggested_categories=suggested_categories,
+        )
+
+    async def _aparse_outline(
+        self,
+        raw_outline: str,
+        topic: str,
+        target_word_count: int,
+        suggested_tags: list[str],
+        suggested_categories: list[str],
+    ) -> BlogOutline:
+        """Parse LLM output into structured outline asynchronously.
 
-            # Merge suggested with extracted tags/categories
-            tags = list(set(data.get("tags", []) + suggested_tags))
-            categories = list(set(data.get("categories", []) + suggested_categories))
+        Args:
+            raw_outline: Raw outline text from LLM.
+            topic: Original topic.
+            target_word_count: Target word count.
+            suggested_tags: Suggested tags.
+            suggested_categories: Suggested categories.
 
-            return BlogOutline(
-                title=data.get("title", topic),
-                meta_description=data.get("meta_description", ""),
-                sections=sections,
-                tags=tags,
-                categories=categories,
-                target_word_count=target_word_count,
-                seo_keywords=data.get("seo_keywords", []),
-                layout_type=data.get("layout_type", "deep-dive"),
-                raw_outline=raw_outline,
-            )
+        Returns:
+            Structured BlogOutline object.
+        """
+        data: dict[str, Any] | None
+        try:
+            data = await self._aoutline_data(raw_outline)
+        except (serialization.JSONDecodeError, KeyError) as e:
+            self.log("Failed to parse structured outline: %s", e, level=logging.WARNING)
+            data = None
+
+        return self._build_outline(
+            data,
+            raw_outline=raw_outline,
+            topic=topic,
+            target_word_count=target_word_count,
+            suggested_tags=suggested_tags,
+            suggested_categories=suggested_categories,
+        )
+
+    def _build_outline(
+        self,
+        data: dict[str, Any] | None,
+        *,
+        raw_outline: str,
+        topic: str,
+        target_word_count: int,
+        suggested_tags: list[str],
+        suggested_categories: list[str],
+    ) -> BlogOutline:
+        """Build an outline from its structured fields.
 
-        except (json.JSONDecodeError, KeyError) as e:
-            self.log(f"Failed to parse structured outline: {e}", logging.WARNING)
+        Args:
+            data: Outline fields, or None to build the generic fallback outline.
+            raw_outline: Raw outline text from LLM.
+            topic: Original topic.
+            target_word_count: Target word count.
+            suggested_tags: Suggested tags.
+            suggested_categories: Suggested categories.
 
+        Returns:
+            Structured BlogOutline object.
+        """
+        if data is None:
             # Fallback: create basic outline from raw text
             return BlogOutline(
                 title=topic,
                 meta_description=f"A comprehensive guide to {topic}.",
                 sections=[
-                    Section(title="Introduction", key_points=["Set the context"]),
-                    Section(title="Main Content", key_points=["Core information"]),
-                    Section(title="Conclusion", key_points=["Summarize key points"]),
+                    Section(title=title, key_points=list(points))
+                    for title, points in _FALLBACK_SECTIONS
                 ],
                 tags=suggested_tags or [topic.lower().replace(" ", "-")],
                 categories=suggested_categories or ["general"],
@@ -332,6 +611,149 @@ Return only valid JSON, no other text."""
                 raw_outline=raw_outline,
             )
 
+        sections = []
+        for section_data in data.get("sections", []):
+            subsections = []
+            for sub_data in section_data.get("subsections", []):
+                subsections.append(
+                    Section(
+                        title=sub_data.get("title", ""),
+                        key_points=sub_data.get("key_points", []),
+                    )
+                )
+            sections.append(
+                Section(
+                    title=section_data.get("title", ""),
+                    key_points=section_data.get("key_points", []),
+                    subsections=subsections,
+                )
+            )
+
+        # Merge suggested with extracted tags/categories (suggested first)
+        tags = _dedupe(suggested_tags, data.get("tags", []))
+        categories = _dedupe(suggested_categories, data.get("categories", []))
+
+        return BlogOutline(
+            title=data.get("title", topic),
+            meta_description=data.get("meta_description", ""),
+            sections=sections,
+            tags=tags,
+            categories=categories,
+            target_word_count=target_word_count,
+            seo_keywords=data.get("seo_keywords", []),
+            layout_type=data.get("layout_type", "deep-dive"),
+            raw_outline=raw_outline,
+        )
+
+    def _outline_data(self, raw_outline: str) -> dict[str, Any]:
+        """Get the structured fields of an outline.
+
+        Outlines generated under a JSON schema are decoded directly; anything
+        else is extracted with another LLM call.
+
+        Args:
+            raw_outline: Raw outline text from LLM.
+
+        Returns:
+            Outline fields as a dictionary.
+
+        Raises:
+            JSONDecodeError: If the extracted outline is not valid JSON.
+        """
+        data = self._structured_data(raw_outline)
+        if data is not None:
+            return data
+
+        prompt, options, key = self._structure_request(raw_outline)
+        json_response = self._cached_completion(key)
+        if json_response is None:
+            self.log("Extracting outline structure")
+            with closing(self.llm.generate_stream(prompt, **options)) as deltas:
+                json_response = _first_json_object(deltas)
+            self._store_completion(key, json_response)
+        return self._decode_extracted(json_response)
+
+    async def _aoutline_data(self, raw_outline: str) -> dict[str, Any]:
+        """Get the structured fields of an outline asynchronously.
+
+        Args:
+            raw_outline: Raw outline text from LLM.
+
+        Returns:
+            Outline fields as a dictionary.
+
+        Raises:
+            JSONDecodeError: If the extracted outline is not valid JSON.
+        """
+        data = self._structured_data(raw_outline)
+        if data is not None:
+            return data
+
+        prompt, options, key = self._structure_request(raw_outline)
+        json_response = self._cached_completion(key)
+        if json_response is None:
+            self.log("Extracting outline structure")
+            async with aclosing(self.llm.agenerate_stream(prompt, **options)) as deltas:
+                json_response = await _afirst_json_object(deltas)
+            self._store_completion(key, json_response)
+        return self._decode_extracted(json_response)
+
+    def _structured_data(self, raw_outline: str) -> dict[str, Any] | None:
+        """Decode an outline generated under a JSON schema.
+
+        Args:
+            raw_outline: Raw outline text from LLM.
+
+        Returns:
+            Outline fields, or None when the outline is not structured.
+        """
+        if not self.settings.llm.supports_json_schema:
+            return None
+        try:
+            data = serialization.loads(raw_outline)
+        except serialization.JSONDecodeError:
+            self.log("Outline is not JSON, extracting its structure", level=logging.DEBUG)
+            return None
+        return data if isinstance(data, dict) else None
+
+    def _structure_request(self, raw_outline: str) -> tuple[str, dict[str, Any], str | None]:
+        """Get the prompt, options and cache key of the structure-extraction call.
+
+        The call is streamed so it can be cut off as soon as the JSON object
+        is complete.
+
+        Args:
+            raw_outline: Raw outline text from LLM.
+
+        Returns:
+            Tuple of (prompt, extra LLM arguments, completion cache key).
+        """
+        prompt = OUTLINE_STRUCTURE_INSTRUCTIONS + raw_outline
+        options: dict[str, Any] = {"temperature": 0.3}
+        if self.settings.llm.reformatter_model:
+            # A mechanical reformat: a smaller, cheaper model does it just as well
+            options["model"] = self.settings.llm.reformatter_model
+        return prompt, options, self._completion_key(prompt, None, options)
+
+    @staticmethod
+    def _decode_extracted(json_response: str) -> dict[str, Any]:
+        """Decode the reply of the structure-extraction call.
+
+        Args:
+            json_response: Extracted JSON, possibly in a markdown code block.
+
+        Returns:
+            Outline fields as a dictionary.
+
+        Raises:
+            JSONDecodeError: If the reply is not valid JSON.
+        """
+        # Clean up response - extract JSON if wrapped in a markdown code block
+        extracted: dict[str, Any] = serialization.loads(
+            serialization.strip_code_fence(json_response)
+        )
+        return extracted
+
     def refine_outline(
         self,
         outline: BlogOutline,
@@ -370,10 +792,11 @@ Provide an improved outline that addresses the feedback while maintaining the or
                 suggested_categories=outline.categories,
             )
 
+            outline_dict, markdown = refined.serialize()
             return AgentResult(
                 success=True,
-                content=refined.to_markdown(),
-                metadata={"outline": refined.to_dict()},
+                content=markdown,
+                metadata={"outline": outline_dict},
             )
 
         except Exception as e:
@@ -2,25 +2,36 @@
 
 from __future__ import annotations
 
+import asyncio
+import itertools
 import logging
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 from pencraft.agents.base import AgentResult, BaseAgent
-from pencraft.llm.prompts import RESEARCH_PROMPT
+from pencraft.llm.prompts import (
+    RESEARCH_INPUT,
+    RESEARCH_INSTRUCTIONS,
+    RETRIEVAL_NECESSITY_PROMPT,
+)
 from pencraft.tools.scraper import ScrapedContent, WebScraper
-from pencraft.tools.search import SearchResult, SearchTool
+from pencraft.tools.search import SearchError, SearchResult, SearchTool
 from pencraft.tools.trends import TrendsData, TrendsTool
+from pencraft.utils.ratelimit import TokenBucket
+from pencraft.utils.singleflight import SingleFlight
+from pencraft.utils.text import count_tokens, truncate_tokens
 
 if TYPE_CHECKING:
+    from pencraft.cache import DiskCache
     from pencraft.config.settings import Settings
     from pencraft.llm.client import LLMClient
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ResearchData:
     """Collected research data for a topic."""
 
@@ -60,6 +71,9 @@ class ResearchAgent(BaseAgent):
         scraper: WebScraper | None = None,
         trends_tool: TrendsTool | None = None,
         on_progress: Callable[[str], None] | None = None,
+        single_flight: SingleFlight | None = None,
+        cache: DiskCache | None = None,
+        rate_limiter: TokenBucket | None = None,
     ) -> None:
         """Initialize the research agent.
 
@@ -70,14 +84,27 @@ class ResearchAgent(BaseAgent):
             scraper: Custom web scraper (uses default if None).
             trends_tool: Custom trends tool (uses default if None).
             on_progress: Callback for progress updates.
+            single_flight: Coalescer shared across concurrent research runs so
+                identical searches and LLM calls are only issued once.
+            cache: Persistent cache for research results.
+            rate_limiter: Pacing for searches and scrapes, shared across agents
+                (built from ``research.requests_per_second`` if None).
         """
-        super().__init__(llm_client, settings, name="ResearchAgent", on_progress=on_progress)
+        super().__init__(
+            llm_client, settings, name="ResearchAgent", on_progress=on_progress, cache=cache
+        )
 
         self.search_tool = search_tool or SearchTool(
             max_results=self.settings.research.max_search_results
         )
         self.scraper = scraper or WebScraper()
         self.trends_tool = trends_tool or TrendsTool()
+        self.single_flight = single_flight or SingleFlight()
+
+        # Client-side pacing of searches and scrapes, adapted on rate limits
+        self.rate_limiter = rate_limiter
+        if rate_limiter is None and self.settings.research.requests_per_second:
+            self.rate_limiter = TokenBucket(self.settings.research.requests_per_second)
 
     def execute(
         self,
@@ -101,7 +128,14 @@ class ResearchAgent(BaseAgent):
             AgentResult with ResearchData in metadata.
         """
         try:
-            self.log(f"Starting research on: {topic}")
+            self.log("Starting research on: %s", topic)
+
+            cache_key = self._research_cache_key(
+                topic, additional_context, search_queries, scrape_top_n, use_trends
+            )
+            cached = self._cached_result(cache_key)
+            if cached is not None:
+                return cached
 
             # Fetch Google Trends data first
             trends_data: TrendsData | None = None
@@ -111,15 +145,15 @@ class ResearchAgent(BaseAgent):
                 try:
                     trends_data = self.trends_tool.get_trends_data(topic)
                     if trends_data.interest_score > 0:
-                        self.log(f"   Interest score: {trends_data.interest_score}/100")
+                        self.log("   Interest score: %s/100", trends_data.interest_score)
                     if trends_data.is_trending:
                         self.log("   📈 Topic is currently trending!")
                     # Use rising queries to enhance search
                     trends_queries = trends_data.rising_queries[:3]
                     if trends_queries:
-                        self.log(f"   Found {len(trends_data.rising_queries)} rising queries")
+                        self.log("   Found %d rising queries", len(trends_data.rising_queries))
                 except Exception as e:
-                    self.log(f"   ⚠️ Trends lookup failed: {e}")
+                    self.log("   ⚠️ Trends lookup failed: %s", e)
 
             # Generate search queries if not provided
             if not search_queries:
@@ -128,44 +162,45 @@ class ResearchAgent(BaseAgent):
                 if trends_queries:
                     search_queries = search_queries[:3] + trends_queries
 
-            # Perform searches
-            all_results: list[SearchResult] = []
-            for query in search_queries:
-                self.log(f"🔍 Searching: {query}")
-                results = self.search_tool.search(query)
-                all_results.extend(results)
-                self.log(f"   Found {len(results)} results")
+            # Perform searches (in parallel; they are network-bound)
+            self.log("🔍 Searching: %s", ", ".join(search_queries))
+            with self._pool(len(search_queries)) as pool:
+                results_lists = list(pool.map(self._search, search_queries))
+            for query, results in zip(search_queries, results_lists, strict=True):
+                self.log("   Found %d results for: %s", len(results), query)
+            all_results = list(itertools.chain.from_iterable(results_lists))
 
             # Deduplicate by URL
-            seen_urls: set[str] = set()
-            unique_results: list[SearchResult] = []
-            for result in all_results:
-                if result.url not in seen_urls:
-                    seen_urls.add(result.url)
-                    unique_results.append(result)
+            unique_results = self._dedupe_by_url(all_results)
 
-            self.log(f"Total unique results: {len(unique_results)}")
+            self.log("Total unique results: %d", len(unique_results))
 
-            # Scrape top results for full content
             scraped_content: list[ScrapedContent] = []
-            for result in unique_results[:scrape_top_n]:
-                self.log(f"🌐 Scraping: {result.url}")
-                content = self.scraper.scrape(result.url)
-                if content.success:
-                    scraped_content.append(content)
-                    self.log(f"   ✓ {content.word_count} words extracted")
-                else:
-                    self.log("   ✗ Failed to scrape")
-
-            # Synthesize research using LLM
-            self.log("✍️ Synthesizing research summary...")
-            research_summary = self._synthesize_research(
-                topic=topic,
-                search_results=unique_results,
-                scraped_content=scraped_content,
-                additional_context=additional_context,
-                trends_data=trends_data,
-            )
+            if self._needs_retrieval(topic):
+                # Scrape top results for full content
+                urls = [result.url for result in unique_results[:scrape_top_n]]
+                with self._pool(len(urls)) as pool:
+                    scraped = list(pool.map(self._scrape, urls))
+                for content in scraped:
+                    self.log("🌐 Scraped: %s", content.url)
+                    if content.success:
+                        scraped_content.append(content)
+                        self.log("   ✓ %d words extracted", content.word_count)
+                    else:
+                        self.log("   ✗ Failed to scrape")
+
+                # Synthesize research using LLM
+                self.log("✍️ Synthesizing research summary...")
+                research_summary = self._synthesize_research(
+                    topic=topic,
+                    search_results=unique_results,
+                    scraped_content=scraped_content,
+                    additional_context=additional_context,
+                    trends_data=trends_data,
+                )
+            else:
+                self.log("Topic is well known to the model; skipping scraping and synthesis")
+                research_summary = self._search_notes(topic, unique_results, additional_context)
 
             # Extract sources for citations
             sources = self._extract_sources(unique_results, scraped_content)
@@ -182,11 +217,13 @@ class ResearchAgent(BaseAgent):
 
             self.log("Research completed successfully")
 
-            return AgentResult(
+            research_result = AgentResult(
                 success=True,
                 content=research_summary,
                 metadata={"research_data": research_data.to_dict()},
             )
+            self._store_result(cache_key, research_result)
+            return research_result
 
         except Exception as e:
             return self._handle_error(e, "Research execution failed")
@@ -211,40 +248,62 @@ class ResearchAgent(BaseAgent):
             AgentResult with ResearchData in metadata.
         """
         try:
-            self.log(f"Starting async research on: {topic}")
+            self.log("Starting async research on: %s", topic)
+
+            cache_key = self._research_cache_key(
+                topic, additional_context, search_queries, scrape_top_n, use_trends=False
+            )
+            cached = self._cached_result(cache_key)
+            if cached is not None:
+                return cached
 
             # Generate search queries if not provided
             if not search_queries:
                 search_queries = await self._agenerate_search_queries(topic)
 
-            # Perform searches (sync for now, DuckDuckGo doesn't have async)
+            # Perform searches concurrently (DuckDuckGo has no async API, so each
+            # runs in a thread); a failed query only loses its own results
+            semaphore = asyncio.Semaphore(self.settings.research.max_parallel_requests)
+
+            async def search(query: str) -> list[SearchResult]:
+                async with semaphore:
+                    return await self._asearch(query)
+
+            searched = await asyncio.gather(
+                *(search(query) for query in search_queries), return_exceptions=True
+            )
             all_results: list[SearchResult] = []
-            for query in search_queries:
-                results = self.search_tool.search(query)
-                all_results.extend(results)
+            for query, results in zip(search_queries, searched, strict=True):
+                if isinstance(results, Exception):
+                    self.log("Search failed for %r: %s", query, results, level=logging.WARNING)
+                elif isinstance(results, BaseException):
+                    raise results
+                else:
+                    all_results.extend(results)
 
             # Deduplicate
-            seen_urls: set[str] = set()
-            unique_results: list[SearchResult] = []
-            for result in all_results:
-                if result.url not in seen_urls:
-                    seen_urls.add(result.url)
-                    unique_results.append(result)
-
-            # Scrape asynchronously
-            scraped_content: list[ScrapedContent] = []
-            for result in unique_results[:scrape_top_n]:
-                content = await self.scraper.ascrape(result.url)
-                if content.success:
-                    scraped_content.append(content)
+            unique_results = self._dedupe_by_url(all_results)
 
-            # Synthesize research
-            research_summary = await self._asynthesize_research(
-                topic=topic,
-                search_results=unique_results,
-                scraped_content=scraped_content,
-                additional_context=additional_context,
-            )
+            scraped_content: list[ScrapedContent] = []
+            if await self._aneeds_retrieval(topic):
+                # Scrape concurrently, one paced request at a time when rate limited
+                urls = [result.url for result in unique_results[:scrape_top_n]]
+                if self.rate_limiter is None:
+                    scraped = await self.scraper.ascrape_many(urls)
+                else:
+                    scraped = await asyncio.gather(*(self._ascrape(url) for url in urls))
+                scraped_content = [content for content in scraped if content.success]
+
+                # Synthesize research
+                research_summary = await self._asynthesize_research(
+                    topic=topic,
+                    search_results=unique_results,
+                    scraped_content=scraped_content,
+                    additional_context=additional_context,
+                )
+            else:
+                self.log("Topic is well known to the model; skipping scraping and synthesis")
+                research_summary = self._search_notes(topic, unique_results, additional_context)
 
             sources = self._extract_sources(unique_results, scraped_content)
 
@@ -256,15 +315,108 @@ class ResearchAgent(BaseAgent):
                 scraped_content=scraped_content,
             )
 
-            return AgentResult(
+            research_result = AgentResult(
                 success=True,
                 content=research_summary,
                 metadata={"research_data": research_data.to_dict()},
             )
+            self._store_result(cache_key, research_result)
+            return research_result
 
         except Exception as e:
             return self._handle_error(e, "Async research execution failed")
 
+    async def aclose(self) -> None:
+        """Close the scraper's shared async HTTP client and its pooled connections."""
+        await self.scraper.aclose()
+
+    def _research_cache_key(
+        self,
+        topic: str,
+        additional_context: str,
+        search_queries: list[str] | None,
+        scrape_top_n: int,
+        use_trends: bool,
+    ) -> str | None:
+        """Build the cache key for a research run."""
+        return self._cache_key(
+            topic=topic,
+            additional_context=additional_context,
+            search_queries=search_queries,
+            scrape_top_n=scrape_top_n,
+            use_trends=use_trends,
+            research=self.settings.research.model_dump(),
+        )
+
+    def _pool(self, tasks: int) -> ThreadPoolExecutor:
+        """Create a thread pool for running network calls in parallel.
+
+        Args:
+            tasks: Number of calls to run.
+
+        Returns:
+            Executor with at most ``research.max_parallel_requests`` workers.
+        """
+        workers = max(1, min(tasks, self.settings.research.max_parallel_requests))
+        return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="research")
+
+    def _needs_retrieval(self, topic: str) -> bool:
+        """Ask the model whether it needs external sources for a topic.
+
+        Only asked when ``research.detect_retrieval_necessity`` is enabled;
+        otherwise (and on any error) retrieval is assumed to be needed.
+
+        Args:
+            topic: Research topic.
+
+        Returns:
+            False if the model answered that it can cover the topic unaided.
+        """
+        if not self.settings.research.detect_retrieval_necessity:
+            return True
+        try:
+            answer = self.llm.generate(
+                RETRIEVAL_NECESSITY_PROMPT.format(topic=topic), max_tokens=1, temperature=0.0
+            )
+        except Exception as e:
+            self.log("Retrieval necessity check failed: %s", e, level=logging.DEBUG)
+            return True
+        return not answer.strip().upper().startswith("NO")
+
+    async def _aneeds_retrieval(self, topic: str) -> bool:
+        """Ask the model whether it needs external sources, asynchronously."""
+        if not self.settings.research.detect_retrieval_necessity:
+            return True
+        try:
+            answer = await self.llm.agenerate(
+                RETRIEVAL_NECESSITY_PROMPT.format(topic=topic), max_tokens=1, temperature=0.0
+            )
+        except Exception as e:
+            self.log("Retrieval necessity check failed: %s", e, level=logging.DEBUG)
+            return True
+        return not answer.strip().upper().startswith("NO")
+
+    def _search_notes(
+        self,
+        topic: str,
+        search_results: list[SearchResult],
+        additional_context: str,
+    ) -> str:
+        """Build research notes from search results alone (no LLM synthesis).
+
+        Args:
+            topic: Research topic.
+            search_results: Search results.
+            additional_context: Additional context.
+
+        Returns:
+            Research notes listing the top results.
+        """
+        notes = f"# Research Notes: {topic}\n\n"
+        if additional_context:
+            notes += f"{additional_context}\n\n"
+        return notes + self.search_tool.format_results_for_llm(search_results[:10])
+
     def _generate_search_queries(self, topic: str) -> list[str]:
         """Generate search queries for a topic.
 
@@ -302,7 +454,7 @@ Topic: {topic}
 Return only the search queries, one per line, without numbering or explanation."""
 
         try:
-            response = await self._agenerate(prompt)
+            response = await self._acoalesced_generate(prompt)
             queries = [q.strip() for q in response.strip().split("\n") if q.strip()]
             return queries[:5] if queries else [topic]
         except Exception:
@@ -332,21 +484,14 @@ Return only the search queries, one per line, without numbering or explanation."
         search_context = self.search_tool.format_results_for_llm(search_results[:10])
 
         # Prepare context from scraped content
-        scraped_context = "\n\n".join(
-            f"**Source: {c.title}** ({c.url})\n{c.content[:2000]}..."
-            for c in scraped_content
-            if c.success
-        )
+        scraped_context = self._scraped_context(scraped_content)
 
         # Prepare trends context
         trends_context = ""
         if trends_data and trends_data.interest_score > 0:
             trends_context = trends_data.to_research_context()
 
-        prompt = RESEARCH_PROMPT.format(
-            topic=topic,
-            additional_context=additional_context or "No additional context provided.",
-        )
+        prompt = self._research_prompt(topic, additional_context)
 
         full_prompt = f"""{prompt}
 
@@ -379,16 +524,9 @@ Use these trending queries and topics to ensure the content covers what readers
         """Synthesize research asynchronously."""
         search_context = self.search_tool.format_results_for_llm(search_results[:10])
 
-        scraped_context = "\n\n".join(
-            f"**Source: {c.title}** ({c.url})\n{c.content[:2000]}..."
-            for c in scraped_content
-            if c.success
-        )
+        scraped_context = self._scraped_context(scraped_content)
 
-        prompt = RESEARCH_PROMPT.format(
-            topic=topic,
-            additional_context=additional_context or "No additional context provided.",
-        )
+        prompt = self._research_prompt(topic, additional_context)
 
         full_prompt = f"""{prompt}
 
@@ -398,11 +536,195 @@ Use these trending queries and topics to ensure the content covers what readers
 ## Scraped Content:
 {scraped_context}"""
 
-        return await self._agenerate(
+        return await self._acoalesced_generate(
             full_prompt,
             system_prompt=self.settings.prompts.research_system,
         )
 
+    def _scraped_context(self, scraped_content: list[ScrapedContent]) -> str:
+        """Quote the successfully scraped pages for the synthesis prompt.
+
+        Each page is quoted up to its preview, or, with
+        ``research.context_tokens`` set, up to its share of that token budget.
+
+        Args:
+            scraped_content: Scraped pages.
+
+        Returns:
+            The quoted pages.
+        """
+        pages = [c for c in scraped_content if c.success]
+        budget = self.settings.research.context_tokens
+        if budget is None:
+            excerpts = [c.preview for c in pages]
+        else:
+            # Split the budget evenly; whatever a short page leaves goes to the next
+            excerpts = []
+            for i, page in enumerate(pages):
+                excerpt = truncate_tokens(page.content, budget // (len(pages) - i), self.llm.model)
+                budget -= count_tokens(excerpt, self.llm.model)
+                excerpts.append(excerpt)
+
+        return "\n\n".join(
+            f"**Source: {c.title}** ({c.url})\n{excerpt}..."
+            for c, excerpt in zip(pages, excerpts, strict=True)
+        )
+
+    @staticmethod
+    def _research_prompt(topic: str, additional_context: str) -> str:
+        """Build the synthesis prompt (RESEARCH_PROMPT, filled in).
+
+        Only the short assignment part is formatted; the long static
+        requirements are prepended as they are.
+        """
+        return RESEARCH_INSTRUCTIONS + RESEARCH_INPUT.format(
+            topic=topic,
+            additional_context=additional_context or "No additional context provided.",
+        )
+
+    def _search(self, query: str) -> list[SearchResult]:
+        """Search once the rate limiter allows it.
+
+        Args:
+            query: Search query.
+
+        Returns:
+            List of search results.
+        """
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        try:
+            results = self.search_tool.search(query, raise_errors=True)
+        except SearchError as e:
+            return self._search_failed(e)
+        self._adapt_rate(rate_limited=False)
+        return results
+
+    async def _asearch(self, query: str) -> list[SearchResult]:
+        """Search without blocking the event loop, coalescing identical queries.
+
+        Args:
+            query: Search query.
+
+        Returns:
+            List of search results.
+        """
+
+        async def search() -> list[SearchResult]:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.aacquire()
+            try:
+                results = await asyncio.to_thread(self.search_tool.search, query, raise_errors=True)
+            except SearchError as e:
+                return self._search_failed(e)
+            self._adapt_rate(rate_limited=False)
+            return results
+
+        key = SingleFlight.make_key("search", " ".join(query.lower().split()))
+        return await self.single_flight.do(key, search)
+
+    def _search_failed(self, error: SearchError) -> list[SearchResult]:
+        """Log a failed search and back off, since provider errors are often rate limits.
+
+        Args:
+            error: The search provider's error.
+
+        Returns:
+            No search results.
+        """
+        self.log("%s", error, level=logging.ERROR)
+        self._adapt_rate(rate_limited=True)
+        return []
+
+    def _scrape(self, url: str) -> ScrapedContent:
+        """Scrape a page once the rate limiter allows it.
+
+        Pages already in the scraper's cache are returned without a token.
+
+        Args:
+            url: URL to scrape.
+
+        Returns:
+            Scraped content.
+        """
+        cached = self.scraper.cached(url)
+        if cached is not None:
+            return cached
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        content = self.scraper.scrape(url)
+        self._adapt_rate(rate_limited=self._scrape_rate_limited(content))
+        return content
+
+    async def _ascrape(self, url: str) -> ScrapedContent:
+        """Scrape a page asynchronously once the rate limiter allows it.
+
+        Pages already in the scraper's cache are returned without a token.
+
+        Args:
+            url: URL to scrape.
+
+        Returns:
+            Scraped content.
+        """
+        cached = self.scraper.cached(url)
+        if cached is not None:
+            return cached
+        if self.rate_limiter is not None:
+            await self.rate_limiter.aacquire()
+        content = await self.scraper.ascrape(url)
+        self._adapt_rate(rate_limited=self._scrape_rate_limited(content))
+        return content
+
+    @staticmethod
+    def _scrape_rate_limited(content: ScrapedContent) -> bool:
+        """Check whether a scrape failed because the site rate limited us."""
+        return not content.success and "429" in (content.error or "")
+
+    def _adapt_rate(self, *, rate_limited: bool) -> None:
+        """Back off the rate limiter after a rate-limited call, recover otherwise."""
+        if self.rate_limiter is None:
+            return
+        if rate_limited:
+            self.rate_limiter.penalize()
+            self.log(
+                "Rate limited; reducing to %.2f requests/s",
+                self.rate_limiter.rate,
+                level=logging.WARNING,
+            )
+        else:
+            self.rate_limiter.reward()
+
+    async def _acoalesced_generate(self, prompt: str, system_prompt: str | None = None) -> str:
+        """Generate content, sharing the call with concurrent identical requests.
+
+        Args:
+            prompt: User prompt.
+            system_prompt: Optional system prompt.
+
+        Returns:
+            Generated content string.
+        """
+        key = SingleFlight.make_key("llm", self.llm.model, system_prompt, prompt)
+        return await self.single_flight.do(
+            key, lambda: self._agenerate(prompt, system_prompt=system_prompt)
+        )
+
+    @staticmethod
+    def _dedupe_by_url(results: list[SearchResult]) -> list[SearchResult]:
+        """Drop results whose URL was already seen, keeping the first in order.
+
+        Args:
+            results: Search results from every query.
+
+        Returns:
+            One result per URL.
+        """
+        unique: dict[str, SearchResult] = {}
+        for result in results:
+            unique.setdefault(result.url, result)
+        return list(unique.values())
+
     def _extract_sources(
         self,
         search_results: list[SearchResult],
@@ -433,7 +755,10 @@ Use these trending queries and topics to ensure the content covers what readers
                 seen_urls.add(content.url)
 
         # Add sources from search results
+        max_sources = self.settings.research.max_sources
         for result in search_results:
+            if len(sources) >= max_sources:
+                break
             if result.url not in seen_urls:
                 sources.append(
                     {
@@ -444,7 +769,4 @@ Use these trending queries and topics to ensure the content covers what readers
                 )
                 seen_urls.add(result.url)
 
-            if len(sources) >= self.settings.research.max_sources:
-                break
-
         return sources
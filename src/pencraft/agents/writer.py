@@ -2,28 +2,46 @@
 
 from __future__ import annotations
 
+import asyncio
+import io
 import logging
 from collections.abc import Callable
-from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TextIO
 
 from pencraft.agents.base import AgentResult, BaseAgent
 from pencraft.agents.planner import BlogOutline, Section
-from pencraft.config.defaults import AI_DETECTOR_BLACKLIST
+from pencraft.config.defaults import AI_DETECTOR_BLACKLIST, AI_DETECTOR_PATTERN
 from pencraft.llm.prompts import (
     CONCLUSION_PROMPT,
     INTRODUCTION_PROMPT,
-    SECTION_PROMPT,
+    SECTION_CONTEXT,
+    SECTION_INPUT,
+    SECTION_INSTRUCTIONS,
+    SECTIONS_BATCH_INPUT,
 )
+from pencraft.utils import serialization
+from pencraft.utils.text import WordCounter, count_words
 
 if TYPE_CHECKING:
+    from pencraft.cache import DiskCache
     from pencraft.config.settings import Settings
     from pencraft.llm.client import LLMClient
 
 logger = logging.getLogger(__name__)
 
+# Report streaming progress every this many words of a section
+STREAM_PROGRESS_INTERVAL = 250
 
-@dataclass
+# Characters of the text written so far that a section prompt sees as context
+PREVIOUS_CONTEXT_CHARS = 1500
+
+# Rough output tokens per word, for checking that batched sections fit max_tokens
+TOKENS_PER_WORD = 1.4
+
+
+@dataclass(slots=True)
 class BlogPost:
     """A complete blog post."""
 
@@ -34,7 +52,8 @@ class BlogPost:
     categories: list[str] = field(default_factory=list)
     sources: list[dict[str, Any]] = field(default_factory=list)
     word_count: int = 0
-    sections: dict[str, str] = field(default_factory=dict)
+    # (title, body) in post order, introduction and conclusion included
+    sections: list[tuple[str, str]] = field(default_factory=list)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
@@ -61,6 +80,7 @@ class WriterAgent(BaseAgent):
         llm_client: LLMClient,
         settings: Settings | None = None,
         on_progress: Callable[[str], None] | None = None,
+        cache: DiskCache | None = None,
     ) -> None:
         """Initialize the writer agent.
 
@@ -68,8 +88,11 @@ class WriterAgent(BaseAgent):
             llm_client: LLM client for AI operations.
             settings: Settings object.
             on_progress: Callback for progress updates.
+            cache: Persistent cache for LLM completions (see cache.llm_responses).
         """
-        super().__init__(llm_client, settings, name="WriterAgent", on_progress=on_progress)
+        super().__init__(
+            llm_client, settings, name="WriterAgent", on_progress=on_progress, cache=cache
+        )
 
     def execute(
         self,
@@ -78,6 +101,7 @@ class WriterAgent(BaseAgent):
         *,
         sources: list[dict[str, Any]] | None = None,
         _style_notes: str = "",
+        draft_path: str | Path | None = None,
     ) -> AgentResult:
         """Write a complete blog post.
 
@@ -86,61 +110,87 @@ class WriterAgent(BaseAgent):
             research_summary: Research data to incorporate.
             sources: Source citations to include.
             style_notes: Additional style guidance.
+            draft_path: File the post is streamed to while it is written, so
+                progress is on disk before the final file is saved.
 
         Returns:
             AgentResult with BlogPost in metadata.
         """
+        draft = self._open_draft(draft_path)
         try:
-            self.log(f"Writing blog post: {outline.title} ({outline.layout_type} layout)")
+            self.log("Writing blog post: %s (%s layout)", outline.title, outline.layout_type)
 
             sources = sources or []
-            sections: dict[str, str] = {}
+            sections: list[tuple[str, str]] = []
             content_parts: list[str] = []
 
             # Calculate words per section
             num_sections = len(outline.sections) + 2  # +2 for intro/conclusion
             words_per_section = outline.target_word_count // num_sections
+            outline = self._fit_word_limit(outline, words_per_section)
 
             # Write introduction
             self.log("Writing introduction...")
             intro = self._write_introduction(outline, words_per_section)
             self._check_style(intro, "Introduction")
-            sections["introduction"] = intro
+            sections.append(("introduction", intro))
             content_parts.append(intro)
+            self._append_draft(draft, intro)
 
             # Write each section
-            previous_content = intro
+            prewritten = self._write_sections_batched(
+                outline, research_summary, intro, words_per_section
+            )
+            previous_tail = self._context_tail(intro)
+            written_words = count_words(intro)
+            max_words = self.settings.blog.max_word_count
+            kept: list[Section] = []
             for i, section in enumerate(outline.sections):
-                self.log(f"Writing section {i + 1}/{len(outline.sections)}: {section.title}")
-
-                section_content = self._write_section(
-                    outline=outline,
-                    section=section,
-                    research_summary=research_summary,
-                    previous_content=previous_content,
-                    target_words=words_per_section,
-                )
+                section_content = prewritten.get(i)
+                if section_content is not None:
+                    self._append_draft(draft, f"\n\n## {section.title}\n\n{section_content}")
+                elif written_words >= max_words:
+                    # Sections ran longer than planned: don't pay for more
+                    continue
+                else:
+                    self.log(
+                        "Writing section %d/%d: %s", i + 1, len(outline.sections), section.title
+                    )
+                    self._append_draft(draft, f"\n\n## {section.title}\n\n")
+                    section_content = self._write_section(
+                        outline=outline,
+                        section=section,
+                        research_summary=research_summary,
+                        previous_tail=previous_tail,
+                        target_words=words_per_section,
+                        draft=draft,
+                    )
                 self._check_style(section_content, f"Section: {section.title}")
 
-                sections[section.title] = section_content
-                content_parts.append(f"\n## {section.title}\n\n{section_content}")
-                previous_content += section_content
+                kept.append(section)
+                sections.append((section.title, section_content))
+                content_parts.extend(("\n\n## ", section.title, "\n\n", section_content))
+                previous_tail = self._context_tail(previous_tail, section_content)
+                written_words += count_words(section_content)
+            outline = self._keep_sections(outline, kept)
 
             # Write conclusion
             self.log("Writing conclusion...")
             conclusion = self._write_conclusion(outline, content_parts)
             self._check_style(conclusion, "Conclusion")
-            sections["conclusion"] = conclusion
-            content_parts.append(f"\n## Conclusion\n\n{conclusion}")
+            sections.append(("conclusion", conclusion))
+            content_parts.extend(("\n\n## Conclusion\n\n", conclusion))
+            self._append_draft(draft, f"\n\n## Conclusion\n\n{conclusion}")
 
             # Add sources/references if citations are enabled
             if self.settings.blog.include_citations and sources:
                 references = self._format_references(sources)
-                content_parts.append(f"\n## References\n\n{references}")
+                content_parts.extend(("\n\n## References\n\n", references))
+                self._append_draft(draft, f"\n\n## References\n\n{references}")
 
             # Combine all content
-            full_content = "\n".join(content_parts)
-            word_count = len(full_content.split())
+            full_content = "".join(content_parts)
+            word_count = count_words(full_content)
 
             # Create blog post object
             blog_post = BlogPost(
@@ -154,7 +204,7 @@ class WriterAgent(BaseAgent):
                 sections=sections,
             )
 
-            self.log(f"Blog post complete: {word_count} words")
+            self.log("Blog post complete: %d words", word_count)
 
             return AgentResult(
                 success=True,
@@ -164,6 +214,9 @@ class WriterAgent(BaseAgent):
 
         except Exception as e:
             return self._handle_error(e, "Writing failed")
+        finally:
+            if draft is not None:
+                draft.close()
 
     async def aexecute(
         self,
@@ -172,6 +225,7 @@ class WriterAgent(BaseAgent):
         *,
         sources: list[dict[str, Any]] | None = None,
         _style_notes: str = "",
+        draft_path: str | Path | None = None,
     ) -> AgentResult:
         """Write a complete blog post asynchronously.
 
@@ -180,52 +234,105 @@ class WriterAgent(BaseAgent):
             research_summary: Research data to incorporate.
             sources: Source citations to include.
             style_notes: Additional style guidance.
+            draft_path: File the post is streamed to while it is written, so
+                progress is on disk before the final file is saved.
 
         Returns:
             AgentResult with BlogPost in metadata.
         """
+        draft = self._open_draft(draft_path)
+        conclusion_task: asyncio.Task[str] | None = None
         try:
-            self.log(f"Writing blog post async: {outline.title}")
+            self.log("Writing blog post async: %s", outline.title)
 
             sources = sources or []
-            sections: dict[str, str] = {}
+            sections: list[tuple[str, str]] = []
             content_parts: list[str] = []
 
             num_sections = len(outline.sections) + 2
             words_per_section = outline.target_word_count // num_sections
+            outline = self._fit_word_limit(outline, words_per_section)
+
+            # The conclusion is written from the outline alone, so it is generated
+            # while the introduction and sections are being written
+            conclusion_task = asyncio.create_task(self._awrite_conclusion(outline, content_parts))
 
             # Write introduction
             intro = await self._awrite_introduction(outline, words_per_section)
-            sections["introduction"] = intro
+            sections.append(("introduction", intro))
             content_parts.append(intro)
+            self._append_draft(draft, intro)
 
             # Write each section
-            previous_content = intro
-            for section in outline.sections:
-                section_content = await self._awrite_section(
-                    outline=outline,
-                    section=section,
-                    research_summary=research_summary,
-                    previous_content=previous_content,
-                    target_words=words_per_section,
+            prewritten = await self._awrite_sections_batched(
+                outline, research_summary, intro, words_per_section
+            )
+            previous_tail = self._context_tail(intro)
+            if self.settings.blog.allow_parallel_sections:
+                # Earlier sections are only soft context, so every section can be
+                # written at once with the introduction as its context
+                pending = [i for i in range(len(outline.sections)) if i not in prewritten]
+                written = await asyncio.gather(
+                    *(
+                        self._awrite_section(
+                            outline=outline,
+                            section=outline.sections[i],
+                            research_summary=research_summary,
+                            previous_tail=previous_tail,
+                            target_words=words_per_section,
+                        )
+                        for i in pending
+                    )
                 )
+                prewritten.update(zip(pending, written, strict=True))
 
-                sections[section.title] = section_content
-                content_parts.append(f"\n## {section.title}\n\n{section_content}")
-                previous_content += section_content
-
-            # Write conclusion
-            conclusion = await self._awrite_conclusion(outline, content_parts)
-            sections["conclusion"] = conclusion
-            content_parts.append(f"\n## Conclusion\n\n{conclusion}")
+            written_words = count_words(intro)
+            max_words = self.settings.blog.max_word_count
+            kept: list[Section] = []
+            for i, section in enumerate(outline.sections):
+                section_content = prewritten.get(i)
+                if section_content is not None:
+                    self._append_draft(draft, f"\n\n## {section.title}\n\n{section_content}")
+                elif written_words >= max_words:
+                    # Sections ran longer than planned: don't pay for more
+                    continue
+                else:
+                    self._append_draft(draft, f"\n\n## {section.title}\n\n")
+                    section_content = await self._awrite_section(
+                        outline=outline,
+                        section=section,
+                        research_summary=research_summary,
+                        previous_tail=previous_tail,
+                        target_words=words_per_section,
+                        draft=draft,
+                    )
+
+                kept.append(section)
+                sections.append((section.title, section_content))
+                content_parts.extend(("\n\n## ", section.title, "\n\n", section_content))
+                previous_tail = self._context_tail(previous_tail, section_content)
+                written_words += count_words(section_content)
+
+            # Write conclusion (again, if it summarizes sections that were dropped)
+            trimmed = self._keep_sections(outline, kept)
+            if trimmed is not outline:
+                conclusion_task.cancel()
+                conclusion_task = asyncio.create_task(
+                    self._awrite_conclusion(trimmed, content_parts)
+                )
+            conclusion = await conclusion_task
+            sections.append(("conclusion", conclusion))
+            content_parts.extend(("\n\n## Conclusion\n\n", conclusion))
+            self._append_draft(draft, f"\n\n## Conclusion\n\n{conclusion}")
 
             # Add references
             if self.settings.blog.include_citations and sources:
                 references = self._format_references(sources)
-                content_parts.append(f"\n## References\n\n{references}")
+                content_parts.extend(("\n\n## References\n\n", references))
+                self._append_draft(draft, f"\n\n## References\n\n{references}")
 
-            full_content = "\n".join(content_parts)
-            word_count = len(full_content.split())
+            full_content = "".join(content_parts)
+            word_count = count_words(full_content)
 
             blog_post = BlogPost(
                 title=outline.title,
@@ -246,6 +353,14 @@ class WriterAgent(BaseAgent):
 
         except Exception as e:
             return self._handle_error(e, "Async writing failed")
+        finally:
+            if conclusion_task is not None:
+                # Don't leave it running, or its error unretrieved, after a failure
+                conclusion_task.cancel()
+                if conclusion_task.done() and not conclusion_task.cancelled():
+                    conclusion_task.exception()
+            if draft is not None:
+                draft.close()
 
     def _write_introduction(self, outline: BlogOutline, _target_words: int) -> str:
         """Write the introduction section.
@@ -257,16 +372,7 @@ class WriterAgent(BaseAgent):
         Returns:
             Introduction content.
         """
-        outline_summary = "\n".join(
-            f"- {s.title}: {', '.join(s.key_points[:3])}" for s in outline.sections
-        )
-
-        prompt = INTRODUCTION_PROMPT.format(
-            title=outline.title,
-            topic=outline.title,
-            outline=outline_summary,
-        )
-
+        prompt = self._introduction_prompt(outline)
         return self._generate(
             prompt,
             system_prompt=self.settings.prompts.writer_system,
@@ -274,19 +380,70 @@ class WriterAgent(BaseAgent):
 
     async def _awrite_introduction(self, outline: BlogOutline, _target_words: int) -> str:
         """Write introduction asynchronously."""
+        prompt = self._introduction_prompt(outline)
+        return await self._agenerate(
+            prompt,
+            system_prompt=self.settings.prompts.writer_system,
+        )
+
+    @staticmethod
+    def _introduction_prompt(outline: BlogOutline) -> str:
+        """Build the introduction prompt from the outline's sections and key points."""
         outline_summary = "\n".join(
             f"- {s.title}: {', '.join(s.key_points[:3])}" for s in outline.sections
         )
-
-        prompt = INTRODUCTION_PROMPT.format(
+        return INTRODUCTION_PROMPT.format(
             title=outline.title,
             topic=outline.title,
             outline=outline_summary,
         )
 
-        return await self._agenerate(
-            prompt,
-            system_prompt=self.settings.prompts.writer_system,
+    @staticmethod
+    def _conclusion_prompt(outline: BlogOutline) -> str:
+        """Build the conclusion prompt from the outline's section titles."""
+        main_points = "\n".join(f"- {s.title}" for s in outline.sections)
+        return CONCLUSION_PROMPT.format(
+            title=outline.title,
+            topic=outline.title,
+            main_points=main_points,
+        )
+
+    @classmethod
+    def _section_prompt(
+        cls,
+        outline: BlogOutline,
+        section: Section,
+        research_summary: str,
+        previous_tail: str,
+        target_words: int,
+    ) -> str:
+        """Build the prompt for one section (SECTION_PROMPT, filled in).
+
+        Only the short context and input parts are formatted; the long static
+        guidelines are prepended as they are.
+        """
+        return (
+            SECTION_INSTRUCTIONS
+            + cls._section_context(outline, research_summary)
+            + SECTION_INPUT.format(
+                section_title=section.title,
+                section_outline=cls._section_brief(section),
+                word_count=target_words,
+                previous_content=previous_tail,
+            )
+        )
+
+    @staticmethod
+    def _section_context(outline: BlogOutline, research_summary: str) -> str:
+        """Format the article context shared by every section prompt of a post."""
+        return SECTION_CONTEXT.format(title=outline.title, research_notes=research_summary[:2000])
+
+    @staticmethod
+    def _section_brief(section: Section) -> str:
+        """Describe what a section should cover: its key points and subsections."""
+        return "\n".join(
+            [f"Key points: {', '.join(section.key_points)}"]
+            + [f"  - Subsection: {sub.title}" for sub in section.subsections]
         )
 
     def _write_section(
@@ -294,8 +451,9 @@ class WriterAgent(BaseAgent):
         outline: BlogOutline,
         section: Section,
         research_summary: str,
-        previous_content: str,
+        previous_tail: str,
         target_words: int,
+        draft: TextIO | None = None,
     ) -> str:
         """Write a single section.
 
@@ -303,68 +461,292 @@ class WriterAgent(BaseAgent):
             outline: Full blog outline.
             section: Section to write.
             research_summary: Research data.
-            previous_content: Previously written content.
+            previous_tail: End of the previously written content (see _context_tail()).
             target_words: Target word count.
+            draft: Draft file the section is streamed to.
 
         Returns:
             Section content.
         """
-        section_outline = "\n".join(
-            [f"Key points: {', '.join(section.key_points)}"]
-            + [f"  - Subsection: {sub.title}" for sub in section.subsections]
-        )
-
-        # Truncate previous content to avoid token limits
-        prev_summary = (
-            previous_content[-1500:] if len(previous_content) > 1500 else previous_content
-        )
-
-        prompt = SECTION_PROMPT.format(
-            title=outline.title,
-            section_title=section.title,
-            section_outline=section_outline,
-            previous_content=prev_summary,
-            research_notes=research_summary[:2000],
-            word_count=target_words,
-        )
-
-        return self._generate(
-            prompt,
-            system_prompt=self.settings.prompts.writer_system,
+        prompt = self._section_prompt(
+            outline, section, research_summary, previous_tail, target_words
         )
+        return self._stream_text(prompt, section.title, draft)
 
     async def _awrite_section(
         self,
         outline: BlogOutline,
         section: Section,
         research_summary: str,
-        previous_content: str,
+        previous_tail: str,
         target_words: int,
+        draft: TextIO | None = None,
     ) -> str:
         """Write a section asynchronously."""
-        section_outline = "\n".join(
-            [f"Key points: {', '.join(section.key_points)}"]
-            + [f"  - Subsection: {sub.title}" for sub in section.subsections]
+        prompt = self._section_prompt(
+            outline, section, research_summary, previous_tail, target_words
         )
+        return await self._astream_text(prompt, section.title, draft)
 
-        prev_summary = (
-            previous_content[-1500:] if len(previous_content) > 1500 else previous_content
-        )
+    def _write_sections_batched(
+        self,
+        outline: BlogOutline,
+        research_summary: str,
+        intro: str,
+        target_words: int,
+    ) -> dict[int, str]:
+        """Write every body section in one request (``blog.batch_sections``).
 
-        prompt = SECTION_PROMPT.format(
-            title=outline.title,
-            section_title=section.title,
-            section_outline=section_outline,
-            previous_content=prev_summary,
-            research_notes=research_summary[:2000],
-            word_count=target_words,
+        Args:
+            outline: Full blog outline.
+            research_summary: Research data.
+            intro: Introduction, given as the text before the first section.
+            target_words: Target word count per section.
+
+        Returns:
+            Section content by index in the outline. Empty when batching is
+            off, would not fit the output budget or fails; missing sections
+            are written one by one.
+        """
+        prompt = self._sections_batch_prompt(outline, research_summary, intro, target_words)
+        if prompt is None:
+            return {}
+        self.log("Writing %d sections in one request...", len(outline.sections))
+        try:
+            reply = self._generate(prompt, system_prompt=self.settings.prompts.writer_system)
+        except Exception as e:
+            self.log("Batched section writing failed: %s", e, level=logging.WARNING)
+            return {}
+        return self._parse_sections_batch(outline, reply)
+
+    async def _awrite_sections_batched(
+        self,
+        outline: BlogOutline,
+        research_summary: str,
+        intro: str,
+        target_words: int,
+    ) -> dict[int, str]:
+        """Write every body section in one request asynchronously."""
+        prompt = self._sections_batch_prompt(outline, research_summary, intro, target_words)
+        if prompt is None:
+            return {}
+        self.log("Writing %d sections in one request...", len(outline.sections))
+        try:
+            reply = await self._agenerate(prompt, system_prompt=self.settings.prompts.writer_system)
+        except Exception as e:
+            self.log("Batched section writing failed: %s", e, level=logging.WARNING)
+            return {}
+        return self._parse_sections_batch(outline, reply)
+
+    def _sections_batch_prompt(
+        self,
+        outline: BlogOutline,
+        research_summary: str,
+        intro: str,
+        target_words: int,
+    ) -> str | None:
+        """Build the prompt for writing all body sections at once.
+
+        Args:
+            outline: Full blog outline.
+            research_summary: Research data.
+            intro: Introduction written before the sections.
+            target_words: Target word count per section.
+
+        Returns:
+            The prompt, or None when batching is off or the sections would
+            not fit in one reply.
+        """
+        if not self.settings.blog.batch_sections or len(outline.sections) < 2:
+            return None
+        expected_tokens = len(outline.sections) * target_words * TOKENS_PER_WORD
+        if expected_tokens > self.settings.llm.max_tokens:
+            self.log(
+                "Sections need ~%.0f tokens, more than max_tokens; writing them one by one",
+                expected_tokens,
+                level=logging.DEBUG,
+            )
+            return None
+
+        briefs = "\n\n".join(
+            f"### {section.title}\n{self._section_brief(section)}\n"
+            f"Target length: {target_words} words"
+            for section in outline.sections
+        )
+        return (
+            SECTION_INSTRUCTIONS
+            + self._section_context(outline, research_summary)
+            + SECTIONS_BATCH_INPUT.format(
+                sections=briefs, previous_content=self._context_tail(intro)
+            )
         )
 
-        return await self._agenerate(
-            prompt,
-            system_prompt=self.settings.prompts.writer_system,
+    def _parse_sections_batch(self, outline: BlogOutline, reply: str) -> dict[int, str]:
+        """Map a batched reply back to the outline's sections.
+
+        Args:
+            outline: Full blog outline.
+            reply: JSON object of section title to markdown.
+
+        Returns:
+            Non-empty section content by index in the outline.
+        """
+        try:
+            data = serialization.loads(serialization.strip_code_fence(reply))
+        except serialization.JSONDecodeError as e:
+            self.log("Batched sections are not valid JSON: %s", e, level=logging.WARNING)
+            return {}
+        if not isinstance(data, dict):
+            return {}
+
+        written = {
+            i: content.strip()
+            for i, section in enumerate(outline.sections)
+            if isinstance(content := data.get(section.title), str) and content.strip()
+        }
+        if len(written) < len(outline.sections):
+            self.log(
+                "Batched reply covered %d/%d sections; writing the rest one by one",
+                len(written),
+                len(outline.sections),
+                level=logging.WARNING,
+            )
+        return written
+
+    def _stream_text(self, prompt: str, label: str, draft: TextIO | None = None) -> str:
+        """Generate writer content by streaming, reporting progress as words arrive.
+
+        Args:
+            prompt: User prompt.
+            label: Name of the part being written (for progress messages).
+            draft: Draft file each chunk is also written to.
+
+        Returns:
+            Generated content.
+        """
+        system_prompt = self.settings.prompts.writer_system
+        key = self._completion_key(prompt, system_prompt, {})
+        cached = self._cached_completion(key)
+        if cached is not None:
+            self._append_draft(draft, cached)
+            return cached
+
+        self.log("Streaming content (prompt length: %d chars)", len(prompt))
+        buffer = io.StringIO()
+        counter = WordCounter()
+        next_report = STREAM_PROGRESS_INTERVAL
+
+        for delta in self.llm.generate_stream(prompt, system_prompt=system_prompt):
+            buffer.write(delta)
+            if draft is not None:
+                draft.write(delta)
+            if counter.feed(delta) >= next_report:
+                self.log("   %s: %d words so far", label, counter.count)
+                next_report += STREAM_PROGRESS_INTERVAL
+
+        if draft is not None:
+            draft.flush()
+        content = buffer.getvalue()
+        self._store_completion(key, content)
+        return content
+
+    async def _astream_text(self, prompt: str, label: str, draft: TextIO | None = None) -> str:
+        """Generate writer content by streaming asynchronously."""
+        system_prompt = self.settings.prompts.writer_system
+        key = self._completion_key(prompt, system_prompt, {})
+        cached = self._cached_completion(key)
+        if cached is not None:
+            self._append_draft(draft, cached)
+            return cached
+
+        self.log("Streaming content async (prompt length: %d chars)", len(prompt))
+        buffer = io.StringIO()
+        counter = WordCounter()
+        next_report = STREAM_PROGRESS_INTERVAL
+
+        async for delta in self.llm.agenerate_stream(prompt, system_prompt=system_prompt):
+            buffer.write(delta)
+            if draft is not None:
+                draft.write(delta)
+            if counter.feed(delta) >= next_report:
+                self.log("   %s: %d words so far", label, counter.count)
+                next_report += STREAM_PROGRESS_INTERVAL
+
+        if draft is not None:
+            draft.flush()
+        content = buffer.getvalue()
+        self._store_completion(key, content)
+        return content
+
+    @staticmethod
+    def _context_tail(previous_tail: str, new_text: str = "") -> str:
+        """Keep the end of the written text that later section prompts see.
+
+        Only the tail is kept, so the text written so far is never rebuilt
+        as one growing string.
+
+        Args:
+            previous_tail: Tail kept so far.
+            new_text: Text written since.
+
+        Returns:
+            The last PREVIOUS_CONTEXT_CHARS characters of both combined.
+        """
+        return (previous_tail + new_text[-PREVIOUS_CONTEXT_CHARS:])[-PREVIOUS_CONTEXT_CHARS:]
+
+    @staticmethod
+    def _open_draft(draft_path: str | Path | None) -> TextIO | None:
+        """Open the draft file a post is streamed to, if one was requested."""
+        if draft_path is None:
+            return None
+        path = Path(draft_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return path.open("w", encoding="utf-8")
+
+    @staticmethod
+    def _append_draft(draft: TextIO | None, text: str) -> None:
+        """Append a finished part to the draft file and make it visible on disk."""
+        if draft is not None:
+            draft.write(text)
+            draft.flush()
+
+    def _log_word_limit(self, max_words: int, skipped: int) -> None:
+        """Report that remaining sections are skipped after reaching the word limit."""
+        self.log(
+            "Reached max word count (%d), skipping %d remaining section(s)",
+            max_words,
+            skipped,
+            level=logging.WARNING,
         )
 
+    def _fit_word_limit(self, outline: BlogOutline, words_per_section: int) -> BlogOutline:
+        """Drop the sections the word limit leaves no room for, before any is written.
+
+        The introduction and every section are budgeted words_per_section words,
+        and a section is only started while the words before it stay under
+        max_word_count. Trimming the outline up front means batched or parallel
+        sections are never generated just to be thrown away, and the conclusion
+        only summarizes sections the post contains.
+
+        Args:
+            outline: Blog outline.
+            words_per_section: Planned words per part of the post.
+
+        Returns:
+            The outline, without the sections that don't fit.
+        """
+        if words_per_section <= 0:
+            return outline
+        fitting = max(0, (self.settings.blog.max_word_count - 1) // words_per_section)
+        return self._keep_sections(outline, outline.sections[:fitting])
+
+    def _keep_sections(self, outline: BlogOutline, kept: list[Section]) -> BlogOutline:
+        """Narrow the outline to the kept sections, reporting any that were dropped."""
+        if len(kept) == len(outline.sections):
+            return outline
+        self._log_word_limit(self.settings.blog.max_word_count, len(outline.sections) - len(kept))
+        return replace(outline, sections=kept)
+
     def _write_conclusion(self, outline: BlogOutline, _content_parts: list[str]) -> str:
         """Write the conclusion.
 
@@ -375,15 +757,7 @@ class WriterAgent(BaseAgent):
         Returns:
             Conclusion content.
         """
-        # Extract main points from sections
-        main_points = "\n".join(f"- {s.title}" for s in outline.sections)
-
-        prompt = CONCLUSION_PROMPT.format(
-            title=outline.title,
-            topic=outline.title,
-            main_points=main_points,
-        )
-
+        prompt = self._conclusion_prompt(outline)
         return self._generate(
             prompt,
             system_prompt=self.settings.prompts.writer_system,
@@ -391,14 +765,7 @@ class WriterAgent(BaseAgent):
 
     async def _awrite_conclusion(self, outline: BlogOutline, _content_parts: list[str]) -> str:
         """Write conclusion asynchronously."""
-        main_points = "\n".join(f"- {s.title}" for s in outline.sections)
-
-        prompt = CONCLUSION_PROMPT.format(
-            title=outline.title,
-            topic=outline.title,
-            main_points=main_points,
-        )
-
+        prompt = self._conclusion_prompt(outline)
         return await self._agenerate(
             prompt,
             system_prompt=self.settings.prompts.writer_system,
@@ -477,18 +844,20 @@ Write engaging, informative content using proper markdown formatting."""
         if not content:
             return
 
-        warnings = []
-        lower_content = content.lower()
-
-        # Check against blacklist
-        for phrase in AI_DETECTOR_BLACKLIST:
-            if phrase.lower() in lower_content:
-                warnings.append(f"Found banned phrase: '{phrase}'")
+        # Check against blacklist (one scan; reported in blacklist order)
+        found = {match.lower() for match in AI_DETECTOR_PATTERN.findall(content)}
+        warnings = [
+            f"Found banned phrase: '{phrase}'"
+            for phrase in AI_DETECTOR_BLACKLIST
+            if phrase.lower() in found
+        ]
 
         if warnings:
             self.log(
-                f"⚠️ Style warnings in {section_name}: {', '.join(warnings)}",
+                "⚠️ Style warnings in %s: %s",
+                section_name,
+                ", ".join(warnings),
                 level=logging.WARNING,
             )
         else:
-            self.log(f"✅ Style check passed for {section_name}")
+            self.log("✅ Style check passed for %s", section_name)
@@ -0,0 +1,165 @@
+"""Persistent on-disk cache for agent results and LLM completions."""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from pencraft.utils import serialization
+
+logger = logging.getLogger(__name__)
+
+# Most recently used entries kept in memory in front of the files
+DEFAULT_MEMORY_ENTRIES = 256
+
+
+@dataclass
+class CacheInfo:
+    """Statistics of a DiskCache."""
+
+    hits: int
+    misses: int
+    memory_size: int
+
+
+class DiskCache:
+    """Content-addressed JSON cache stored as one file per key.
+
+    Used to skip repeated research, planning and LLM work when the same
+    inputs come up again. Recently used entries are also kept in memory, so
+    repeated lookups within a run don't touch the disk.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path = ".pencraft-cache",
+        *,
+        ttl: float | None = None,
+        memory_entries: int = DEFAULT_MEMORY_ENTRIES,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            directory: Directory holding cached entries (created on first write).
+            ttl: Seconds after which an entry is stale and treated as a miss
+                (None keeps entries forever).
+            memory_entries: Number of recently used entries kept in memory.
+        """
+        self.directory = Path(directory)
+        self.ttl = ttl
+        self.memory_entries = memory_entries
+
+        # key -> (time stored, value), least recently used first
+        self._memory: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def make_key(**parts: Any) -> str:
+        """Build a cache key from the inputs that determine a result.
+
+        Args:
+            **parts: JSON-serializable values identifying the result.
+
+        Returns:
+            SHA-256 hex digest of the canonicalized inputs.
+        """
+        payload = serialization.dumps_bytes(parts, sort_keys=True, default=str)
+        return hashlib.sha256(payload).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Get a cached value.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Cached value, or None on a miss, stale or unreadable entry.
+        """
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and not self._is_stale(entry[0]):
+                self._memory.move_to_end(key)
+                self._hits += 1
+                # Copied like a fresh read, so callers can't change the cached entry
+                return copy.deepcopy(entry[1])
+
+        value = self._read(key)
+        with self._lock:
+            if value is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._remember(key, value[0], copy.deepcopy(value[1]))
+        return value[1]
+
+    def put(self, key: str, value: dict[str, Any]) -> None:
+        """Store a value in the cache.
+
+        Args:
+            key: Cache key.
+            value: JSON-serializable value to store.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(serialization.dumps_bytes(value, default=str))
+        os.replace(tmp_path, path)
+        with self._lock:
+            self._remember(key, time.time(), copy.deepcopy(value))
+
+    def cache_info(self) -> CacheInfo:
+        """Get cache statistics.
+
+        Returns:
+            Hits, misses and number of entries held in memory.
+        """
+        with self._lock:
+            return CacheInfo(hits=self._hits, misses=self._misses, memory_size=len(self._memory))
+
+    def _read(self, key: str) -> tuple[float, dict[str, Any]] | None:
+        """Read an entry from disk.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Tuple of (time stored, value), or None if missing, stale or unreadable.
+        """
+        path = self._path(key)
+        try:
+            stored_at = path.stat().st_mtime
+            if self._is_stale(stored_at):
+                return None
+            value = serialization.loads(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable cache entry {key}: {e}")
+            return None
+        return (stored_at, value) if isinstance(value, dict) else None
+
+    def _is_stale(self, stored_at: float) -> bool:
+        """Check whether an entry stored at the given time has expired."""
+        return self.ttl is not None and time.time() - stored_at > self.ttl
+
+    def _remember(self, key: str, stored_at: float, value: dict[str, Any]) -> None:
+        """Keep an entry in memory, evicting the least recently used (lock held)."""
+        if self.memory_entries <= 0:
+            return
+        self._memory[key] = (stored_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
@@ -2,127 +2,60 @@
 
 from __future__ import annotations
 
+import argparse
+from collections.abc import Sequence
+from functools import lru_cache
 from pathlib import Path
-from typing import Annotated
-
-import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
-
-app = typer.Typer(
-    name="pencraft",
-    help="AI-powered blog writing toolkit",
-    add_completion=False,
-    rich_markup_mode="rich",
-)
-
-console = Console()
-
-
-def version_callback(value: bool) -> None:
-    """Print version and exit."""
-    if value:
-        from pencraft import __version__
-
-        console.print(f"[bold blue]Pencraft[/bold blue] version [green]{__version__}[/green]")
-        raise typer.Exit()
-
-
-@app.callback()
-def main(
-    version: Annotated[
-        bool | None,
-        typer.Option(
-            "--version",
-            "-v",
-            help="Show version and exit",
-            callback=version_callback,
-            is_eager=True,
-        ),
-    ] = None,
-) -> None:
-    """Pencraft - AI-powered blog writing toolkit.
+from typing import TYPE_CHECKING
 
-    Generate professional, well-researched blog posts with AI.
-    """
-    pass
-
-
-@app.command()
-def write(
-    topic: Annotated[str, typer.Argument(help="Topic for the blog post")],
-    output: Annotated[
-        Path,
-        typer.Option("--output", "-o", help="Output directory"),
-    ] = Path("./output"),
-    words: Annotated[
-        int,
-        typer.Option("--words", "-w", help="Target word count"),
-    ] = 2000,
-    tags: Annotated[
-        str | None,
-        typer.Option("--tags", "-t", help="Comma-separated tags"),
-    ] = None,
-    categories: Annotated[
-        str | None,
-        typer.Option("--categories", "-c", help="Comma-separated categories"),
-    ] = None,
-    author: Annotated[
-        str | None,
-        typer.Option("--author", "-a", help="Author name"),
-    ] = None,
-    draft: Annotated[
-        bool,
-        typer.Option("--draft", "-d", help="Mark as draft"),
-    ] = False,
-    skip_research: Annotated[
-        bool,
-        typer.Option("--skip-research", help="Skip research phase"),
-    ] = False,
-    cover_image: Annotated[
-        str | None,
-        typer.Option("--cover-image", help="Cover image URL"),
-    ] = None,
-    config_file: Annotated[
-        Path | None,
-        typer.Option("--config", help="Path to config file"),
-    ] = None,
-    verbose: Annotated[
-        bool,
-        typer.Option("--verbose", help="Enable verbose output"),
-    ] = False,
-    debug: Annotated[
-        bool,
-        typer.Option("--debug", help="Enable debug mode"),
-    ] = False,
-) -> None:
-    """Generate a complete blog post on the given topic.
-
-    Example:
-        pencraft write "Introduction to Python" --words 3000 --tags python,programming
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+@lru_cache(maxsize=1)
+def _console() -> Console:
+    """Get the shared console, importing Rich on first use.
+
+    Rich is only needed once a command produces output, so ``--version`` and
+    ``--help`` don't pay for importing it up front.
     """
+    from rich.console import Console
+
+    return Console()
+
+
+def _split_csv(value: str | None) -> list[str] | None:
+    """Split a comma-separated option into stripped items (None if not given)."""
+    return list(map(str.strip, value.split(","))) if value else None
+
+
+def _cmd_write(args: argparse.Namespace) -> int:
+    """Generate a complete blog post on the given topic."""
+    from rich.panel import Panel
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     from pencraft.config.settings import load_settings
     from pencraft.generator import BlogGenerator
     from pencraft.utils.logging import configure_logging
 
+    console = _console()
+
     # Configure logging
-    configure_logging(verbose=verbose, debug=debug)
+    configure_logging(verbose=args.verbose, debug=args.debug)
 
     # Parse tags and categories
-    tag_list = [t.strip() for t in tags.split(",")] if tags else None
-    category_list = [c.strip() for c in categories.split(",")] if categories else None
+    tag_list = _split_csv(args.tags)
+    category_list = _split_csv(args.categories)
 
     # Load settings
-    settings = load_settings(config_file=config_file, verbose=verbose, debug=debug)
+    settings = load_settings(config_file=args.config_file, verbose=args.verbose, debug=args.debug)
 
     console.print(
         Panel(
             f"[bold]Generating blog post[/bold]\n\n"
-            f"Topic: [cyan]{topic}[/cyan]\n"
-            f"Target: [yellow]{words}[/yellow] words\n"
-            f"Output: [green]{output}[/green]",
+            f"Topic: [cyan]{args.topic}[/cyan]\n"
+            f"Target: [yellow]{args.words}[/yellow] words\n"
+            f"Output: [green]{args.output}[/green]",
             title="[bold blue]Pencraft[/bold blue]",
             border_style="blue",
         )
@@ -144,15 +77,15 @@ def write(
                 progress.update(task, description=msg)
 
             blog = generator.generate(
-                topic=topic,
-                target_word_count=words,
+                topic=args.topic,
+                target_word_count=args.words,
                 tags=tag_list,
                 categories=category_list,
-                author=author,
-                draft=draft,
-                output_dir=output,
-                skip_research=skip_research,
-                cover_image=cover_image,
+                author=args.author,
+                draft=args.draft,
+                output_dir=args.output,
+                skip_research=args.skip_research,
+                cover_image=args.cover_image,
                 progress_callback=update_spinner,
             )
 
@@ -177,38 +110,25 @@ def write(
 
     except Exception as e:
         console.print(f"[bold red]Error:[/bold red] {e}")
-        raise typer.Exit(code=1) from e
-
-
-@app.command()
-def research(
-    topic: Annotated[str, typer.Argument(help="Topic to research")],
-    output: Annotated[
-        Path | None,
-        typer.Option("--output", "-o", help="Save research to file"),
-    ] = None,
-    config_file: Annotated[
-        Path | None,
-        typer.Option("--config", help="Path to config file"),
-    ] = None,
-    verbose: Annotated[
-        bool,
-        typer.Option("--verbose", help="Enable verbose output"),
-    ] = False,
-) -> None:
-    """Research a topic without generating a blog post.
-
-    Example:
-        pencraft research "Machine Learning trends 2024"
-    """
+        return 1
+
+    return 0
+
+
+def _cmd_research(args: argparse.Namespace) -> int:
+    """Research a topic without generating a blog post."""
+    from rich.panel import Panel
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     from pencraft.config.settings import load_settings
     from pencraft.generator import BlogGenerator
     from pencraft.utils.logging import configure_logging
 
-    configure_logging(verbose=verbose)
-    settings = load_settings(config_file=config_file)
+    console = _console()
+    configure_logging(verbose=args.verbose)
+    settings = load_settings(config_file=args.config_file)
 
-    console.print(f"[bold]Researching:[/bold] [cyan]{topic}[/cyan]\n")
+    console.print(f"[bold]Researching:[/bold] [cyan]{args.topic}[/cyan]\n")
 
     try:
         generator = BlogGenerator(settings=settings)
@@ -226,50 +146,37 @@ def research(
                 progress.update(task, description=msg)
 
             research_summary = generator.research_only(
-                topic,
+                args.topic,
                 progress_callback=update_spinner,
             )
 
         console.print(Panel(research_summary, title="Research Summary", border_style="blue"))
 
-        if output:
-            output.write_text(research_summary, encoding="utf-8")
-            console.print(f"\n[green]Saved to:[/green] {output}")
+        if args.output:
+            args.output.write_text(research_summary, encoding="utf-8")
+            console.print(f"\n[green]Saved to:[/green] {args.output}")
 
     except Exception as e:
         console.print(f"[bold red]Error:[/bold red] {e}")
-        raise typer.Exit(code=1) from e
-
-
-@app.command()
-def outline(
-    topic: Annotated[str, typer.Argument(help="Topic for the outline")],
-    words: Annotated[
-        int,
-        typer.Option("--words", "-w", help="Target word count"),
-    ] = 2000,
-    output: Annotated[
-        Path | None,
-        typer.Option("--output", "-o", help="Save outline to file"),
-    ] = None,
-    config_file: Annotated[
-        Path | None,
-        typer.Option("--config", help="Path to config file"),
-    ] = None,
-) -> None:
-    """Generate a blog outline without writing content.
-
-    Example:
-        pencraft outline "Getting Started with Docker" --words 3000
-    """
+        return 1
+
+    return 0
+
+
+def _cmd_outline(args: argparse.Namespace) -> int:
+    """Generate a blog outline without writing content."""
+    from rich.panel import Panel
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     from pencraft.config.settings import load_settings
     from pencraft.generator import BlogGenerator
     from pencraft.utils.logging import configure_logging
 
+    console = _console()
     configure_logging()
-    settings = load_settings(config_file=config_file)
+    settings = load_settings(config_file=args.config_file)
 
-    console.print(f"[bold]Creating outline for:[/bold] [cyan]{topic}[/cyan]\n")
+    console.print(f"[bold]Creating outline for:[/bold] [cyan]{args.topic}[/cyan]\n")
 
     try:
         generator = BlogGenerator(settings=settings)
@@ -287,52 +194,39 @@ def outline(
                 progress.update(task, description=msg)
 
             blog_outline = generator.outline_only(
-                topic,
-                target_word_count=words,
+                args.topic,
+                target_word_count=args.words,
                 progress_callback=update_spinner,
             )
 
         console.print(Panel(blog_outline.to_markdown(), title="Blog Outline", border_style="blue"))
 
-        if output:
-            output.write_text(blog_outline.to_markdown(), encoding="utf-8")
-            console.print(f"\n[green]Saved to:[/green] {output}")
+        if args.output:
+            args.output.write_text(blog_outline.to_markdown(), encoding="utf-8")
+            console.print(f"\n[green]Saved to:[/green] {args.output}")
 
     except Exception as e:
         console.print(f"[bold red]Error:[/bold red] {e}")
-        raise typer.Exit(code=1) from e
-
-
-@app.command(name="config")
-def show_config(
-    show: Annotated[
-        bool,
-        typer.Option("--show", "-s", help="Show current configuration"),
-    ] = True,
-    init: Annotated[
-        bool,
-        typer.Option("--init", "-i", help="Create a new config file"),
-    ] = False,
-    path: Annotated[
-        Path,
-        typer.Option("--path", "-p", help="Config file path for init"),
-    ] = Path("pencraft.yaml"),
-) -> None:
-    """Show or create configuration.
-
-    Example:
-        pencraft config --show
-        pencraft config --init --path my-config.yaml
-    """
+        return 1
+
+    return 0
+
+
+def _cmd_config(args: argparse.Namespace) -> int:
+    """Show or create configuration."""
+    from rich.table import Table
+
     from pencraft.config.settings import Settings
 
-    if init:
+    console = _console()
+
+    if args.init:
         settings = Settings()
-        settings.save_to_file(path)
-        console.print(f"[green]Config file created:[/green] {path}")
-        return
+        settings.save_to_file(args.path)
+        console.print(f"[green]Config file created:[/green] {args.path}")
+        return 0
 
-    if show:
+    if args.show:
         settings = Settings()
 
         table = Table(title="Pencraft Configuration", show_header=True)
@@ -367,59 +261,31 @@ def show_config(
 
         console.print(table)
 
+    return 0
+
+
+def _cmd_enhance(args: argparse.Namespace) -> int:
+    """Enhance existing blog posts for SEO, quality, and revenue."""
+    from rich.panel import Panel
+    from rich.table import Table
 
-@app.command()
-def enhance(
-    path: Annotated[Path, typer.Argument(help="File or directory to enhance")],
-    words: Annotated[
-        int,
-        typer.Option("--words", "-w", help="Minimum target word count"),
-    ] = 3000,
-    recursive: Annotated[
-        bool,
-        typer.Option("--recursive", "-r", help="Process subdirectories"),
-    ] = False,
-    no_backup: Annotated[
-        bool,
-        typer.Option("--no-backup", help="Skip backup of original files"),
-    ] = False,
-    no_trends: Annotated[
-        bool,
-        typer.Option("--no-trends", help="Skip Google Trends lookup"),
-    ] = False,
-    no_seo: Annotated[
-        bool,
-        typer.Option("--no-seo", help="Skip SEO optimization"),
-    ] = False,
-    config_file: Annotated[
-        Path | None,
-        typer.Option("--config", help="Path to config file"),
-    ] = None,
-    verbose: Annotated[
-        bool,
-        typer.Option("--verbose", help="Enable verbose output"),
-    ] = False,
-) -> None:
-    """Enhance existing blog posts for SEO, quality, and revenue.
-
-    Can process a single file or an entire directory of markdown files.
-
-    Example:
-        pencraft enhance ./my-blog.md --words 4000
-        pencraft enhance ./blogs/ --recursive --words 3000
-    """
     from pencraft.config.settings import load_settings
     from pencraft.enhancer import BlogEnhancer
     from pencraft.utils.logging import configure_logging
 
-    configure_logging(verbose=verbose)
-    settings = load_settings(config_file=config_file)
+    console = _console()
+    configure_logging(verbose=args.verbose)
+    settings = load_settings(config_file=args.config_file)
 
-    path = Path(path)
+    path = Path(args.path)
+    words = args.words
+    no_backup = args.no_backup
+    no_trends = args.no_trends
+    no_seo = args.no_seo
 
     if not path.exists():
         console.print(f"[bold red]Error:[/bold red] Path not found: {path}")
-        raise typer.Exit(code=1)
+        return 1
 
     console.print(
         Panel(
@@ -455,7 +321,7 @@ def enhance(
 
             if result.error:
                 console.print(f"[bold red]Error:[/bold red] {result.error}")
-                raise typer.Exit(code=1)
+                return 1
 
             # Display results
             console.print()
@@ -479,7 +345,7 @@ def enhance(
 
             results = enhancer.enhance_directory(
                 path,
-                recursive=recursive,
+                recursive=args.recursive,
                 target_word_count=words,
                 improve_seo=not no_seo,
                 use_trends=not no_trends,
@@ -525,8 +391,157 @@ def enhance(
 
     except Exception as e:
         console.print(f"[bold red]Error:[/bold red] {e}")
-        raise typer.Exit(code=1) from e
+        return 1
+
+    return 0
+
+
+def _add_command(
+    subparsers: argparse._SubParsersAction[argparse.ArgumentParser],
+    name: str,
+    help: str,
+    description: str,
+    examples: Sequence[str],
+) -> argparse.ArgumentParser:
+    """Add a subcommand whose help ends with usage examples."""
+    return subparsers.add_parser(
+        name,
+        help=help,
+        description=description,
+        epilog="Example:\n" + "\n".join(f"  {example}" for example in examples),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser.
+
+    Returns:
+        Parser whose subcommands set ``handler`` to the function running them.
+    """
+    from pencraft import __version__
+
+    parser = argparse.ArgumentParser(
+        prog="pencraft",
+        description=(
+            "Pencraft - AI-powered blog writing toolkit.\n\n"
+            "Generate professional, well-researched blog posts with AI."
+        ),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "--version",
+        "-v",
+        action="version",
+        version=f"Pencraft version {__version__}",
+        help="Show version and exit",
+    )
+    subparsers = parser.add_subparsers(dest="command", metavar="COMMAND", required=True)
+
+    write = _add_command(
+        subparsers,
+        "write",
+        help="Generate a complete blog post on the given topic",
+        description="Generate a complete blog post on the given topic.",
+        examples=['pencraft write "Introduction to Python" --words 3000 --tags python,programming'],
+    )
+    write.add_argument("topic", help="Topic for the blog post")
+    write.add_argument(
+        "--output", "-o", type=Path, default=Path("./output"), help="Output directory"
+    )
+    write.add_argument("--words", "-w", type=int, default=2000, help="Target word count")
+    write.add_argument("--tags", "-t", help="Comma-separated tags")
+    write.add_argument("--categories", "-c", help="Comma-separated categories")
+    write.add_argument("--author", "-a", help="Author name")
+    write.add_argument("--draft", "-d", action="store_true", help="Mark as draft")
+    write.add_argument("--skip-research", action="store_true", help="Skip research phase")
+    write.add_argument("--cover-image", help="Cover image URL")
+    write.add_argument("--config", dest="config_file", type=Path, help="Path to config file")
+    write.add_argument("--verbose", action="store_true", help="Enable verbose output")
+    write.add_argument("--debug", action="store_true", help="Enable debug mode")
+    write.set_defaults(handler=_cmd_write)
+
+    research = _add_command(
+        subparsers,
+        "research",
+        help="Research a topic without generating a blog post",
+        description="Research a topic without generating a blog post.",
+        examples=['pencraft research "Machine Learning trends 2024"'],
+    )
+    research.add_argument("topic", help="Topic to research")
+    research.add_argument("--output", "-o", type=Path, help="Save research to file")
+    research.add_argument("--config", dest="config_file", type=Path, help="Path to config file")
+    research.add_argument("--verbose", action="store_true", help="Enable verbose output")
+    research.set_defaults(handler=_cmd_research)
+
+    outline = _add_command(
+        subparsers,
+        "outline",
+        help="Generate a blog outline without writing content",
+        description="Generate a blog outline without writing content.",
+        examples=['pencraft outline "Getting Started with Docker" --words 3000'],
+    )
+    outline.add_argument("topic", help="Topic for the outline")
+    outline.add_argument("--words", "-w", type=int, default=2000, help="Target word count")
+    outline.add_argument("--output", "-o", type=Path, help="Save outline to file")
+    outline.add_argument("--config", dest="config_file", type=Path, help="Path to config file")
+    outline.set_defaults(handler=_cmd_outline)
+
+    config = _add_command(
+        subparsers,
+        "config",
+        help="Show or create configuration",
+        description="Show or create configuration.",
+        examples=["pencraft config --show", "pencraft config --init --path my-config.yaml"],
+    )
+    config.add_argument(
+        "--show", "-s", action="store_true", default=True, help="Show current configuration"
+    )
+    config.add_argument("--init", "-i", action="store_true", help="Create a new config file")
+    config.add_argument(
+        "--path", "-p", type=Path, default=Path("pencraft.yaml"), help="Config file path for init"
+    )
+    config.set_defaults(handler=_cmd_config)
+
+    enhance = _add_command(
+        subparsers,
+        "enhance",
+        help="Enhance existing blog posts for SEO, quality, and revenue",
+        description=(
+            "Enhance existing blog posts for SEO, quality, and revenue.\n\n"
+            "Can process a single file or an entire directory of markdown files."
+        ),
+        examples=[
+            "pencraft enhance ./my-blog.md --words 4000",
+            "pencraft enhance ./blogs/ --recursive --words 3000",
+        ],
+    )
+    enhance.add_argument("path", type=Path, help="File or directory to enhance")
+    enhance.add_argument("--words", "-w", type=int, default=3000, help="Minimum target word count")
+    enhance.add_argument("--recursive", "-r", action="store_true", help="Process subdirectories")
+    enhance.add_argument("--no-backup", action="store_true", help="Skip backup of original files")
+    enhance.add_argument("--no-trends", action="store_true", help="Skip Google Trends lookup")
+    enhance.add_argument("--no-seo", action="store_true", help="Skip SEO optimization")
+    enhance.add_argument("--config", dest="config_file", type=Path, help="Path to config file")
+    enhance.add_argument("--verbose", action="store_true", help="Enable verbose output")
+    enhance.set_defaults(handler=_cmd_enhance)
+
+    return parser
+
+
+def app(argv: Sequence[str] | None = None) -> int:
+    """Run the Pencraft command line.
+
+    Args:
+        argv: Arguments without the program name (defaults to ``sys.argv[1:]``).
+
+    Returns:
+        Process exit code.
+    """
+    args = build_parser().parse_args(argv)
+    exit_code: int = args.handler(args)
+    return exit_code
 
 
 if __name__ == "__main__":
-    app()
+    raise SystemExit(app())
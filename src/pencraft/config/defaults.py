@@ -3,6 +3,8 @@
 Optimized for premium, publication-quality blog generation.
 """
 
+import re
+from types import MappingProxyType
 from typing import Any
 
 # Default LLM settings
@@ -15,6 +17,7 @@ DEFAULT_LLM_MAX_TOKENS = 4096
 DEFAULT_MAX_SEARCH_RESULTS = 10
 DEFAULT_MAX_SOURCES = 5
 DEFAULT_SEARCH_DEPTH = 2
+DEFAULT_MAX_PARALLEL_REQUESTS = 4
 
 # Default output settings
 DEFAULT_OUTPUT_DIR = "./output"
@@ -104,35 +107,39 @@ HUMAN-LIKE PROSE:
 Your goal: Every reader should finish and immediately want to share it."""
 
 # Section-specific writing prompts
-SECTION_PROMPTS = {
-    "introduction": "Hook the reader in the first sentence. Establish stakes. Preview value. No throat-clearing.",
-    "body": "One point per paragraph. Concrete examples. Natural flow. Evidence-backed claims.",
-    "conclusion": "Synthesize (don't summarize). So-what for the reader. Strong close. No 'in conclusion'.",
-}
+SECTION_PROMPTS = MappingProxyType(
+    {
+        "introduction": "Hook the reader in the first sentence. Establish stakes. Preview value. No throat-clearing.",
+        "body": "One point per paragraph. Concrete examples. Natural flow. Evidence-backed claims.",
+        "conclusion": "Synthesize (don't summarize). So-what for the reader. Strong close. No 'in conclusion'.",
+    }
+)
 
 # Markdown formatting templates
-MARKDOWN_TEMPLATES = {
-    "blockquote": "> {content}",
-    "code_block": "```{language}\n{content}\n```",
-    "link": "[{text}]({url})",
-    "image": "![{alt}]({url})",
-    "table_header": "| {columns} |",
-    "table_separator": "| {separators} |",
-    "table_row": "| {values} |",
-}
+MARKDOWN_TEMPLATES = MappingProxyType(
+    {
+        "blockquote": "> {content}",
+        "code_block": "```{language}\n{content}\n```",
+        "link": "[{text}]({url})",
+        "image": "![{alt}]({url})",
+        "table_header": "| {columns} |",
+        "table_separator": "| {separators} |",
+        "table_row": "| {values} |",
+    }
+)
 
 # Layout types for dynamic detection
-LAYOUT_TYPES = [
+LAYOUT_TYPES = (
     "deep-dive",  # Complex exploratory analysis
     "narrative",  # Story-driven, personal
     "analytical",  # Data-focused comparison
     "how-to",  # Step-by-step practical guide
     "opinion",  # Argument with evidence
     "listicle",  # Numbered insights (use sparingly)
-]
+)
 
 # Words/phrases to avoid for human-like content
-AI_DETECTOR_BLACKLIST = [
+AI_DETECTOR_BLACKLIST = (
     "Furthermore",
     "Additionally",
     "Moreover",
@@ -148,4 +155,9 @@ AI_DETECTOR_BLACKLIST = [
     "It goes without saying",
     "Needless to say",
     "As we've discussed",
-]
+)
+
+# All blacklisted phrases as whole words, matched case-insensitively in one scan
+AI_DETECTOR_PATTERN = re.compile(
+    r"\b(?:" + "|".join(map(re.escape, AI_DETECTOR_BLACKLIST)) + r")\b", re.IGNORECASE
+)
@@ -7,7 +7,6 @@ from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-import yaml
 from pydantic import BaseModel, Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -18,6 +17,7 @@ from pencraft.config.defaults import (
     DEFAULT_LLM_MAX_TOKENS,
     DEFAULT_LLM_MODEL,
     DEFAULT_LLM_TEMPERATURE,
+    DEFAULT_MAX_PARALLEL_REQUESTS,
     DEFAULT_MAX_SEARCH_RESULTS,
     DEFAULT_MAX_SOURCES,
     DEFAULT_OUTPUT_DIR,
@@ -44,6 +44,10 @@ class LLMSettings(BaseModel):
         default=DEFAULT_LLM_MODEL,
         description="Model to use for generation",
     )
+    reformatter_model: str | None = Field(
+        default=None,
+        description="Smaller model for mechanical reformatting calls (None uses model)",
+    )
     temperature: float = Field(
         default=DEFAULT_LLM_TEMPERATURE,
         ge=0.0,
@@ -65,6 +69,33 @@ class LLMSettings(BaseModel):
         ge=0,
         description="Maximum number of retries for failed requests",
     )
+    requests_per_second: float | None = Field(
+        default=None,
+        gt=0,
+        description="Client-side request rate limit (None disables; halves on 429, then recovers)",
+    )
+    max_concurrency: int | None = Field(
+        default=None,
+        gt=0,
+        description="Maximum LLM requests in flight at once (None disables)",
+    )
+    pool_size: int | None = Field(
+        default=None,
+        gt=0,
+        description="Keep-alive connections per client pool (None uses the SDK default)",
+    )
+    extra_body: dict[str, Any] | None = Field(
+        default=None,
+        description="Provider-specific fields merged into every request body",
+    )
+    stream: bool = Field(
+        default=False,
+        description="Stream all completions (tokens arrive incrementally; avoids read timeouts)",
+    )
+    supports_json_schema: bool = Field(
+        default=False,
+        description="Backend enforces response_format json_schema (outlines in a single call)",
+    )
 
 
 class ResearchSettings(BaseModel):
@@ -90,6 +121,31 @@ class ResearchSettings(BaseModel):
         default=True,
         description="Include text snippets from sources",
     )
+    detect_retrieval_necessity: bool = Field(
+        default=False,
+        description="Ask the model first and skip scraping/synthesis for topics it already knows",
+    )
+    max_parallel_requests: int = Field(
+        default=DEFAULT_MAX_PARALLEL_REQUESTS,
+        gt=0,
+        description="Maximum searches or scrapes in flight at once during research",
+    )
+    context_tokens: int | None = Field(
+        default=None,
+        gt=0,
+        description=(
+            "Token budget for scraped page text in the synthesis prompt, shared between "
+            "pages (None quotes the first 2000 characters of each page)"
+        ),
+    )
+    requests_per_second: float | None = Field(
+        default=None,
+        gt=0,
+        description=(
+            "Client-side limit on searches and scrapes per second, lowered automatically "
+            "when providers rate limit (None disables pacing)"
+        ),
+    )
 
 
 class OutputSettings(BaseModel):
@@ -167,6 +223,20 @@ class BlogSettings(BaseModel):
         default_factory=list,
         description="Default categories for all posts",
     )
+    allow_parallel_sections: bool = Field(
+        default=False,
+        description=(
+            "Write all body sections at once in async runs, each seeing only the "
+            "introduction instead of the sections before it"
+        ),
+    )
+    batch_sections: bool = Field(
+        default=False,
+        description=(
+            "Write all body sections in one JSON request when they fit in llm.max_tokens, "
+            "instead of one request per section"
+        ),
+    )
 
 
 class PromptSettings(BaseModel):
@@ -186,6 +256,28 @@ class PromptSettings(BaseModel):
     )
 
 
+class CacheSettings(BaseModel):
+    """Settings for the on-disk result cache."""
+
+    enabled: bool = Field(
+        default=False,
+        description="Cache research and outline results on disk between runs",
+    )
+    directory: str = Field(
+        default=".pencraft-cache",
+        description="Directory for cached results",
+    )
+    llm_responses: bool = Field(
+        default=False,
+        description="Also cache individual LLM completions by prompt (reruns repeat them)",
+    )
+    ttl_seconds: float | None = Field(
+        default=None,
+        gt=0,
+        description="Seconds before a cached entry is stale and regenerated (None = never)",
+    )
+
+
 class Settings(BaseSettings):
     """Main settings class for Pencraft."""
 
@@ -203,6 +295,7 @@ class Settings(BaseSettings):
     hugo: HugoSettings = Field(default_factory=HugoSettings)
     blog: BlogSettings = Field(default_factory=BlogSettings)
     prompts: PromptSettings = Field(default_factory=PromptSettings)
+    cache: CacheSettings = Field(default_factory=CacheSettings)
 
     # General settings
     verbose: bool = Field(
@@ -227,9 +320,14 @@ class Settings(BaseSettings):
         if config_file:
             config_path = Path(config_file)
             if config_path.exists():
+                import yaml
+
+                # libyaml's C loader parses an order of magnitude faster when present
+                loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
                 with open(config_path, encoding="utf-8") as f:
                     if config_path.suffix in (".yaml", ".yml"):
-                        file_config = yaml.safe_load(f) or {}
+                        file_config = yaml.load(f, Loader=loader) or {}
                     else:
                         raise ValueError(f"Unsupported config format: {config_path.suffix}")
 
@@ -246,6 +344,8 @@ class Settings(BaseSettings):
 
     def save_to_file(self, path: str | Path) -> None:
         """Save settings to a YAML file."""
+        import yaml
+
         path = Path(path)
         with open(path, "w", encoding="utf-8") as f:
             yaml.dump(self.to_dict(), f, default_flow_style=False, sort_keys=False)
@@ -258,7 +358,39 @@ def get_settings() -> Settings:
 
 
 def load_settings(config_file: str | Path | None = None, **overrides: Any) -> Settings:
-    """Load settings with optional config file and overrides."""
+    """Load settings with optional config file and overrides.
+
+    Loads are cached on the overrides, the ``PENCRAFT_*`` environment and the
+    config file's modification time, so repeated calls skip reading the file
+    and validating. Each call returns its own copy that callers may modify.
+    """
     if config_file:
         overrides["config_file"] = str(config_file)
-    return Settings(**overrides)
+
+    items = tuple(sorted(overrides.items()))
+    try:
+        hash(items)
+    except TypeError:
+        # Unhashable overrides (e.g. dicts for nested settings) aren't cached
+        return Settings(**overrides)
+
+    environment = tuple(
+        sorted((k, v) for k, v in os.environ.items() if k.upper().startswith("PENCRAFT_"))
+    )
+    config_path = overrides.get("config_file") or os.environ.get("PENCRAFT_CONFIG_FILE")
+    try:
+        mtime_ns = Path(config_path).stat().st_mtime_ns if config_path else 0
+    except OSError:
+        mtime_ns = -1
+
+    return _load_settings_cached(items, environment, mtime_ns).model_copy(deep=True)
+
+
+@lru_cache(maxsize=8)
+def _load_settings_cached(
+    items: tuple[tuple[str, Any], ...],
+    _environment: tuple[tuple[str, str], ...],
+    _mtime_ns: int,
+) -> Settings:
+    """Build settings for load_settings(); the environment and mtime only key the cache."""
+    return Settings(**dict(items))
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import re
 import shutil
@@ -20,6 +19,8 @@ from pencraft.agents.enhancement_prompts import (
 from pencraft.formatters.frontmatter import FrontmatterGenerator
 from pencraft.llm.client import LLMClient
 from pencraft.tools.trends import TrendsData, TrendsTool
+from pencraft.utils import serialization
+from pencraft.utils.text import count_words
 
 if TYPE_CHECKING:
     from pencraft.config.settings import Settings
@@ -117,8 +118,7 @@ class BlogEnhancer:
         text_no_code = re.sub(r"```[\s\S]*?```", "", text)
         text_no_code = re.sub(r"`[^`]+`", "", text_no_code)
         # Count words
-        words = text_no_code.split()
-        return len(words)
+        return count_words(text_no_code)
 
     def _extract_title_from_content(self, content: str) -> str:
         """Extract title from frontmatter or first heading."""
@@ -399,12 +399,12 @@ class BlogEnhancer:
             # Find JSON in response
             json_match = re.search(r"\{[\s\S]*\}", response)
             if json_match:
-                data = json.loads(json_match.group())
+                data = serialization.loads(json_match.group())
                 return (
                     data.get("tags", current_tags),
                     data.get("categories", current_categories),
                 )
-        except json.JSONDecodeError:
+        except serialization.JSONDecodeError:
             logger.warning("Failed to parse tags suggestion")
 
         return current_tags, current_categories
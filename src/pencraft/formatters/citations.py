@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any
+from typing import Any, ClassVar
 
 
 @dataclass
@@ -38,15 +39,23 @@ class CitationFormatter:
     Supports multiple citation styles and formats.
     """
 
-    def __init__(self, style: str = "markdown") -> None:
+    # Style name -> formatter, filled in below the formatter methods
+    _STYLE_FORMATTERS: ClassVar[dict[str, Callable[[CitationFormatter, Citation, int], str]]]
+
+    def __init__(
+        self,
+        style: str = "markdown",
+        citations: list[Citation] | None = None,
+    ) -> None:
         """Initialize the citation formatter.
 
         Args:
             style: Citation style (markdown, apa, mla, chicago).
+            citations: Already parsed citations (see parse()).
         """
         self.style = style.lower()
-        self._citations: list[Citation] = []
-        self._citation_counter = 0
+        self._citations: list[Citation] = list(citations) if citations else []
+        self._citation_counter = len(self._citations)
 
     def add_citation(self, citation: Citation | dict[str, Any]) -> int:
         """Add a citation and return its reference number.
@@ -92,26 +101,21 @@ class CitationFormatter:
             # Default to superscript style
             return f"<sup>{ref_num}</sup>"
 
-    def format_citation(self, citation: Citation, ref_num: int) -> str:
+    def format_citation(self, citation: Citation, ref_num: int, style: str | None = None) -> str:
         """Format a single citation.
 
         Args:
             citation: Citation to format.
             ref_num: Reference number.
+            style: Citation style (defaults to the formatter's style).
 
         Returns:
             Formatted citation string.
         """
-        if self.style == "markdown":
-            return self._format_markdown(citation, ref_num)
-        elif self.style == "apa":
-            return self._format_apa(citation, ref_num)
-        elif self.style == "mla":
-            return self._format_mla(citation, ref_num)
-        elif self.style == "chicago":
-            return self._format_chicago(citation, ref_num)
-        else:
-            return self._format_markdown(citation, ref_num)
+        formatter = self._STYLE_FORMATTERS.get(
+            style.lower() if style else self.style, CitationFormatter._format_markdown
+        )
+        return formatter(self, citation, ref_num)
 
     def _format_markdown(self, citation: Citation, ref_num: int) -> str:
         """Format citation in markdown footnote style.
@@ -224,11 +228,21 @@ class CitationFormatter:
 
         return f"{ref_num}. " + " ".join(parts)
 
-    def generate_references_section(self, heading: str = "References") -> str:
+    _STYLE_FORMATTERS = {
+        "markdown": _format_markdown,
+        "apa": _format_apa,
+        "mla": _format_mla,
+        "chicago": _format_chicago,
+    }
+
+    def generate_references_section(
+        self, heading: str = "References", style: str | None = None
+    ) -> str:
         """Generate the full references section.
 
         Args:
             heading: Section heading.
+            style: Citation style (defaults to the formatter's style).
 
         Returns:
             Complete references section markdown.
@@ -239,11 +253,25 @@ class CitationFormatter:
         lines = [f"## {heading}", ""]
 
         for i, citation in enumerate(self._citations, 1):
-            lines.append(self.format_citation(citation, i))
+            lines.append(self.format_citation(citation, i, style))
             lines.append("")
 
         return "\n".join(lines)
 
+    def render(self, style: str | None = None, heading: str = "References") -> str:
+        """Render the references section in a given style.
+
+        Citations are parsed once and can be rendered in any number of styles.
+
+        Args:
+            style: Citation style (defaults to the formatter's style).
+            heading: Section heading.
+
+        Returns:
+            Complete references section markdown.
+        """
+        return self.generate_references_section(heading, style)
+
     def generate_footnotes(self) -> str:
         """Generate footnotes for markdown style.
 
@@ -269,6 +297,28 @@ class CitationFormatter:
         """Get all citations."""
         return self._citations.copy()
 
+    @staticmethod
+    def parse(sources: list[dict[str, Any]]) -> list[Citation]:
+        """Parse source dictionaries into citations.
+
+        Args:
+            sources: List of source dictionaries.
+
+        Returns:
+            List of Citation objects.
+        """
+        return [
+            Citation(
+                title=source.get("title", "Untitled"),
+                url=source.get("url", ""),
+                author=source.get("author", ""),
+                date=source.get("date", ""),
+                publisher=source.get("publisher", source.get("source", "")),
+                description=source.get("description", source.get("snippet", "")),
+            )
+            for source in sources
+        ]
+
     @classmethod
     def from_sources(
         cls,
@@ -284,17 +334,4 @@ class CitationFormatter:
         Returns:
             CitationFormatter with citations added.
         """
-        formatter = cls(style=style)
-
-        for source in sources:
-            citation = Citation(
-                title=source.get("title", "Untitled"),
-                url=source.get("url", ""),
-                author=source.get("author", ""),
-                date=source.get("date", ""),
-                publisher=source.get("publisher", source.get("source", "")),
-                description=source.get("description", source.get("snippet", "")),
-            )
-            formatter.add_citation(citation)
-
-        return formatter
+        return cls(style=style, citations=cls.parse(sources))
@@ -7,6 +7,22 @@ from typing import Any
 
 import yaml
 
+from pencraft.utils import serialization
+
+
+class HugoDumper(yaml.SafeDumper):
+    """YAML dumper producing Hugo-friendly frontmatter."""
+
+
+def _str_representer(dumper: yaml.SafeDumper, data: str) -> yaml.ScalarNode:
+    """Force all strings to be unquoted single-line (no folding/literal blocks)."""
+    # Replace newlines with spaces to force single line
+    clean_data = data.replace("\n", " ").strip()
+    return dumper.represent_scalar("tag:yaml.org,2002:str", clean_data)
+
+
+HugoDumper.add_representer(str, _str_representer)
+
 
 class FrontmatterGenerator:
     """Generator for Hugo-compatible frontmatter.
@@ -32,6 +48,13 @@ class FrontmatterGenerator:
         if self.format not in ("yaml", "toml", "json"):
             raise ValueError(f"Unsupported format: {self.format}")
 
+        # Default fields are the same for every post, so render their YAML once
+        self._default_yaml: dict[str, str] = {}
+        if self.format == "yaml":
+            self._default_yaml = {
+                key: self._dump_yaml({key: value}) for key, value in self.default_fields.items()
+            }
+
     def generate(
         self,
         title: str,
@@ -108,6 +131,9 @@ class FrontmatterGenerator:
         if toc:
             fm["toc"] = toc
 
+        if self.format == "yaml":
+            return self._generate_yaml(fm, extra_fields)
+
         # Add default fields (only if not already set)
         for key, value in self.default_fields.items():
             if key not in fm:
@@ -119,6 +145,40 @@ class FrontmatterGenerator:
         # Format output
         return self._format_frontmatter(fm)
 
+    def _generate_yaml(self, fm: dict[str, Any], extra_fields: dict[str, Any]) -> str:
+        """Render YAML frontmatter, reusing the pre-rendered default fields.
+
+        Produces the same output as merging defaults and extra fields into
+        ``fm`` and formatting the result, without re-serializing the defaults.
+
+        Args:
+            fm: Per-post fields.
+            extra_fields: Additional fields (override matching keys in place).
+
+        Returns:
+            YAML frontmatter with --- delimiters.
+        """
+        fields = {key: extra_fields.get(key, value) for key, value in fm.items()}
+        fragments = [self._dump_yaml(fields)]
+
+        for key in self.default_fields:
+            if key in fm:
+                continue
+            if key in extra_fields:
+                fragments.append(self._dump_yaml({key: extra_fields[key]}))
+            else:
+                fragments.append(self._default_yaml[key])
+
+        remaining = {
+            key: value
+            for key, value in extra_fields.items()
+            if key not in fm and key not in self.default_fields
+        }
+        if remaining:
+            fragments.append(self._dump_yaml(remaining))
+
+        return "---\n" + "".join(fragments) + "---\n"
+
     def _format_frontmatter(self, data: dict[str, Any]) -> str:
         """Format frontmatter dictionary to string.
 
@@ -144,19 +204,18 @@ class FrontmatterGenerator:
         Returns:
             YAML frontmatter with --- delimiters.
         """
+        return f"---\n{self._dump_yaml(data)}---\n"
 
-        # Custom Dumper to ensure proper list indentation for Hugo compatibility
-        class HugoDumper(yaml.SafeDumper):
-            pass
-
-        # Force all strings to be unquoted single-line (no folding/literal blocks)
-        def str_representer(dumper, data):  # type: ignore[no-untyped-def]
-            # Replace newlines with spaces to force single line
-            clean_data = data.replace("\n", " ").strip()
-            return dumper.represent_scalar("tag:yaml.org,2002:str", clean_data)
+    @staticmethod
+    def _dump_yaml(data: dict[str, Any]) -> str:
+        """Serialize fields to Hugo-compatible YAML (without delimiters).
 
-        HugoDumper.add_representer(str, str_representer)
+        Args:
+            data: Frontmatter data.
 
+        Returns:
+            YAML text ending with a newline.
+        """
         yaml_str = yaml.dump(
             data,
             Dumper=HugoDumper,
@@ -195,8 +254,7 @@ class FrontmatterGenerator:
 
             fixed_lines.append(line)
 
-        yaml_str = "\n".join(fixed_lines)
-        return f"---\n{yaml_str}---\n"
+        return "\n".join(fixed_lines)
 
     def _format_toml(self, data: dict[str, Any]) -> str:
         """Format as TOML frontmatter.
@@ -232,10 +290,7 @@ class FrontmatterGenerator:
         Returns:
             JSON frontmatter with braces.
         """
-        import json
-
-        json_str = json.dumps(data, indent=2, ensure_ascii=False)
-        return json_str + "\n"
+        return serialization.dumps(data, indent=True) + "\n"
 
     def parse(self, content: str) -> tuple[dict[str, Any], str]:
         """Parse frontmatter from markdown content.
@@ -285,14 +340,12 @@ class FrontmatterGenerator:
                         break
 
             if end > 0:
-                import json
-
                 json_content = content[: end + 1]
                 body = content[end + 1 :].strip()
                 try:
-                    fm = json.loads(json_content)
+                    fm = serialization.loads(json_content)
                     return fm, body
-                except json.JSONDecodeError:
+                except serialization.JSONDecodeError:
                     pass
 
         # No frontmatter found
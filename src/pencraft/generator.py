@@ -2,21 +2,29 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from collections.abc import Callable
+import os
+import threading
+import time
+from collections.abc import Callable, Iterable, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 
 from pencraft.agents.planner import BlogOutline, PlannerAgent
 from pencraft.agents.research import ResearchAgent
 from pencraft.agents.writer import WriterAgent
+from pencraft.cache import DiskCache
 from pencraft.formatters.frontmatter import FrontmatterGenerator
 from pencraft.formatters.markdown import MarkdownFormatter
 from pencraft.llm.client import LLMClient
+from pencraft.utils.singleflight import SingleFlight
+from pencraft.utils.text import count_words
 
 if TYPE_CHECKING:
+    from pencraft.agents.base import AgentResult
     from pencraft.config.settings import Settings
 
 logger = logging.getLogger(__name__)
@@ -51,11 +59,39 @@ class GeneratedBlog:
         }
 
 
+@dataclass
+class _GenerationJob:
+    """Resolved arguments and intermediate results for one post."""
+
+    topic: str
+    additional_context: str
+    target_word_count: int
+    tags: list[str]
+    categories: list[str]
+    author: str | None
+    draft: bool
+    output_dir: str | Path | None
+    filename: str | None
+    skip_research: bool
+    custom_outline: BlogOutline | None
+    custom_research: str | None
+    cover_image: str | None
+    start_time: float
+    research_summary: str = ""
+    sources: list[dict[str, Any]] = field(default_factory=list)
+    outline: BlogOutline | None = None
+
+
 class BlogGenerator:
     """Main generator that orchestrates research, planning, and writing.
 
     This is the primary interface for generating complete blog posts
     from a given topic.
+
+    One generator can serve many concurrent ``agenerate()`` calls. Settings,
+    agents and caches are validated once here and shared by reference; the
+    state of each post lives in its own job object. Progress callbacks are
+    set on the shared agents, so concurrent calls should pass the same one.
     """
 
     def __init__(
@@ -81,10 +117,25 @@ class BlogGenerator:
 
         self.llm = llm_client
 
+        # Coalesces identical research calls across concurrent agenerate() runs
+        self.single_flight = SingleFlight()
+
+        # Persistent research/outline cache (opt-in via settings.cache)
+        self.cache = (
+            DiskCache(settings.cache.directory, ttl=settings.cache.ttl_seconds)
+            if settings.cache.enabled
+            else None
+        )
+
         # Initialize agents
-        self.research_agent = ResearchAgent(llm_client=self.llm, settings=settings)
-        self.planner_agent = PlannerAgent(llm_client=self.llm, settings=settings)
-        self.writer_agent = WriterAgent(llm_client=self.llm, settings=settings)
+        self.research_agent = ResearchAgent(
+            llm_client=self.llm,
+            settings=settings,
+            single_flight=self.single_flight,
+            cache=self.cache,
+        )
+        self.planner_agent = PlannerAgent(llm_client=self.llm, settings=settings, cache=self.cache)
+        self.writer_agent = WriterAgent(llm_client=self.llm, settings=settings, cache=self.cache)
 
         # Initialize formatters
         self.frontmatter_gen = FrontmatterGenerator(
@@ -93,14 +144,29 @@ class BlogGenerator:
         )
         self.md_formatter = MarkdownFormatter()
 
+    async def aclose(self) -> None:
+        """Release the connections held by the research tools.
+
+        The LLM client is left open: it may be shared, and is closed by its owner.
+        """
+        await self.research_agent.aclose()
+
+    async def __aenter__(self) -> BlogGenerator:
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        """Async context manager exit."""
+        await self.aclose()
+
     def generate(
         self,
         topic: str,
         *,
         additional_context: str = "",
         target_word_count: int | None = None,
-        tags: list[str] | None = None,
-        categories: list[str] | None = None,
+        tags: Sequence[str] | None = None,
+        categories: Sequence[str] | None = None,
         author: str | None = None,
         draft: bool = False,
         output_dir: str | Path | None = None,
@@ -132,17 +198,15 @@ class BlogGenerator:
         Returns:
             GeneratedBlog with complete content.
         """
-        import time
-
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         logger.info(f"Starting blog generation for: {topic}")
 
         target_word_count = target_word_count or self.settings.blog.min_word_count
-        tags = tags or self.settings.blog.default_tags.copy()
-        target_word_count = target_word_count or self.settings.blog.min_word_count
-        tags = tags or self.settings.blog.default_tags.copy()
-        categories = categories or self.settings.blog.default_categories.copy()
+        tags = list(tags) if tags else self.settings.blog.default_tags.copy()
+        categories = (
+            list(categories) if categories else self.settings.blog.default_categories.copy()
+        )
         cover_image = cover_image or self.settings.blog.default_cover_image
 
         # Assign progress callback to agents
@@ -167,7 +231,9 @@ class BlogGenerator:
                 additional_context=additional_context,
             )
             if not research_result.success:
-                raise RuntimeError(f"Research failed: {research_result.error}")
+                raise RuntimeError(
+                    f"Research failed: {research_result.error}"
+                ) from research_result.exception
 
             research_summary = research_result.content
             sources = research_result.metadata.get("research_data", {}).get("sources", [])
@@ -187,53 +253,41 @@ class BlogGenerator:
                 suggested_categories=categories,
             )
             if not outline_result.success:
-                raise RuntimeError(f"Planning failed: {outline_result.error}")
+                raise RuntimeError(
+                    f"Planning failed: {outline_result.error}"
+                ) from outline_result.exception
 
             outline_data = outline_result.metadata.get("outline", {})
             outline = self._dict_to_outline(outline_data)
             logger.info(f"Outline created: {len(outline.sections)} sections")
 
-        # Phase 3: Writing
+        # Phase 3: Writing (streamed to a draft file next to the output)
         logger.info("Phase 3: Writing content...")
+        draft_path = self._draft_path(outline.title, output_dir, filename)
         write_result = self.writer_agent.execute(
             outline=outline,
             research_summary=research_summary,
             sources=sources,
+            draft_path=draft_path,
         )
         if not write_result.success:
-            raise RuntimeError(f"Writing failed: {write_result.error}")
+            raise RuntimeError(f"Writing failed: {write_result.error}") from write_result.exception
 
         blog_content = write_result.content
-        word_count = len(blog_content.split())
+        word_count = self._written_word_count(write_result)
         logger.info(f"Writing complete: {word_count} words")
 
-        # Generate frontmatter
-        frontmatter = self.frontmatter_gen.generate(
-            title=outline.title,
-            description=outline.meta_description,
-            date=datetime.now(),
+        # Add frontmatter, title and optional TOC
+        frontmatter, blog_content, full_content = self._render_post(
+            outline,
+            blog_content,
             draft=draft,
-            tags=outline.tags or tags,
-            categories=outline.categories or categories,
+            tags=tags,
+            categories=categories,
             author=author,
-            slug=self.md_formatter.slugify(outline.title),
-            toc=self.settings.blog.include_toc,
-            featured_image=cover_image,
+            cover_image=cover_image,
         )
 
-        # Add optional TOC
-        if self.settings.blog.include_toc:
-            toc = self.md_formatter.generate_toc(blog_content)
-            blog_content = f"# {outline.title}\n\n{toc}\n\n{blog_content}"
-        else:
-            blog_content = f"# {outline.title}\n\n{blog_content}"
-
-        # Combine frontmatter and content
-        full_content = frontmatter + "\n" + blog_content
-
-        # Clean up content
-        full_content = self.md_formatter.clean_content(full_content)
-
         # Save to file if output directory provided
         file_path = None
         if output_dir:
@@ -244,8 +298,10 @@ class BlogGenerator:
                 filename=filename,
             )
             logger.info(f"Saved to: {file_path}")
+        if draft_path is not None:
+            draft_path.unlink(missing_ok=True)
 
-        generation_time = time.time() - start_time
+        generation_time = time.perf_counter() - start_time
 
         logger.info(f"Blog generation complete in {generation_time:.2f}s")
 
@@ -268,8 +324,8 @@ class BlogGenerator:
         *,
         additional_context: str = "",
         target_word_count: int | None = None,
-        tags: list[str] | None = None,
-        categories: list[str] | None = None,
+        tags: Sequence[str] | None = None,
+        categories: Sequence[str] | None = None,
         author: str | None = None,
         draft: bool = False,
         output_dir: str | Path | None = None,
@@ -284,104 +340,226 @@ class BlogGenerator:
 
         Same args as generate().
         """
-        import time
-
-        start_time = time.time()
-
         logger.info(f"Starting async blog generation for: {topic}")
 
-        target_word_count = target_word_count or self.settings.blog.min_word_count
-        tags = tags or self.settings.blog.default_tags.copy()
-        categories = categories or self.settings.blog.default_categories.copy()
-        cover_image = cover_image or self.settings.blog.default_cover_image
+        job = self._make_job(
+            topic,
+            additional_context=additional_context,
+            target_word_count=target_word_count,
+            tags=tags,
+            categories=categories,
+            author=author,
+            draft=draft,
+            output_dir=output_dir,
+            filename=filename,
+            skip_research=skip_research,
+            custom_outline=custom_outline,
+            custom_research=custom_research,
+            cover_image=cover_image,
+        )
 
         # Assign progress callback to agents
         if progress_callback:
-            self.research_agent.on_progress = progress_callback
-            self.planner_agent.on_progress = progress_callback
-            self.writer_agent.on_progress = progress_callback
+            self._set_progress_callback(progress_callback)
 
-        # Phase 1: Research
-        if custom_research:
-            research_summary = custom_research
-            sources: list[dict[str, Any]] = []
-        elif skip_research:
-            research_summary = f"Topic: {topic}\n\n{additional_context}"
-            sources = []
+        await self._aresearch_stage(job)
+        await self._aplan_stage(job)
+        return await self._awrite_stage(job)
+
+    async def agenerate_pipelined(
+        self,
+        jobs: Iterable[dict[str, Any]],
+        *,
+        queue_size: int = 2,
+        progress_callback: Callable[[str], None] | None = None,
+    ) -> list[GeneratedBlog | Exception]:
+        """Generate several posts with research, planning and writing overlapped.
+
+        Each stage runs as its own worker connected by bounded queues, so the
+        next topic is researched and planned while the current one is being
+        written. Throughput is bound by the slowest stage (usually writing)
+        rather than the sum of all three.
+
+        Args:
+            jobs: Keyword arguments for each post, as accepted by agenerate()
+                (except progress_callback).
+            queue_size: Maximum posts waiting between two stages.
+            progress_callback: Callback for progress updates.
+
+        Returns:
+            One entry per job, in input order: the GeneratedBlog, or the
+            exception that stopped that post.
+        """
+        specs = list(jobs)
+        results: list[GeneratedBlog | Exception | None] = [None] * len(specs)
+        plan_queue: asyncio.Queue[tuple[int, _GenerationJob] | None] = asyncio.Queue(queue_size)
+        write_queue: asyncio.Queue[tuple[int, _GenerationJob] | None] = asyncio.Queue(queue_size)
+
+        if progress_callback:
+            self._set_progress_callback(progress_callback)
+
+        async def research_worker() -> None:
+            for index, spec in enumerate(specs):
+                try:
+                    job = self._make_job(**spec)
+                    await self._aresearch_stage(job)
+                except Exception as e:
+                    results[index] = e
+                    continue
+                await plan_queue.put((index, job))
+            await plan_queue.put(None)
+
+        async def plan_worker() -> None:
+            while (item := await plan_queue.get()) is not None:
+                index, job = item
+                try:
+                    await self._aplan_stage(job)
+                except Exception as e:
+                    results[index] = e
+                    continue
+                await write_queue.put(item)
+            await write_queue.put(None)
+
+        async def write_worker() -> None:
+            while (item := await write_queue.get()) is not None:
+                index, job = item
+                try:
+                    results[index] = await self._awrite_stage(job)
+                except Exception as e:
+                    results[index] = e
+
+        await asyncio.gather(research_worker(), plan_worker(), write_worker())
+        # Every spec ends in a blog or an error; dropping a gap would misalign the rest
+        missing = [index for index, result in enumerate(results) if result is None]
+        if missing:
+            raise RuntimeError(f"Pipeline produced no result for specs {missing}")
+        return cast(list[GeneratedBlog | Exception], results)
+
+    def _make_job(
+        self,
+        topic: str,
+        *,
+        additional_context: str = "",
+        target_word_count: int | None = None,
+        tags: Sequence[str] | None = None,
+        categories: Sequence[str] | None = None,
+        author: str | None = None,
+        draft: bool = False,
+        output_dir: str | Path | None = None,
+        filename: str | None = None,
+        skip_research: bool = False,
+        custom_outline: BlogOutline | None = None,
+        custom_research: str | None = None,
+        cover_image: str | None = None,
+    ) -> _GenerationJob:
+        """Resolve generation arguments against settings defaults."""
+        return _GenerationJob(
+            topic=topic,
+            additional_context=additional_context,
+            target_word_count=target_word_count or self.settings.blog.min_word_count,
+            tags=list(tags) if tags else self.settings.blog.default_tags.copy(),
+            categories=(
+                list(categories) if categories else self.settings.blog.default_categories.copy()
+            ),
+            author=author,
+            draft=draft,
+            output_dir=output_dir,
+            filename=filename,
+            skip_research=skip_research,
+            custom_outline=custom_outline,
+            custom_research=custom_research,
+            cover_image=cover_image or self.settings.blog.default_cover_image,
+            start_time=time.perf_counter(),
+        )
+
+    def _set_progress_callback(self, progress_callback: Callable[[str], None]) -> None:
+        """Route progress updates from every agent to a callback."""
+        self.research_agent.on_progress = progress_callback
+        self.planner_agent.on_progress = progress_callback
+        self.writer_agent.on_progress = progress_callback
+
+    async def _aresearch_stage(self, job: _GenerationJob) -> None:
+        """Phase 1: research the topic (fills research_summary and sources)."""
+        if job.custom_research:
+            job.research_summary = job.custom_research
+        elif job.skip_research:
+            job.research_summary = f"Topic: {job.topic}\n\n{job.additional_context}"
         else:
             research_result = await self.research_agent.aexecute(
-                topic=topic,
-                additional_context=additional_context,
+                topic=job.topic,
+                additional_context=job.additional_context,
             )
             if not research_result.success:
-                raise RuntimeError(f"Research failed: {research_result.error}")
+                raise RuntimeError(
+                    f"Research failed: {research_result.error}"
+                ) from research_result.exception
+
+            job.research_summary = research_result.content
+            job.sources = research_result.metadata.get("research_data", {}).get("sources", [])
+
+    async def _aplan_stage(self, job: _GenerationJob) -> None:
+        """Phase 2: create the outline."""
+        if job.custom_outline:
+            job.outline = job.custom_outline
+            return
+
+        outline_result = await self.planner_agent.aexecute(
+            topic=job.topic,
+            research_summary=job.research_summary,
+            target_word_count=job.target_word_count,
+            suggested_tags=job.tags,
+            suggested_categories=job.categories,
+        )
+        if not outline_result.success:
+            raise RuntimeError(
+                f"Planning failed: {outline_result.error}"
+            ) from outline_result.exception
 
-            research_summary = research_result.content
-            sources = research_result.metadata.get("research_data", {}).get("sources", [])
+        outline_data = outline_result.metadata.get("outline", {})
+        job.outline = self._dict_to_outline(outline_data)
 
-        # Phase 2: Planning
-        if custom_outline:
-            outline = custom_outline
-        else:
-            outline_result = await self.planner_agent.aexecute(
-                topic=topic,
-                research_summary=research_summary,
-                target_word_count=target_word_count,
-                suggested_tags=tags,
-                suggested_categories=categories,
-            )
-            if not outline_result.success:
-                raise RuntimeError(f"Planning failed: {outline_result.error}")
-
-            outline_data = outline_result.metadata.get("outline", {})
-            outline = self._dict_to_outline(outline_data)
+    async def _awrite_stage(self, job: _GenerationJob) -> GeneratedBlog:
+        """Phase 3: write, format and save the post."""
+        outline = job.outline
+        assert outline is not None, "planning stage must run before writing"
 
-        # Phase 3: Writing
+        draft_path = self._draft_path(outline.title, job.output_dir, job.filename)
         write_result = await self.writer_agent.aexecute(
             outline=outline,
-            research_summary=research_summary,
-            sources=sources,
+            research_summary=job.research_summary,
+            sources=job.sources,
+            draft_path=draft_path,
         )
         if not write_result.success:
-            raise RuntimeError(f"Writing failed: {write_result.error}")
+            raise RuntimeError(f"Writing failed: {write_result.error}") from write_result.exception
 
         blog_content = write_result.content
-        word_count = len(blog_content.split())
-
-        # Generate frontmatter
-        frontmatter = self.frontmatter_gen.generate(
-            title=outline.title,
-            description=outline.meta_description,
-            date=datetime.now(),
-            draft=draft,
-            tags=outline.tags or tags,
-            categories=outline.categories or categories,
-            author=author,
-            slug=self.md_formatter.slugify(outline.title),
-            toc=self.settings.blog.include_toc,
-            featured_image=cover_image,
+        word_count = self._written_word_count(write_result)
+
+        frontmatter, blog_content, full_content = self._render_post(
+            outline,
+            blog_content,
+            draft=job.draft,
+            tags=job.tags,
+            categories=job.categories,
+            author=job.author,
+            cover_image=job.cover_image,
         )
 
-        # Add TOC if enabled
-        if self.settings.blog.include_toc:
-            toc = self.md_formatter.generate_toc(blog_content)
-            blog_content = f"# {outline.title}\n\n{toc}\n\n{blog_content}"
-        else:
-            blog_content = f"# {outline.title}\n\n{blog_content}"
-
-        full_content = frontmatter + "\n" + blog_content
-        full_content = self.md_formatter.clean_content(full_content)
-
         file_path = None
-        if output_dir:
-            file_path = self._save_to_file(
+        if job.output_dir:
+            # Write in a worker thread so concurrent generations don't stall the event loop
+            file_path = await asyncio.to_thread(
+                self._save_to_file,
                 content=full_content,
                 title=outline.title,
-                output_dir=Path(output_dir),
-                filename=filename,
+                output_dir=Path(job.output_dir),
+                filename=job.filename,
             )
+        if draft_path is not None:
+            draft_path.unlink(missing_ok=True)
 
-        generation_time = time.time() - start_time
+        generation_time = time.perf_counter() - job.start_time
 
         return GeneratedBlog(
             title=outline.title,
@@ -390,12 +568,101 @@ class BlogGenerator:
             full_content=full_content,
             file_path=str(file_path) if file_path else None,
             outline=outline,
-            research_summary=research_summary,
-            sources=sources,
+            research_summary=job.research_summary,
+            sources=job.sources,
             word_count=word_count,
             generation_time=generation_time,
         )
 
+    def _render_post(
+        self,
+        outline: BlogOutline,
+        body: str,
+        *,
+        draft: bool,
+        tags: list[str],
+        categories: list[str],
+        author: str | None,
+        cover_image: str | None,
+    ) -> tuple[str, str, str]:
+        """Assemble the final post from the written body.
+
+        Args:
+            outline: Blog outline (title, description, suggested taxonomy).
+            body: Content written by the writer agent.
+            draft: Whether to mark as draft.
+            tags: Fallback tags when the outline has none.
+            categories: Fallback categories when the outline has none.
+            author: Author name.
+            cover_image: Cover image URL.
+
+        Returns:
+            Tuple of (frontmatter, content with title and TOC, cleaned full post).
+        """
+        include_toc = self.settings.blog.include_toc
+        frontmatter = self.frontmatter_gen.generate(
+            title=outline.title,
+            description=outline.meta_description,
+            date=datetime.now(),
+            draft=draft,
+            tags=outline.tags or tags,
+            categories=outline.categories or categories,
+            author=author,
+            slug=self.md_formatter.slugify(outline.title),
+            toc=include_toc,
+            featured_image=cover_image,
+        )
+
+        if include_toc:
+            toc = self.md_formatter.generate_toc(body)
+            content = f"# {outline.title}\n\n{toc}\n\n{body}"
+        else:
+            content = f"# {outline.title}\n\n{body}"
+
+        full_content = self.md_formatter.clean_content(f"{frontmatter}\n{content}")
+        return frontmatter, content, full_content
+
+    @staticmethod
+    def _written_word_count(write_result: AgentResult) -> int:
+        """Get the word count of a written post.
+
+        The writer already counts the post it returns, so the text is only
+        scanned again when that count is missing.
+
+        Args:
+            write_result: Result of the writer agent.
+
+        Returns:
+            Number of words in the post body.
+        """
+        blog_post = write_result.metadata.get("blog_post") or {}
+        word_count = blog_post.get("word_count")
+        if isinstance(word_count, int):
+            return word_count
+        return count_words(write_result.content)
+
+    def _draft_path(
+        self, title: str, output_dir: str | Path | None, filename: str | None
+    ) -> Path | None:
+        """Get the in-progress file a post is streamed to before it is saved.
+
+        The ``.part`` suffix keeps Hugo from picking up unfinished posts; the
+        file is removed once the final post is written and left behind if
+        generation fails, for inspection.
+
+        Args:
+            title: Blog title.
+            output_dir: Output directory (no draft without one).
+            filename: Optional output filename.
+
+        Returns:
+            Draft path, or None when the post is not saved.
+        """
+        if not output_dir:
+            return None
+        stem = filename or f"{self.md_formatter.slugify(title)}.md"
+        return Path(output_dir) / f"{stem}.part"
+
     def _save_to_file(
         self,
         content: str,
@@ -422,7 +689,19 @@ class BlogGenerator:
             filename = f"{date_prefix}-{slug}.md"
 
         file_path = output_dir / filename
-        file_path.write_text(content, encoding="utf-8")
+
+        # Encode once and write in a single call; the rename makes the post appear
+        # complete or not at all, even if the process dies mid-write. The temporary
+        # name is unique per thread, as posts are saved from worker threads.
+        tmp_path = file_path.with_name(
+            f"{file_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        try:
+            tmp_path.write_bytes(content.encode("utf-8"))
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
 
         return file_path
 
@@ -488,7 +767,7 @@ class BlogGenerator:
             additional_context=additional_context,
         )
         if not result.success:
-            raise RuntimeError(f"Research failed: {result.error}")
+            raise RuntimeError(f"Research failed: {result.error}") from result.exception
         return result.content
 
     def outline_only(
@@ -520,6 +799,6 @@ class BlogGenerator:
             target_word_count=target_word_count,
         )
         if not result.success:
-            raise RuntimeError(f"Planning failed: {result.error}")
+            raise RuntimeError(f"Planning failed: {result.error}") from result.exception
 
         return self._dict_to_outline(result.metadata.get("outline", {}))
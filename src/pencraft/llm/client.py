@@ -3,18 +3,32 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import AsyncGenerator, Generator
+import time
+from collections.abc import AsyncGenerator, Generator, Sequence
+from contextlib import AbstractAsyncContextManager, AbstractContextManager, nullcontext
 from typing import TYPE_CHECKING, Any
 
-from openai import AsyncOpenAI, OpenAI
+import httpx
+from openai import (
+    AsyncOpenAI,
+    DefaultAsyncHttpxClient,
+    DefaultHttpxClient,
+    OpenAI,
+    RateLimitError,
+)
 
 if TYPE_CHECKING:
     from openai.types.chat import ChatCompletion, ChatCompletionChunk
 
 from pencraft.config.settings import LLMSettings, get_settings
+from pencraft.utils import serialization
+from pencraft.utils.ratelimit import ConcurrencyLimiter, TokenBucket
 
 logger = logging.getLogger(__name__)
 
+# Terminal states of an OpenAI Batch API job
+_BATCH_TERMINAL_STATES = frozenset({"completed", "failed", "expired", "cancelled"})
+
 
 class LLMClient:
     """OpenAI-compatible LLM client with configurable endpoint.
@@ -29,6 +43,8 @@ class LLMClient:
         base_url: str | None = None,
         api_key: str | None = None,
         model: str | None = None,
+        http_client: httpx.Client | None = None,
+        async_http_client: httpx.AsyncClient | None = None,
     ) -> None:
         """Initialize the LLM client.
 
@@ -37,6 +53,9 @@ class LLMClient:
             base_url: Override base URL (takes precedence over settings).
             api_key: Override API key (takes precedence over settings).
             model: Override model name (takes precedence over settings).
+            http_client: Existing HTTP client to send sync requests through.
+            async_http_client: Existing async HTTP client to send async requests
+                through, e.g. one connection pool shared by a whole batch.
         """
         if settings is None:
             settings = get_settings().llm
@@ -48,6 +67,36 @@ class LLMClient:
         self.max_tokens = settings.max_tokens
         self.timeout = settings.timeout
         self.max_retries = settings.max_retries
+        self.extra_body = settings.extra_body
+        self.stream = settings.stream
+
+        # Client-side request pacing, adapted on 429 responses
+        self.rate_limiter: TokenBucket | None = None
+        if settings.requests_per_second:
+            self.rate_limiter = TokenBucket(settings.requests_per_second)
+
+        # Cap on requests in flight, shared by every caller of this client
+        self.concurrency: ConcurrencyLimiter | None = None
+        if settings.max_concurrency:
+            self.concurrency = ConcurrencyLimiter(settings.max_concurrency)
+
+        # Connection pools sized from settings, unless the caller brought its own;
+        # the SDK's default clients keep its redirect and transport settings
+        if settings.pool_size:
+            limits = httpx.Limits(
+                max_connections=settings.pool_size,
+                max_keepalive_connections=settings.pool_size,
+            )
+            if http_client is None:
+                http_client = DefaultHttpxClient(  # type: ignore[assignment]
+                    timeout=self.timeout,
+                    limits=limits,  # type: ignore[arg-type]
+                )
+            if async_http_client is None:
+                async_http_client = DefaultAsyncHttpxClient(  # type: ignore[assignment]
+                    timeout=self.timeout,
+                    limits=limits,  # type: ignore[arg-type]
+                )
 
         # Initialize sync client
         self._client = OpenAI(
@@ -55,6 +104,7 @@ class LLMClient:
             api_key=self.api_key,
             timeout=self.timeout,
             max_retries=self.max_retries,
+            http_client=http_client,  # type: ignore[arg-type]
         )
 
         # Initialize async client
@@ -63,6 +113,7 @@ class LLMClient:
             api_key=self.api_key,
             timeout=self.timeout,
             max_retries=self.max_retries,
+            http_client=async_http_client,  # type: ignore[arg-type]
         )
 
         logger.debug(f"LLM client initialized with base_url={self.base_url}, model={self.model}")
@@ -88,13 +139,20 @@ class LLMClient:
         Returns:
             ChatCompletion response object.
         """
-        response = self._client.chat.completions.create(
-            model=model or self.model,
-            messages=messages,  # type: ignore[arg-type]
-            temperature=temperature if temperature is not None else self.temperature,
-            max_tokens=max_tokens or self.max_tokens,
-            **kwargs,
-        )
+        with self._slot():
+            self._throttle()
+            try:
+                response = self._client.chat.completions.create(
+                    model=model or self.model,
+                    messages=messages,  # type: ignore[arg-type]
+                    temperature=temperature if temperature is not None else self.temperature,
+                    max_tokens=max_tokens or self.max_tokens,
+                    **self._with_extra_body(kwargs),
+                )
+            except RateLimitError:
+                self._on_rate_limited()
+                raise
+        self._on_success()
         return response
 
     async def achat(
@@ -118,13 +176,20 @@ class LLMClient:
         Returns:
             ChatCompletion response object.
         """
-        response = await self._async_client.chat.completions.create(
-            model=model or self.model,
-            messages=messages,  # type: ignore[arg-type]
-            temperature=temperature if temperature is not None else self.temperature,
-            max_tokens=max_tokens or self.max_tokens,
-            **kwargs,
-        )
+        async with self._aslot():
+            await self._athrottle()
+            try:
+                response = await self._async_client.chat.completions.create(
+                    model=model or self.model,
+                    messages=messages,  # type: ignore[arg-type]
+                    temperature=temperature if temperature is not None else self.temperature,
+                    max_tokens=max_tokens or self.max_tokens,
+                    **self._with_extra_body(kwargs),
+                )
+            except RateLimitError:
+                self._on_rate_limited()
+                raise
+        self._on_success()
         return response
 
     def chat_stream(
@@ -148,15 +213,22 @@ class LLMClient:
         Yields:
             ChatCompletionChunk objects as they arrive.
         """
-        stream = self._client.chat.completions.create(
-            model=model or self.model,
-            messages=messages,  # type: ignore[arg-type]
-            temperature=temperature if temperature is not None else self.temperature,
-            max_tokens=max_tokens or self.max_tokens,
-            stream=True,
-            **kwargs,
-        )
-        yield from stream  # type: ignore[misc]
+        with self._slot():
+            self._throttle()
+            try:
+                stream = self._client.chat.completions.create(
+                    model=model or self.model,
+                    messages=messages,  # type: ignore[arg-type]
+                    temperature=temperature if temperature is not None else self.temperature,
+                    max_tokens=max_tokens or self.max_tokens,
+                    stream=True,
+                    **self._with_extra_body(kwargs),
+                )
+            except RateLimitError:
+                self._on_rate_limited()
+                raise
+            self._on_success()
+            yield from stream  # type: ignore[misc]
 
     async def achat_stream(
         self,
@@ -179,16 +251,23 @@ class LLMClient:
         Yields:
             ChatCompletionChunk objects as they arrive.
         """
-        stream = await self._async_client.chat.completions.create(
-            model=model or self.model,
-            messages=messages,  # type: ignore[arg-type]
-            temperature=temperature if temperature is not None else self.temperature,
-            max_tokens=max_tokens or self.max_tokens,
-            stream=True,
-            **kwargs,
-        )
-        async for chunk in stream:  # type: ignore[union-attr]
-            yield chunk
+        async with self._aslot():
+            await self._athrottle()
+            try:
+                stream = await self._async_client.chat.completions.create(
+                    model=model or self.model,
+                    messages=messages,  # type: ignore[arg-type]
+                    temperature=temperature if temperature is not None else self.temperature,
+                    max_tokens=max_tokens or self.max_tokens,
+                    stream=True,
+                    **self._with_extra_body(kwargs),
+                )
+            except RateLimitError:
+                self._on_rate_limited()
+                raise
+            self._on_success()
+            async for chunk in stream:  # type: ignore[union-attr]
+                yield chunk
 
     def generate(
         self,
@@ -199,6 +278,8 @@ class LLMClient:
     ) -> str:
         """Generate text from a simple prompt.
 
+        Streams the completion when ``stream`` is enabled in settings.
+
         Args:
             prompt: The user prompt.
             system_prompt: Optional system prompt.
@@ -207,11 +288,10 @@ class LLMClient:
         Returns:
             Generated text content.
         """
-        messages: list[dict[str, str]] = []
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
-        messages.append({"role": "user", "content": prompt})
+        if self.stream:
+            return "".join(self.generate_stream(prompt, system_prompt=system_prompt, **kwargs))
 
+        messages = self._build_messages(prompt, system_prompt)
         response = self.chat(messages, **kwargs)
         return response.choices[0].message.content or ""
 
@@ -224,6 +304,8 @@ class LLMClient:
     ) -> str:
         """Generate text from a simple prompt asynchronously.
 
+        Streams the completion when ``stream`` is enabled in settings.
+
         Args:
             prompt: The user prompt.
             system_prompt: Optional system prompt.
@@ -232,13 +314,277 @@ class LLMClient:
         Returns:
             Generated text content.
         """
+        if self.stream:
+            parts = [
+                delta
+                async for delta in self.agenerate_stream(
+                    prompt, system_prompt=system_prompt, **kwargs
+                )
+            ]
+            return "".join(parts)
+
+        messages = self._build_messages(prompt, system_prompt)
+        response = await self.achat(messages, **kwargs)
+        return response.choices[0].message.content or ""
+
+    def generate_stream(
+        self,
+        prompt: str,
+        *,
+        system_prompt: str | None = None,
+        **kwargs: Any,
+    ) -> Generator[str, None, None]:
+        """Generate text from a simple prompt, yielding content as it arrives.
+
+        Args:
+            prompt: The user prompt.
+            system_prompt: Optional system prompt.
+            **kwargs: Additional arguments passed to chat_stream().
+
+        Yields:
+            Non-empty content deltas.
+        """
+        messages = self._build_messages(prompt, system_prompt)
+        for chunk in self.chat_stream(messages, **kwargs):
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    async def agenerate_stream(
+        self,
+        prompt: str,
+        *,
+        system_prompt: str | None = None,
+        **kwargs: Any,
+    ) -> AsyncGenerator[str, None]:
+        """Generate text from a simple prompt asynchronously, yielding content as it arrives.
+
+        Args:
+            prompt: The user prompt.
+            system_prompt: Optional system prompt.
+            **kwargs: Additional arguments passed to achat_stream().
+
+        Yields:
+            Non-empty content deltas.
+        """
+        messages = self._build_messages(prompt, system_prompt)
+        async for chunk in self.achat_stream(messages, **kwargs):
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    def warmup(self) -> bool:
+        """Send a minimal request to open a connection and load the model.
+
+        Call once before a burst of requests so the first real request isn't
+        charged with connection setup and model load time.
+
+        Returns:
+            True if the endpoint answered, False otherwise.
+        """
+        try:
+            self.chat([{"role": "user", "content": "ping"}], max_tokens=1)
+        except Exception as e:
+            logger.warning(f"LLM warmup failed: {e}")
+            return False
+        return True
+
+    async def awarmup(self) -> bool:
+        """Send a minimal request asynchronously to prime the async connection pool.
+
+        Returns:
+            True if the endpoint answered, False otherwise.
+        """
+        try:
+            await self.achat([{"role": "user", "content": "ping"}], max_tokens=1)
+        except Exception as e:
+            logger.warning(f"LLM warmup failed: {e}")
+            return False
+        return True
+
+    def check_connection(self, timeout: float = 2.0) -> bool:
+        """Check that the endpoint is reachable by listing its models.
+
+        Meant as a fast pre-flight before a long run: it uses a short timeout
+        and no retries, so an unreachable server is reported in seconds.
+
+        Args:
+            timeout: Seconds to wait for the endpoint.
+
+        Returns:
+            True if the endpoint answered, False otherwise.
+        """
+        try:
+            self._client.with_options(timeout=timeout, max_retries=0).models.list()
+        except Exception as e:
+            logger.warning(f"LLM endpoint {self.base_url} unreachable: {e}")
+            return False
+        return True
+
+    async def acheck_connection(self, timeout: float = 2.0) -> bool:
+        """Check asynchronously that the endpoint is reachable.
+
+        Args:
+            timeout: Seconds to wait for the endpoint.
+
+        Returns:
+            True if the endpoint answered, False otherwise.
+        """
+        try:
+            await self._async_client.with_options(timeout=timeout, max_retries=0).models.list()
+        except Exception as e:
+            logger.warning(f"LLM endpoint {self.base_url} unreachable: {e}")
+            return False
+        return True
+
+    def generate_batch(
+        self,
+        prompts: Sequence[str],
+        *,
+        system_prompt: str | None = None,
+        completion_window: str = "24h",
+        poll_interval: float = 30.0,
+        timeout: float | None = None,
+        model: str | None = None,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        **kwargs: Any,
+    ) -> list[str]:
+        """Generate text for many prompts through the OpenAI Batch API.
+
+        Batch jobs trade latency (up to ``completion_window``) for roughly half
+        the token price and no live rate-limit contention, which suits offline
+        generation runs. Each prompt is serialized as one JSONL request whose
+        ``custom_id`` is its index, so results are joined back in input order.
+
+        Args:
+            prompts: User prompts to complete.
+            system_prompt: Optional system prompt shared by every request.
+            completion_window: Batch completion window accepted by the API.
+            poll_interval: Seconds to wait between batch status checks.
+            timeout: Seconds to wait for the batch before cancelling it
+                (None waits for the completion window to run out).
+            model: Override model for these requests.
+            temperature: Override temperature for these requests.
+            max_tokens: Override max_tokens for these requests.
+            **kwargs: Additional arguments placed in each request body.
+
+        Returns:
+            Generated text for each prompt, in input order. Requests that failed
+            inside an otherwise completed batch yield an empty string.
+
+        Raises:
+            RuntimeError: If the batch job fails, expires or is cancelled.
+            TimeoutError: If the batch hasn't finished within ``timeout``.
+        """
+        if not prompts:
+            return []
+
+        lines = []
+        for index, prompt in enumerate(prompts):
+            body = {
+                "model": model or self.model,
+                "messages": self._build_messages(prompt, system_prompt),
+                "temperature": temperature if temperature is not None else self.temperature,
+                "max_tokens": max_tokens or self.max_tokens,
+                **(self.extra_body or {}),
+                **kwargs,
+            }
+            request = {
+                "custom_id": str(index),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": body,
+            }
+            lines.append(serialization.dumps_bytes(request))
+
+        batch_file = self._client.files.create(
+            file=("batch.jsonl", b"\n".join(lines)),
+            purpose="batch",
+        )
+        batch = self._client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window=completion_window,  # type: ignore[arg-type]
+        )
+        logger.debug(f"Submitted batch {batch.id} with {len(lines)} requests")
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while batch.status not in _BATCH_TERMINAL_STATES:
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._client.batches.cancel(batch.id)
+                    raise TimeoutError(f"Batch {batch.id} not finished after {timeout}s")
+                time.sleep(min(poll_interval, remaining))
+            else:
+                time.sleep(poll_interval)
+            batch = self._client.batches.retrieve(batch.id)
+
+        if batch.status != "completed":
+            raise RuntimeError(f"Batch {batch.id} ended with status '{batch.status}'")
+
+        results = [""] * len(prompts)
+        if batch.output_file_id:
+            output = self._client.files.content(batch.output_file_id).text
+            for line in output.splitlines():
+                if not line.strip():
+                    continue
+                record = serialization.loads(line)
+                response = record.get("response") or {}
+                if response.get("status_code") != 200:
+                    logger.warning(f"Batch request {record.get('custom_id')} failed")
+                    continue
+                content = response["body"]["choices"][0]["message"]["content"]
+                results[int(record["custom_id"])] = content or ""
+
+        return results
+
+    def _with_extra_body(self, kwargs: dict[str, Any]) -> dict[str, Any]:
+        """Merge the configured extra_body into per-call request arguments."""
+        if not self.extra_body:
+            return kwargs
+        return {**kwargs, "extra_body": {**self.extra_body, **kwargs.get("extra_body", {})}}
+
+    def _slot(self) -> AbstractContextManager[None]:
+        """Hold a request slot, if a concurrency limit is configured."""
+        if self.concurrency is None:
+            return nullcontext()
+        return self.concurrency.slot()
+
+    def _aslot(self) -> AbstractAsyncContextManager[None]:
+        """Hold a request slot asynchronously, if a concurrency limit is configured."""
+        if self.concurrency is None:
+            return nullcontext()
+        return self.concurrency.aslot()
+
+    def _throttle(self) -> None:
+        """Wait for the rate limiter, if one is configured."""
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+
+    async def _athrottle(self) -> None:
+        """Wait for the rate limiter asynchronously, if one is configured."""
+        if self.rate_limiter is not None:
+            await self.rate_limiter.aacquire()
+
+    def _on_rate_limited(self) -> None:
+        """Back off the request rate after the API rejected a call with 429."""
+        if self.rate_limiter is not None:
+            self.rate_limiter.penalize()
+            logger.warning(f"Rate limited; reducing to {self.rate_limiter.rate:.2f} requests/s")
+
+    def _on_success(self) -> None:
+        """Let the request rate recover after a successful call."""
+        if self.rate_limiter is not None:
+            self.rate_limiter.reward()
+
+    @staticmethod
+    def _build_messages(prompt: str, system_prompt: str | None) -> list[dict[str, str]]:
+        """Build the chat message list for a single prompt."""
         messages: list[dict[str, str]] = []
         if system_prompt:
             messages.append({"role": "system", "content": system_prompt})
         messages.append({"role": "user", "content": prompt})
-
-        response = await self.achat(messages, **kwargs)
-        return response.choices[0].message.content or ""
+        return messages
 
     def close(self) -> None:
         """Close the client connections."""
@@ -5,12 +5,8 @@ like professional journalism - no generic AI fluff, no robotic transitions.
 """
 
 # Research prompts - Investigative Journalist Style
-RESEARCH_PROMPT = """You are a senior investigative journalist researching for a major publication.
-
-**Assignment:** {topic}
-
-**Editorial Brief:**
-{additional_context}
+# Instructions first and the assignment after them (shared prefix, as for outlines below)
+RESEARCH_INSTRUCTIONS = """You are a senior investigative journalist researching for a major publication.
 
 **Research Requirements:**
 
@@ -43,18 +39,22 @@ RESEARCH_PROMPT = """You are a senior investigative journalist researching for a
 Provide a structured research brief with clear sections. Every claim must be source-backed.
 Highlight the 3-5 most compelling insights that would make a reader stop scrolling."""
 
+RESEARCH_INPUT = """
 
-# Planning prompts - Editorial Director Style
-OUTLINE_PROMPT = """You are an editorial director at a top-tier publication (think NYT, WSJ, The Atlantic).
+---
 
-**Topic:** {topic}
+**Assignment:** {topic}
 
-**Research Available:**
-{research_summary}
+**Editorial Brief:**
+{additional_context}"""
 
-**Target Length:** {word_count} words
+RESEARCH_PROMPT = RESEARCH_INSTRUCTIONS + RESEARCH_INPUT
 
----
+
+# Planning prompts - Editorial Director Style
+# The invariant instructions come first and the per-topic input last, so every
+# outline request shares a byte-identical prefix that providers can cache
+OUTLINE_INSTRUCTIONS = """You are an editorial director at a top-tier publication (think NYT, WSJ, The Atlantic).
 
 ## Your Task: Create a Publication-Ready Outline
 
@@ -103,6 +103,49 @@ Suggest relevant tags (lowercase, hyphenated) and 1-2 categories.
 ### 6. SEO KEYWORDS
 3-5 keywords that real people actually search for."""
 
+# Added after OUTLINE_INSTRUCTIONS when the backend enforces a JSON schema, so
+# the outline comes back structured in one call instead of being re-extracted
+OUTLINE_JSON_INSTRUCTIONS = """
+
+Return the outline as a single JSON object with these fields:
+- title, meta_description, layout_type (one of the layouts above)
+- tags, categories, seo_keywords: arrays of strings
+- sections: array of objects with title, key_points (array of strings) and
+  subsections (array of objects with title and key_points)
+
+Return only the JSON object."""
+
+OUTLINE_INPUT = """
+
+---
+
+**Topic:** {topic}
+
+**Research Available:**
+{research_summary}
+
+**Target Length:** {word_count} words"""
+
+OUTLINE_PROMPT = OUTLINE_INSTRUCTIONS + OUTLINE_INPUT
+
+# Fields first, the outline to extract from appended last (shared prefix, as above)
+OUTLINE_STRUCTURE_INSTRUCTIONS = """Extract the following from a blog outline and return as JSON:
+- title: The blog post title
+- meta_description: The meta description (150-160 chars)
+- layout_type: The optimal layout (deep-dive, narrative, analytical, how-to, opinion, listicle)
+- tags: Array of relevant tags
+- categories: Array of categories
+- seo_keywords: Array of SEO keywords
+- sections: Array of section objects, each with:
+  - title: Section title
+  - key_points: Array of key points to cover
+  - subsections: Array of subsection objects (same structure)
+
+Return only valid JSON, no other text.
+
+Outline:
+"""
+
 
 # Writing prompts - Senior Staff Writer Style
 INTRODUCTION_PROMPT = """You are a senior staff writer at a major publication, writing the opening of a feature article.
@@ -143,23 +186,10 @@ confident but not arrogant. You respect the reader's intelligence.
 Write the introduction only. No section headers."""
 
 
-SECTION_PROMPT = """You are a senior staff writer continuing a feature article.
-
-**Article Title:** {title}
-**Current Section:** {section_title}
-
-**Section Brief:**
-{section_outline}
-
-**What came before:**
-{previous_content}
-
-**Research to incorporate:**
-{research_notes}
-
-**Target length:** {word_count} words
-
----
+# Section prompts run from most to least stable: the shared guidelines, then the
+# article context (the same for every section of a post), then the section
+# itself with the previous text, which changes on every call, last
+SECTION_INSTRUCTIONS = """You are a senior staff writer continuing a feature article.
 
 ## Writing Guidelines
 
@@ -189,6 +219,44 @@ When referencing sources, use [^1] footnote format naturally in the text.
 
 Write the section content only. Do NOT include the section title as a header."""
 
+SECTION_CONTEXT = """
+
+---
+
+**Article Title:** {title}
+
+**Research to incorporate:**
+{research_notes}"""
+
+SECTION_INPUT = """
+
+**Current Section:** {section_title}
+
+**Section Brief:**
+{section_outline}
+
+**Target length:** {word_count} words
+
+**What came before:**
+{previous_content}"""
+
+SECTION_PROMPT = SECTION_INSTRUCTIONS + SECTION_CONTEXT + SECTION_INPUT
+
+# Every body section in one request, after the same guidelines and context
+SECTIONS_BATCH_INPUT = """
+
+**Sections to write, in order:**
+{sections}
+
+**What came before:**
+{previous_content}
+
+Write every section above, continuing naturally from one to the next.
+Return a single JSON object that maps each section title, exactly as given,
+to that section's markdown content. Return only the JSON object."""
+
+SECTIONS_BATCH_PROMPT = SECTION_INSTRUCTIONS + SECTION_CONTEXT + SECTIONS_BATCH_INPUT
+
 
 CONCLUSION_PROMPT = """You are a senior staff writer wrapping up a feature article.
 
@@ -227,6 +295,13 @@ CONCLUSION_PROMPT = """You are a senior staff writer wrapping up a feature artic
 Write the conclusion only. Do NOT include "Conclusion" as a header."""
 
 
+# Retrieval necessity - one-token gate before scraping and synthesis
+RETRIEVAL_NECESSITY_PROMPT = """Answer YES or NO: do you need external sources to write \
+authoritatively and accurately about the following topic?
+
+Topic: {topic}"""
+
+
 # Citation generation - Clean professional format
 CITATION_PROMPT = """Format these sources into a clean references section:
 
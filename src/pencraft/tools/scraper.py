@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
-from dataclasses import dataclass
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from typing import Any
 
 import httpx
@@ -12,8 +15,14 @@ from bs4 import BeautifulSoup
 
 logger = logging.getLogger(__name__)
 
+# Characters of a page's content quoted in research prompts
+PREVIEW_CHARS = 2000
 
-@dataclass
+# Scraped pages kept for reuse by one scraper
+DEFAULT_CACHE_SIZE = 128
+
+
+@dataclass(slots=True)
 class ScrapedContent:
     """Scraped content from a web page."""
 
@@ -25,6 +34,11 @@ class ScrapedContent:
     word_count: int = 0
     success: bool = True
     error: str | None = None
+    preview: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Cut the preview quoted in prompts once, when the page is scraped."""
+        self.preview = self.content[:PREVIEW_CHARS]
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
@@ -75,6 +89,8 @@ class WebScraper:
         timeout: float = 30.0,
         max_content_length: int = 50000,
         user_agent: str | None = None,
+        max_concurrency: int = 8,
+        cache_size: int = DEFAULT_CACHE_SIZE,
     ) -> None:
         """Initialize the web scraper.
 
@@ -82,9 +98,14 @@ class WebScraper:
             timeout: Request timeout in seconds.
             max_content_length: Maximum content length to extract.
             user_agent: Custom user agent string.
+            max_concurrency: Maximum concurrent fetches in ascrape_many().
+            cache_size: Number of recently scraped pages kept for reuse
+                (0 disables the cache).
         """
         self.timeout = timeout
         self.max_content_length = max_content_length
+        self.max_concurrency = max_concurrency
+        self.cache_size = cache_size
         self.user_agent = user_agent or (
             "Mozilla/5.0 (compatible; Pencraft/1.0; +https://github.com/suhaibbinyounis/pencraft)"
         )
@@ -95,55 +116,37 @@ class WebScraper:
             headers={"User-Agent": self.user_agent},
         )
 
+        # Shared async client, created lazily for the running event loop
+        self._async_client: httpx.AsyncClient | None = None
+        self._async_loop: asyncio.AbstractEventLoop | None = None
+
+        # Recent successful scrapes, least recently used first; shared by every
+        # post of a batch when the scraper is shared, and by its worker threads
+        self._cache: OrderedDict[str, ScrapedContent] = OrderedDict()
+        self._cache_lock = threading.Lock()
+
     def scrape(self, url: str) -> ScrapedContent:
         """Scrape content from a URL.
 
+        Returns cached content for URLs that were already scraped successfully.
+
         Args:
             url: URL to scrape.
 
         Returns:
             ScrapedContent object with extracted content.
         """
+        cached = self.cached(url)
+        if cached is not None:
+            return cached
+
         try:
             response = self._client.get(url)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            # Extract title
-            title = self._extract_title(soup)
-
-            # Extract meta description
-            meta_description = self._extract_meta_description(soup)
-
-            # Extract headings
-            headings = self._extract_headings(soup)
-
-            # Remove unwanted elements
-            for selector in self.REMOVE_SELECTORS:
-                for element in soup.select(selector):
-                    element.decompose()
-
-            # Extract main content
-            content = self._extract_content(soup)
-
-            # Truncate if too long
-            if len(content) > self.max_content_length:
-                content = content[: self.max_content_length] + "..."
-
-            word_count = len(content.split())
-
-            logger.info(f"Scraped {url}: {word_count} words")
-
-            return ScrapedContent(
-                url=url,
-                title=title,
-                content=content,
-                meta_description=meta_description,
-                headings=headings,
-                word_count=word_count,
-            )
-
+            content = self._parse(url, response.text)
+            self._remember(url, content)
+            return content
         except httpx.HTTPError as e:
             logger.error(f"HTTP error scraping {url}: {e}")
             return ScrapedContent(
@@ -166,48 +169,29 @@ class WebScraper:
     async def ascrape(self, url: str) -> ScrapedContent:
         """Scrape content from a URL asynchronously.
 
+        Uses a shared connection pool and returns cached content for URLs
+        that were already scraped successfully.
+
         Args:
             url: URL to scrape.
 
         Returns:
             ScrapedContent object with extracted content.
         """
-        try:
-            async with httpx.AsyncClient(
-                timeout=self.timeout,
-                follow_redirects=True,
-                headers={"User-Agent": self.user_agent},
-            ) as client:
-                response = await client.get(url)
-                response.raise_for_status()
-
-                soup = BeautifulSoup(response.text, "html.parser")
-
-                title = self._extract_title(soup)
-                meta_description = self._extract_meta_description(soup)
-                headings = self._extract_headings(soup)
-
-                for selector in self.REMOVE_SELECTORS:
-                    for element in soup.select(selector):
-                        element.decompose()
-
-                content = self._extract_content(soup)
-
-                if len(content) > self.max_content_length:
-                    content = content[: self.max_content_length] + "..."
+        cached = self.cached(url)
+        if cached is not None:
+            return cached
 
-                word_count = len(content.split())
-
-                logger.info(f"Scraped async {url}: {word_count} words")
+        try:
+            client = self._get_async_client()
+            response = await client.get(url)
+            response.raise_for_status()
 
-                return ScrapedContent(
-                    url=url,
-                    title=title,
-                    content=content,
-                    meta_description=meta_description,
-                    headings=headings,
-                    word_count=word_count,
-                )
+            # Parsing is CPU work; keep it off the event loop so other fetches
+            # and LLM streams are serviced meanwhile
+            content = await asyncio.to_thread(self._parse, url, response.text)
+            self._remember(url, content)
+            return content
 
         except Exception as e:
             logger.error(f"Error async scraping {url}: {e}")
@@ -219,6 +203,27 @@ class WebScraper:
                 error=str(e),
             )
 
+    async def ascrape_many(self, urls: list[str]) -> list[ScrapedContent]:
+        """Scrape multiple URLs concurrently.
+
+        Duplicate URLs are fetched once; at most ``max_concurrency`` requests
+        are in flight at a time.
+
+        Args:
+            urls: List of URLs to scrape.
+
+        Returns:
+            List of ScrapedContent objects, one per unique URL in input order.
+        """
+        unique_urls = list(dict.fromkeys(urls))
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch(url: str) -> ScrapedContent:
+            async with semaphore:
+                return await self.ascrape(url)
+
+        return list(await asyncio.gather(*(fetch(url) for url in unique_urls)))
+
     def scrape_multiple(self, urls: list[str]) -> list[ScrapedContent]:
         """Scrape multiple URLs.
 
@@ -230,6 +235,113 @@ class WebScraper:
         """
         return [self.scrape(url) for url in urls]
 
+    def cached(self, url: str) -> ScrapedContent | None:
+        """Get a previously scraped page, marking it as recently used.
+
+        Args:
+            url: URL of the page.
+
+        Returns:
+            The cached content, or None if the page isn't cached.
+        """
+        with self._cache_lock:
+            content = self._cache.get(url)
+            if content is not None:
+                self._cache.move_to_end(url)
+            return content
+
+    def clear_cache(self) -> None:
+        """Forget all scraped pages, so later scrapes fetch fresh content."""
+        with self._cache_lock:
+            self._cache.clear()
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """Get the shared async client for the running event loop.
+
+        Returns:
+            httpx AsyncClient bound to the current loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_loop is not loop:
+            self._close_stale_async_client()
+            self._async_client = httpx.AsyncClient(
+                timeout=self.timeout,
+                follow_redirects=True,
+                headers={"User-Agent": self.user_agent},
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+            )
+            self._async_loop = loop
+        return self._async_client
+
+    def _remember(self, url: str, content: ScrapedContent) -> None:
+        """Cache a scraped page, evicting the least recently used beyond cache_size."""
+        if self.cache_size <= 0:
+            return
+        with self._cache_lock:
+            self._cache[url] = content
+            self._cache.move_to_end(url)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def _close_stale_async_client(self) -> None:
+        """Close an async client left over from another event loop.
+
+        The client can only be closed on its own loop, so this is done when that
+        loop is still running (in another thread). A stopped loop's connections
+        are released with the loop; call ``aclose()`` before it stops.
+        """
+        client, loop = self._async_client, self._async_loop
+        self._async_client = None
+        self._async_loop = None
+        if client is not None and loop is not None and loop.is_running():
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+
+    def _parse(self, url: str, html: str) -> ScrapedContent:
+        """Extract content from a fetched page.
+
+        Args:
+            url: Page URL.
+            html: Page HTML.
+
+        Returns:
+            ScrapedContent object with extracted content.
+        """
+        soup = BeautifulSoup(html, "html.parser")
+
+        # Extract title
+        title = self._extract_title(soup)
+
+        # Extract meta description
+        meta_description = self._extract_meta_description(soup)
+
+        # Extract headings
+        headings = self._extract_headings(soup)
+
+        # Remove unwanted elements
+        for selector in self.REMOVE_SELECTORS:
+            for element in soup.select(selector):
+                element.decompose()
+
+        # Extract main content
+        content = self._extract_content(soup)
+
+        # Truncate if too long
+        if len(content) > self.max_content_length:
+            content = content[: self.max_content_length] + "..."
+
+        word_count = len(content.split())
+
+        logger.info(f"Scraped {url}: {word_count} words")
+
+        return ScrapedContent(
+            url=url,
+            title=title,
+            content=content,
+            meta_description=meta_description,
+            headings=headings,
+            word_count=word_count,
+        )
+
     def _extract_title(self, soup: BeautifulSoup) -> str:
         """Extract page title.
 
@@ -329,6 +441,13 @@ class WebScraper:
         """Close the HTTP client."""
         self._client.close()
 
+    async def aclose(self) -> None:
+        """Close the shared async HTTP client."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+            self._async_loop = None
+
     def __enter__(self) -> WebScraper:
         """Context manager entry."""
         return self
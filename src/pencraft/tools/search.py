@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import logging
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Any
 
@@ -10,8 +12,15 @@ from ddgs import DDGS
 
 logger = logging.getLogger(__name__)
 
+# Queries whose results one search tool keeps for reuse
+DEFAULT_CACHE_SIZE = 256
 
-@dataclass
+
+class SearchError(RuntimeError):
+    """The search provider failed (rate limits included), as opposed to finding nothing."""
+
+
+@dataclass(slots=True)
 class SearchResult:
     """A single search result."""
 
@@ -30,6 +39,15 @@ class SearchResult:
         }
 
 
+@dataclass
+class SearchCacheInfo:
+    """Statistics of the search result cache."""
+
+    hits: int
+    misses: int
+    size: int
+
+
 class SearchTool:
     """Web search tool using DuckDuckGo API.
 
@@ -41,6 +59,7 @@ class SearchTool:
         max_results: int = 10,
         region: str = "wt-wt",
         safesearch: str = "moderate",
+        cache_size: int = DEFAULT_CACHE_SIZE,
     ) -> None:
         """Initialize the search tool.
 
@@ -48,10 +67,21 @@ class SearchTool:
             max_results: Maximum number of results to return.
             region: Region for search results (wt-wt = worldwide).
             safesearch: SafeSearch setting (off, moderate, strict).
+            cache_size: Number of recent queries whose results are kept
+                (0 disables the cache).
         """
         self.max_results = max_results
         self.region = region
         self.safesearch = safesearch
+        self.cache_size = cache_size
+
+        # Non-empty results per (normalized query, max_results, time_range), least
+        # recently used first, so topics of one batch that issue the same query
+        # share a single search. Searches run on worker threads, hence the lock.
+        self._cache: OrderedDict[tuple[str, int, str | None], list[SearchResult]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
 
     def search(
         self,
@@ -59,18 +89,35 @@ class SearchTool:
         *,
         max_results: int | None = None,
         time_range: str | None = None,
+        raise_errors: bool = False,
     ) -> list[SearchResult]:
         """Perform a web search.
 
+        Results of earlier identical searches are returned from the cache.
+
         Args:
             query: Search query string.
             max_results: Override max results for this search.
             time_range: Time range filter (d=day, w=week, m=month, y=year).
+            raise_errors: Raise SearchError when the provider fails instead of
+                logging it and returning no results.
 
         Returns:
             List of SearchResult objects.
+
+        Raises:
+            SearchError: If raise_errors is set and the search failed.
         """
         max_results = max_results or self.max_results
+        key = (" ".join(query.lower().split()), max_results, time_range)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self._hits += 1
+                return list(cached)
+            self._misses += 1
+
         results: list[SearchResult] = []
 
         try:
@@ -96,9 +143,27 @@ class SearchTool:
             logger.info(f"Search for '{query}' returned {len(results)} results")
 
         except Exception as e:
+            if raise_errors:
+                raise SearchError(f"Search error for '{query}': {e}") from e
             logger.error(f"Search error for '{query}': {e}")
 
-        return results
+        # Empty results may be transient (rate limits, errors): retry those
+        if results and self.cache_size > 0:
+            with self._lock:
+                self._cache[key] = results
+                self._cache.move_to_end(key)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return list(results)
+
+    def cache_info(self) -> SearchCacheInfo:
+        """Get search cache statistics.
+
+        Returns:
+            Hits, misses and number of cached queries.
+        """
+        with self._lock:
+            return SearchCacheInfo(hits=self._hits, misses=self._misses, size=len(self._cache))
 
     def search_news(
         self,
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import threading
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -120,18 +122,21 @@ class TrendsTool:
         self.timezone = timezone
         self.retries = retries
         self.backoff_factor = backoff_factor
-        self._pytrends: TrendReq | None = None
+        # pytrends clients hold the current query as state, so each thread gets its own
+        self._local = threading.local()
 
     def _get_client(self) -> TrendReq:
-        """Get or create the pytrends client."""
-        if self._pytrends is None:
-            self._pytrends = TrendReq(
+        """Get or create the calling thread's pytrends client."""
+        pytrends: TrendReq | None = getattr(self._local, "pytrends", None)
+        if pytrends is None:
+            pytrends = TrendReq(
                 hl=self.language,
                 tz=self.timezone,
                 retries=self.retries,
                 backoff_factor=self.backoff_factor,
             )
-        return self._pytrends
+            self._local.pytrends = pytrends
+        return pytrends
 
     def get_trends_data(
         self,
@@ -235,6 +240,36 @@ class TrendsTool:
 
         return trends_data
 
+    async def aget_trends_data(
+        self,
+        topic: str,
+        *,
+        timeframe: str = "today 3-m",
+        geo: str = "",
+        include_regional: bool = True,
+    ) -> TrendsData:
+        """Fetch comprehensive trends data for a topic asynchronously.
+
+        pytrends is blocking, so the lookup runs in a worker thread; several
+        topics can be fetched concurrently.
+
+        Args:
+            topic: Topic to research.
+            timeframe: Time range (e.g., 'today 3-m', 'today 12-m', 'now 7-d').
+            geo: Geographic region (e.g., 'US', 'GB', '' for worldwide).
+            include_regional: Whether to fetch regional interest data.
+
+        Returns:
+            TrendsData object with all available trends information.
+        """
+        return await asyncio.to_thread(
+            self.get_trends_data,
+            topic,
+            timeframe=timeframe,
+            geo=geo,
+            include_regional=include_regional,
+        )
+
     def get_related_queries(self, topic: str) -> list[str]:
         """Get related search queries for a topic.
 
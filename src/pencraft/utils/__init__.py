@@ -1,5 +1,7 @@
 """Utilities package for Pencraft."""
 
 from pencraft.utils.logging import configure_logging
+from pencraft.utils.ratelimit import TokenBucket
+from pencraft.utils.singleflight import SingleFlight
 
-__all__ = ["configure_logging"]
+__all__ = ["SingleFlight", "TokenBucket", "configure_logging"]
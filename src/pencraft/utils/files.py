@@ -0,0 +1,60 @@
+"""File output helpers for Pencraft."""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterable
+from pathlib import Path
+
+# Buffers per os.writev() call when the platform doesn't report IOV_MAX
+# (the POSIX minimum, _XOPEN_IOV_MAX)
+DEFAULT_IOV_MAX = 16
+
+
+def _iov_max() -> int:
+    """Get the most buffers a single os.writev() call accepts."""
+    try:
+        limit = os.sysconf("SC_IOV_MAX")
+    except (AttributeError, ValueError, OSError):
+        return DEFAULT_IOV_MAX
+    return limit if limit > 0 else DEFAULT_IOV_MAX
+
+
+def write_text_parts(path: str | Path, parts: Iterable[str], encoding: str = "utf-8") -> int:
+    """Write several text parts to a file without joining them first.
+
+    On platforms with ``os.writev`` the encoded parts are handed to the kernel
+    in vectored writes of up to IOV_MAX buffers each (repeated if a write is
+    partial); elsewhere they are written one after another.
+
+    Args:
+        path: Destination file (created or truncated).
+        parts: Text parts, written in order.
+        encoding: Text encoding.
+
+    Returns:
+        Number of bytes written.
+    """
+    buffers = [part.encode(encoding) for part in parts if part]
+    total = sum(len(buffer) for buffer in buffers)
+
+    with open(path, "wb") as f:
+        if not hasattr(os, "writev"):
+            for buffer in buffers:
+                f.write(buffer)
+            return total
+
+        pending = [memoryview(buffer) for buffer in buffers]
+        fd = f.fileno()
+        iov_max = _iov_max()
+        start = 0
+        while start < len(pending):
+            written = os.writev(fd, pending[start : start + iov_max])
+            # Skip fully written buffers and trim a partially written one
+            while start < len(pending) and written >= len(pending[start]):
+                written -= len(pending[start])
+                start += 1
+            if written:
+                pending[start] = pending[start][written:]
+
+    return total
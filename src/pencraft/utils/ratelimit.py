@@ -0,0 +1,144 @@
+"""Adaptive token-bucket rate limiting."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+import weakref
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import asynccontextmanager, contextmanager
+
+
+class TokenBucket:
+    """Token-bucket rate limiter with additive-increase/multiplicative-decrease.
+
+    Callers reserve tokens up front, so concurrent callers queue behind each
+    other instead of all waking at once. The refill rate is halved when the
+    provider signals overload (``penalize``) and recovers linearly towards the
+    configured rate on success (``reward``). Safe to share between threads
+    and event loops.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float | None = None,
+        *,
+        min_rate: float | None = None,
+        recovery: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the bucket.
+
+        Args:
+            rate: Tokens added per second (the target rate).
+            burst: Bucket capacity. Defaults to ``max(1, rate)``.
+            min_rate: Lowest rate penalize() may reduce to. Defaults to rate / 16.
+            recovery: Rate added back per reward(). Defaults to rate / 10.
+            clock: Monotonic clock, injectable for tests.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self.min_rate = min_rate if min_rate is not None else rate / 16
+        self.recovery = recovery if recovery is not None else rate / 10
+        self._clock = clock
+        self._tokens = self.burst
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self, cost: float = 1.0) -> float:
+        """Reserve tokens and return how long the caller must wait before using them.
+
+        Args:
+            cost: Number of tokens to take.
+
+        Returns:
+            Seconds to wait (0 when tokens are available now).
+        """
+        with self._lock:
+            now = self._clock()
+            elapsed = now - self._updated
+            self._updated = now
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            self._tokens -= cost
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self, cost: float = 1.0) -> None:
+        """Block until ``cost`` tokens are available.
+
+        Args:
+            cost: Number of tokens to take.
+        """
+        wait = self.reserve(cost)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def aacquire(self, cost: float = 1.0) -> None:
+        """Wait asynchronously until ``cost`` tokens are available.
+
+        Args:
+            cost: Number of tokens to take.
+        """
+        wait = self.reserve(cost)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def penalize(self) -> None:
+        """Halve the refill rate after the provider reported overload."""
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+
+    def reward(self) -> None:
+        """Recover the refill rate linearly after a successful call."""
+        if self.rate >= self.max_rate:
+            return
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.recovery)
+
+
+class ConcurrencyLimiter:
+    """Cap the number of operations in flight at once.
+
+    Threads share one bounded semaphore. Each event loop gets its own
+    ``asyncio.Semaphore`` (they cannot be shared between loops), so the cap
+    applies per loop for async callers. Safe to share between threads and
+    event loops.
+    """
+
+    def __init__(self, limit: int) -> None:
+        """Initialize the limiter.
+
+        Args:
+            limit: Maximum number of concurrent operations.
+        """
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
+
+        self.limit = limit
+        self._semaphore = threading.BoundedSemaphore(limit)
+        self._loop_semaphores: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Semaphore
+        ] = weakref.WeakKeyDictionary()
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Hold one slot for the duration of the block, blocking until one is free."""
+        with self._semaphore:
+            yield
+
+    @asynccontextmanager
+    async def aslot(self) -> AsyncIterator[None]:
+        """Hold one slot of the running loop for the duration of the block."""
+        loop = asyncio.get_running_loop()
+        semaphore = self._loop_semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._loop_semaphores.setdefault(loop, asyncio.Semaphore(self.limit))
+        async with semaphore:
+            yield
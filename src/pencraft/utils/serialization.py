@@ -0,0 +1,110 @@
+"""JSON serialization with an optional orjson fast path."""
+
+from __future__ import annotations
+
+import json
+import re
+from collections.abc import Callable
+from typing import Any
+
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - depends on the installed extras
+    _orjson = None  # type: ignore[assignment]
+
+#: Raised by loads() on invalid input (orjson's error subclasses it).
+JSONDecodeError = json.JSONDecodeError
+
+# A reply wrapped in a markdown code block (closing fence optional)
+_CODE_FENCE_RE = re.compile(r"^\s*```[^\n]*\n(.*?)\s*(?:```\s*)?$", re.DOTALL)
+
+
+def dumps_bytes(
+    obj: Any,
+    *,
+    indent: bool = False,
+    sort_keys: bool = False,
+    default: Callable[[Any], Any] | None = None,
+) -> bytes:
+    """Serialize an object to UTF-8 encoded JSON.
+
+    Uses orjson when installed (``pip install pencraft[fast]``) and the
+    standard library otherwise. Both produce compact output, or two-space
+    indentation when ``indent`` is set, without escaping non-ASCII text.
+
+    Args:
+        obj: Object to serialize.
+        indent: Pretty-print with two-space indentation.
+        sort_keys: Sort object keys.
+        default: Fallback for objects that are not natively serializable.
+
+    Returns:
+        Encoded JSON.
+    """
+    if _orjson is not None:
+        option = _orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= _orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= _orjson.OPT_SORT_KEYS
+        return _orjson.dumps(obj, default=default, option=option)
+
+    return json.dumps(
+        obj,
+        indent=2 if indent else None,
+        separators=None if indent else (",", ":"),
+        sort_keys=sort_keys,
+        default=default,
+        ensure_ascii=False,
+    ).encode("utf-8")
+
+
+def dumps(
+    obj: Any,
+    *,
+    indent: bool = False,
+    sort_keys: bool = False,
+    default: Callable[[Any], Any] | None = None,
+) -> str:
+    """Serialize an object to a JSON string.
+
+    Args:
+        obj: Object to serialize.
+        indent: Pretty-print with two-space indentation.
+        sort_keys: Sort object keys.
+        default: Fallback for objects that are not natively serializable.
+
+    Returns:
+        JSON text.
+    """
+    return dumps_bytes(obj, indent=indent, sort_keys=sort_keys, default=default).decode("utf-8")
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse JSON text.
+
+    Args:
+        data: JSON as text or UTF-8 bytes.
+
+    Returns:
+        Parsed object.
+
+    Raises:
+        JSONDecodeError: If the input is not valid JSON.
+    """
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
+def strip_code_fence(text: str) -> str:
+    """Unwrap JSON that an LLM returned inside a markdown code block.
+
+    Args:
+        text: Model reply, fenced or not.
+
+    Returns:
+        The fenced content, or the text unchanged when it is not fenced.
+    """
+    fenced = _CODE_FENCE_RE.match(text)
+    return fenced.group(1) if fenced else text
@@ -0,0 +1,60 @@
+"""Single-flight coalescing of duplicate async calls."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Coalesce concurrent calls that share a key into a single in-flight call.
+
+    While a call for a key is running, later callers with the same key await
+    the same result instead of issuing their own request. Once the call
+    finishes the key is released, so results are never cached beyond the
+    lifetime of the call itself.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the coalescer."""
+        self._inflight: dict[str, asyncio.Task[Any]] = {}
+
+    @staticmethod
+    def make_key(*parts: str | None) -> str:
+        """Build a stable key from the parts that identify a call.
+
+        Args:
+            *parts: Identifying values (e.g. model, system prompt, prompt).
+
+        Returns:
+            Hex digest identifying the call.
+        """
+        joined = "\x1f".join(part or "" for part in parts)
+        return hashlib.sha256(joined.encode("utf-8")).hexdigest()
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run ``fn`` once for all concurrent callers sharing ``key``.
+
+        Args:
+            key: Key identifying the call.
+            fn: Zero-argument coroutine factory performing the call.
+
+        Returns:
+            The result of the (shared) call.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # Shield so one caller being cancelled doesn't cancel the others' call
+        return await asyncio.shield(task)
+
+    def __len__(self) -> int:
+        """Return the number of calls currently in flight."""
+        return len(self._inflight)
@@ -0,0 +1,130 @@
+"""Text helpers for Pencraft."""
+
+from __future__ import annotations
+
+import logging
+import re
+from functools import lru_cache
+from typing import Any
+
+try:
+    import tiktoken as _tiktoken
+except ImportError:  # pragma: no cover - depends on the installed packages
+    _tiktoken = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+_WORD_RE = re.compile(r"\S+")
+
+# Rough characters per token, used when no tokenizer is available for a model
+CHARS_PER_TOKEN = 4
+
+
+def count_words(text: str) -> int:
+    """Count whitespace-separated words without building a list of them.
+
+    Equivalent to ``len(text.split())``.
+
+    Args:
+        text: Text to count.
+
+    Returns:
+        Number of words.
+    """
+    return sum(1 for _ in _WORD_RE.finditer(text))
+
+
+class WordCounter:
+    """Incrementally count whitespace-separated words across streamed chunks.
+
+    Chunks may split a word in two; the counter tracks whether the previous
+    chunk ended mid-word so the total always equals ``len(text.split())`` of
+    the concatenated text.
+    """
+
+    __slots__ = ("count", "_in_word")
+
+    def __init__(self) -> None:
+        """Initialize an empty counter."""
+        self.count = 0
+        self._in_word = False
+
+    def feed(self, text: str) -> int:
+        """Add a chunk of text.
+
+        Args:
+            text: Next chunk of the stream.
+
+        Returns:
+            Running word count.
+        """
+        if text:
+            words = len(text.split())
+            if words and self._in_word and not text[0].isspace():
+                words -= 1
+            self.count += words
+            self._in_word = not text[-1].isspace()
+        return self.count
+
+
+@lru_cache(maxsize=16)
+def _encoding(model: str) -> Any | None:
+    """Get the tiktoken encoding for a model, or None if unavailable.
+
+    Unknown models use ``cl100k_base``. Failures (tiktoken not installed, or
+    its encoding files not downloadable) are cached so they are reported once.
+    """
+    if _tiktoken is None:
+        return None
+    try:
+        try:
+            return _tiktoken.encoding_for_model(model)
+        except KeyError:
+            return _tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logger.warning(f"No tokenizer for {model} ({e}); estimating tokens from length")
+        return None
+
+
+def count_tokens(text: str, model: str) -> int:
+    """Count the tokens of text with a model's tokenizer.
+
+    Falls back to an estimate of CHARS_PER_TOKEN characters per token when
+    the tokenizer is unavailable.
+
+    Args:
+        text: Text to count.
+        model: Model whose tokenizer counts the tokens.
+
+    Returns:
+        Number of tokens.
+    """
+    encoding = _encoding(model)
+    if encoding is None:
+        return -(-len(text) // CHARS_PER_TOKEN)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def truncate_tokens(text: str, max_tokens: int, model: str) -> str:
+    """Cut text to at most a number of tokens of a model's tokenizer.
+
+    Falls back to CHARS_PER_TOKEN characters per token when the tokenizer
+    is unavailable.
+
+    Args:
+        text: Text to cut.
+        max_tokens: Token budget.
+        model: Model whose tokenizer counts the tokens.
+
+    Returns:
+        The longest prefix of the text within the budget.
+    """
+    if max_tokens <= 0:
+        return ""
+    encoding = _encoding(model)
+    if encoding is None:
+        return text[: max_tokens * CHARS_PER_TOKEN]
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return str(encoding.decode(tokens[:max_tokens]))
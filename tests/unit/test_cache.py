@@ -0,0 +1,132 @@
+"""Tests for the on-disk result cache."""
+
+import os
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+from pencraft.agents.planner import BlogOutline, PlannerAgent, Section
+from pencraft.agents.writer import WriterAgent
+from pencraft.cache import DiskCache
+from pencraft.config.settings import Settings
+
+
+class TestDiskCache:
+    """Test cases for DiskCache."""
+
+    def test_miss_returns_none(self, tmp_path: Path) -> None:
+        """Test that unknown keys are cache misses."""
+        cache = DiskCache(tmp_path / "cache")
+
+        assert cache.get(DiskCache.make_key(topic="Python")) is None
+
+    def test_put_then_get(self, tmp_path: Path) -> None:
+        """Test round-tripping a value through the cache."""
+        cache = DiskCache(tmp_path / "cache")
+        key = DiskCache.make_key(topic="Python", word_count=2000)
+
+        cache.put(key, {"content": "summary", "metadata": {"sources": []}})
+
+        assert cache.get(key) == {"content": "summary", "metadata": {"sources": []}}
+        assert list((tmp_path / "cache").iterdir()) == [tmp_path / "cache" / f"{key}.json"]
+
+    def test_key_is_order_independent(self) -> None:
+        """Test that keys depend on values, not keyword order."""
+        assert DiskCache.make_key(a=1, b="x") == DiskCache.make_key(b="x", a=1)
+        assert DiskCache.make_key(a=1) != DiskCache.make_key(a=2)
+
+    def test_corrupt_entry_is_miss(self, tmp_path: Path) -> None:
+        """Test that unreadable entries are treated as misses."""
+        cache = DiskCache(tmp_path)
+        (tmp_path / "bad.json").write_text("{not json", encoding="utf-8")
+
+        assert cache.get("bad") is None
+
+    def test_recent_entries_served_from_memory(self, tmp_path: Path) -> None:
+        """Test that recently used entries are served without reading the file."""
+        cache = DiskCache(tmp_path, memory_entries=1)
+        cache.put("a", {"content": "first"})
+        cache.put("b", {"content": "second"})
+        for path in tmp_path.iterdir():
+            path.unlink()
+
+        assert cache.get("b") == {"content": "second"}
+        assert cache.get("a") is None  # Evicted from memory, gone from disk
+        info = cache.cache_info()
+        assert (info.hits, info.misses, info.memory_size) == (1, 1, 1)
+
+    def test_memory_entries_are_copies(self, tmp_path: Path) -> None:
+        """Test that changing a returned value does not change the cached entry."""
+        cache = DiskCache(tmp_path)
+        cache.put("a", {"tags": ["x"]})
+
+        cache.get("a")["tags"].append("y")  # type: ignore[index]
+
+        assert cache.get("a") == {"tags": ["x"]}
+
+    def test_stale_entry_is_miss(self, tmp_path: Path) -> None:
+        """Test that entries older than the TTL are misses, on disk and in memory."""
+        DiskCache(tmp_path).put("a", {"content": "old"})
+        cache = DiskCache(tmp_path, ttl=60)
+        old = (tmp_path / "a.json").stat().st_mtime - 120
+        os.utime(tmp_path / "a.json", (old, old))
+
+        assert cache.get("a") is None
+        cache.put("a", {"content": "new"})
+        cache.ttl = 0.0001
+        time.sleep(0.01)
+        assert cache.get("a") is None
+
+
+class TestCompletionCache:
+    """Test cases for caching individual LLM completions."""
+
+    def _agent(self, settings: Settings, tmp_path: Path) -> PlannerAgent:
+        llm = MagicMock()
+        llm.model = "test-model"
+        llm.temperature = 0.7
+        llm.generate.return_value = "outline"
+        llm.agenerate = AsyncMock(return_value="outline")
+        return PlannerAgent(llm, settings=settings, cache=DiskCache(tmp_path))
+
+    async def test_repeated_prompt_served_from_cache(
+        self, settings: Settings, tmp_path: Path
+    ) -> None:
+        """Test that an identical prompt is only sent once, sync or async."""
+        settings.cache.llm_responses = True
+        agent = self._agent(settings, tmp_path)
+
+        assert agent._generate("plan", system_prompt="sys") == "outline"
+        assert await agent._agenerate("plan", system_prompt="sys") == "outline"
+        agent._generate("plan", system_prompt="other")
+
+        assert agent.llm.generate.call_count == 2
+        agent.llm.agenerate.assert_not_called()
+
+    def test_disabled_by_default(self, settings: Settings, tmp_path: Path) -> None:
+        """Test that completions are not cached unless enabled."""
+        agent = self._agent(settings, tmp_path)
+
+        agent._generate("plan")
+        agent._generate("plan")
+
+        assert agent.llm.generate.call_count == 2
+
+    def test_streamed_writer_parts_cached(self, settings: Settings, tmp_path: Path) -> None:
+        """Test that streamed writer sections are reused on an identical rerun."""
+        settings.cache.llm_responses = True
+        settings.blog.include_citations = False
+        llm = MagicMock()
+        llm.model = "test-model"
+        llm.temperature = 0.7
+        llm.generate.return_value = "Text."
+        llm.generate_stream.side_effect = lambda *_a, **_k: iter(["Section ", "body."])
+        writer = WriterAgent(llm, settings=settings, cache=DiskCache(tmp_path))
+        outline = BlogOutline(title="Python", meta_description="", sections=[Section("Basics")])
+
+        first = writer.execute(outline, "notes")
+        second = writer.execute(outline, "notes", draft_path=tmp_path / "post.md.part")
+
+        assert first.content == second.content
+        assert llm.generate_stream.call_count == 1
+        assert (tmp_path / "post.md.part").read_text(encoding="utf-8") == second.content
@@ -0,0 +1,78 @@
+"""Tests for the command-line interface."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from pencraft import __version__
+from pencraft.cli import _cmd_write, _split_csv, app, build_parser
+
+
+class TestParser:
+    """Test cases for the argparse command line."""
+
+    def test_write_options(self) -> None:
+        """Test that write parses its options into the handler's arguments."""
+        args = build_parser().parse_args(
+            ["write", "Python", "-w", "3000", "--tags", "a,b", "--skip-research"]
+        )
+
+        assert args.handler is _cmd_write
+        assert args.topic == "Python"
+        assert args.words == 3000
+        assert args.tags == "a,b"
+        assert args.skip_research is True
+        assert args.output == Path("./output")
+        assert args.config_file is None
+
+    def test_version(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test that --version prints the version and exits successfully."""
+        with pytest.raises(SystemExit) as exc_info:
+            app(["--version"])
+
+        assert exc_info.value.code == 0
+        assert capsys.readouterr().out.strip() == f"Pencraft version {__version__}"
+
+    def test_command_required(self) -> None:
+        """Test that running without a command is a usage error."""
+        with pytest.raises(SystemExit) as exc_info:
+            app([])
+
+        assert exc_info.value.code == 2
+
+    def test_split_csv(self) -> None:
+        """Test that comma-separated options are split and stripped."""
+        assert _split_csv("python, programming ,ai") == ["python", "programming", "ai"]
+        assert _split_csv(None) is None
+        assert _split_csv("") is None
+
+
+class TestConfigCommand:
+    """Test cases for the config command."""
+
+    def test_init_writes_config(self, tmp_path: Path) -> None:
+        """Test that config --init creates the file and exits with 0."""
+        path = tmp_path / "pencraft.yaml"
+
+        assert app(["config", "--init", "--path", str(path)]) == 0
+        assert path.exists()
+
+
+class TestStartup:
+    """Test cases for CLI import cost."""
+
+    def test_import_skips_heavy_modules(self) -> None:
+        """Test that importing the CLI loads neither the agents nor YAML and Rich."""
+        code = (
+            "import sys, pencraft.cli; "
+            "print(sorted(m for m in ('pencraft.enhancer', 'pencraft.agents', 'yaml', 'rich') "
+            "if m in sys.modules))"
+        )
+
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "[]"
@@ -105,6 +105,36 @@ class TestFrontmatterGenerator:
         assert "python" in fm
         assert "categories:" in fm
 
+    def test_yaml_defaults_match_full_render(self) -> None:
+        """Test that pre-rendered defaults produce the same YAML as a full render."""
+        defaults = {"author": "Default", "draft": True, "series": ["one", "two"], "toc": False}
+        gen = FrontmatterGenerator(default_fields=defaults)
+
+        fm = gen.generate(
+            title="Test",
+            date="2026-01-01",
+            tags=["python"],
+            series=["override"],
+            custom="value",
+            description="Desc",
+        )
+
+        expected = gen._format_yaml(
+            {
+                "title": "Test",
+                "date": "2026-01-01",
+                "draft": False,
+                "description": "Desc",
+                "tags": ["python"],
+                "toc": True,
+                "author": "Default",
+                "series": ["override"],
+                "custom": "value",
+            }
+        )
+        assert fm == expected
+        assert "series:\n  - override\n" in fm
+
     def test_parse_yaml(self) -> None:
         """Test YAML parsing."""
         gen = FrontmatterGenerator()
@@ -163,3 +193,17 @@ class TestCitationFormatter:
         formatter = CitationFormatter.from_sources(sources)
 
         assert len(formatter.citations) == 2
+
+    def test_render_styles_from_parsed(self) -> None:
+        """Test rendering one parsed citation list in several styles."""
+        sources = [{"title": "A", "url": "http://a.com", "author": "Ann", "date": "2024"}]
+        parsed = CitationFormatter.parse(sources)
+        formatter = CitationFormatter(citations=parsed)
+
+        for style in ("markdown", "apa", "mla", "chicago", "unknown"):
+            expected = CitationFormatter.from_sources(sources, style=style)
+            expected._citations[0].accessed = parsed[0].accessed
+            assert formatter.render(style) == expected.generate_references_section()
+
+        assert "Ann (2024) *A*" in formatter.render("apa")
+        assert formatter.add_citation(Citation(title="B", url="http://b.com")) == 2
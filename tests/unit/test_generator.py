@@ -0,0 +1,141 @@
+"""Tests for the blog generator."""
+
+import asyncio
+import errno
+import os
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from pencraft.agents.base import AgentResult
+from pencraft.config.settings import Settings
+from pencraft.generator import BlogGenerator
+
+
+def _generator(settings: Settings, events: list[str]) -> BlogGenerator:
+    """Build a generator whose agents record when each stage runs."""
+    generator = BlogGenerator(settings, llm_client=MagicMock())
+
+    async def research(topic: str, **_kwargs: Any) -> AgentResult:
+        if topic == "broken":
+            error = TimeoutError("no results")
+            return AgentResult(success=False, content="", error=str(error), exception=error)
+        events.append(f"research:{topic}")
+        return AgentResult(success=True, content=f"notes on {topic}")
+
+    async def plan(topic: str, **_kwargs: Any) -> AgentResult:
+        events.append(f"plan:{topic}")
+        outline = {"title": topic, "meta_description": "", "sections": []}
+        return AgentResult(success=True, content="", metadata={"outline": outline})
+
+    async def write(outline: Any, **_kwargs: Any) -> AgentResult:
+        events.append(f"write-start:{outline.title}")
+        await asyncio.sleep(0.01)
+        events.append(f"write-end:{outline.title}")
+        return AgentResult(success=True, content="Body text here.")
+
+    generator.research_agent.aexecute = research  # type: ignore[method-assign]
+    generator.planner_agent.aexecute = plan  # type: ignore[method-assign]
+    generator.writer_agent.aexecute = write  # type: ignore[method-assign]
+    return generator
+
+
+class TestGeneratePipelined:
+    """Test cases for BlogGenerator.agenerate_pipelined."""
+
+    async def test_results_in_input_order(self, settings: Settings) -> None:
+        """Test that every job yields a post or its error, in input order."""
+        generator = _generator(settings, [])
+
+        results = await generator.agenerate_pipelined(
+            [{"topic": "alpha"}, {"topic": "broken"}, {"topic": "gamma"}]
+        )
+
+        assert [getattr(r, "title", None) for r in results] == ["alpha", None, "gamma"]
+        assert isinstance(results[1], RuntimeError)
+        assert "no results" in str(results[1])
+
+    async def test_agent_error_chained(self, settings: Settings) -> None:
+        """Test that a failed stage keeps the agent's exception as the cause."""
+        generator = _generator(settings, [])
+
+        [result] = await generator.agenerate_pipelined([{"topic": "broken"}])
+
+        assert isinstance(result, RuntimeError)
+        assert isinstance(result.__cause__, TimeoutError)
+
+    async def test_next_topic_prepared_while_writing(self, settings: Settings) -> None:
+        """Test that research and planning for a topic overlap the previous write."""
+        events: list[str] = []
+        generator = _generator(settings, events)
+
+        await generator.agenerate_pipelined([{"topic": "alpha"}, {"topic": "beta"}])
+
+        assert events.index("plan:beta") < events.index("write-end:alpha")
+
+    async def test_tuple_tags_accepted(self, settings: Settings) -> None:
+        """Test that tags and categories may be passed as immutable tuples."""
+        generator = _generator(settings, [])
+
+        [blog] = await generator.agenerate_pipelined(
+            [{"topic": "alpha", "tags": ("a", "b"), "categories": ("C",)}]
+        )
+
+        assert "tags:\n  - a\n  - b\n" in getattr(blog, "frontmatter", "")
+
+    async def test_saved_atomically(self, settings: Settings, tmp_path: Path) -> None:
+        """Test that posts are saved without leaving draft or temporary files."""
+        generator = _generator(settings, [])
+
+        [blog] = await generator.agenerate_pipelined(
+            [{"topic": "alpha", "output_dir": tmp_path, "filename": "alpha.md"}]
+        )
+
+        assert [p.name for p in tmp_path.iterdir()] == ["alpha.md"]
+        assert (tmp_path / "alpha.md").read_text(encoding="utf-8") == getattr(
+            blog, "full_content", None
+        )
+
+    def test_failed_save_leaves_no_temporary_file(self, settings: Settings, tmp_path: Path) -> None:
+        """Test that a write error removes the temporary file before it propagates."""
+        generator = BlogGenerator(settings, llm_client=MagicMock())
+
+        with (
+            patch.object(os, "replace", side_effect=OSError(errno.ENOSPC, "No space left")),
+            pytest.raises(OSError, match="No space left"),
+        ):
+            generator._save_to_file("Body", "Title", tmp_path, "post.md")
+
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestWordCount:
+    """Test cases for the generated post's word count."""
+
+    def test_writer_count_reused(self) -> None:
+        """Test that the writer's count is used instead of recounting the text."""
+        result = AgentResult(
+            success=True, content="three words here", metadata={"blog_post": {"word_count": 7}}
+        )
+
+        assert BlogGenerator._written_word_count(result) == 7
+
+    def test_counted_when_missing(self) -> None:
+        """Test that the text is counted when the writer reports no count."""
+        result = AgentResult(success=True, content="three words here")
+
+        assert BlogGenerator._written_word_count(result) == 3
+
+
+class TestCleanup:
+    """Test cases for releasing the generator's connections."""
+
+    async def test_context_exit_closes_scraper_client(self, settings: Settings) -> None:
+        """Test that leaving the async context closes the scraper's shared client."""
+        async with BlogGenerator(settings, llm_client=MagicMock()) as generator:
+            client = generator.research_agent.scraper._get_async_client()
+
+        assert client.is_closed
+        assert generator.research_agent.scraper._async_client is None
@@ -0,0 +1,187 @@
+"""Tests for the LLM client."""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from pencraft.config.settings import Settings
+from pencraft.llm.client import LLMClient
+
+
+def _batch_line(custom_id: str, content: str, status_code: int = 200) -> str:
+    """Build one line of a Batch API output file."""
+    body = {"choices": [{"message": {"content": content}}]}
+    return json.dumps(
+        {"custom_id": custom_id, "response": {"status_code": status_code, "body": body}}
+    )
+
+
+class TestGenerateBatch:
+    """Test cases for LLMClient.generate_batch."""
+
+    def _client(self, settings: Settings, status: str, output: str) -> LLMClient:
+        client = LLMClient(settings=settings.llm)
+        api = MagicMock()
+        api.files.create.return_value = SimpleNamespace(id="file-in")
+        api.batches.create.return_value = SimpleNamespace(
+            id="batch-1", status="in_progress", output_file_id=None
+        )
+        api.batches.retrieve.return_value = SimpleNamespace(
+            id="batch-1", status=status, output_file_id="file-out"
+        )
+        api.files.content.return_value = SimpleNamespace(text=output)
+        client._client = api
+        return client
+
+    def test_results_joined_by_custom_id(self, settings: Settings) -> None:
+        """Test that results come back in input order regardless of output order."""
+        output = "\n".join(
+            [_batch_line("1", "second"), _batch_line("2", "", 500), _batch_line("0", "first")]
+        )
+        client = self._client(settings, "completed", output)
+
+        results = client.generate_batch(["a", "b", "c"], system_prompt="sys", poll_interval=0)
+
+        assert results == ["first", "second", ""]
+        upload = client._client.files.create.call_args.kwargs
+        assert upload["purpose"] == "batch"
+        requests = [json.loads(line) for line in upload["file"][1].decode().splitlines()]
+        assert [r["custom_id"] for r in requests] == ["0", "1", "2"]
+        assert requests[0]["body"]["messages"][0] == {"role": "system", "content": "sys"}
+
+    def test_failed_batch_raises(self, settings: Settings) -> None:
+        """Test that a batch ending in a non-completed state raises."""
+        client = self._client(settings, "expired", "")
+
+        with pytest.raises(RuntimeError, match="expired"):
+            client.generate_batch(["a"], poll_interval=0)
+
+    def test_timeout_cancels_batch(self, settings: Settings) -> None:
+        """Test that a batch still running at the deadline is cancelled."""
+        client = self._client(settings, "in_progress", "")
+
+        with pytest.raises(TimeoutError, match="batch-1"):
+            client.generate_batch(["a"], poll_interval=0, timeout=0.01)
+
+        client._client.batches.cancel.assert_called_once_with("batch-1")
+        client._client.files.content.assert_not_called()
+
+    def test_empty_prompts(self, settings: Settings) -> None:
+        """Test that no job is submitted for an empty prompt list."""
+        client = self._client(settings, "completed", "")
+
+        assert client.generate_batch([]) == []
+        client._client.files.create.assert_not_called()
+
+
+class TestWarmup:
+    """Test cases for LLMClient warmup."""
+
+    def test_warmup_sends_one_token_request(self, settings: Settings) -> None:
+        """Test that warmup issues a single minimal request."""
+        client = LLMClient(settings=settings.llm)
+        client._client = MagicMock()
+
+        assert client.warmup() is True
+        kwargs = client._client.chat.completions.create.call_args.kwargs
+        assert kwargs["max_tokens"] == 1
+
+    async def test_awarmup_failure_is_reported(self, settings: Settings) -> None:
+        """Test that a failed warmup returns False instead of raising."""
+        client = LLMClient(settings=settings.llm)
+        client._async_client = MagicMock()
+        client._async_client.chat.completions.create.side_effect = ConnectionError("down")
+
+        assert await client.awarmup() is False
+
+
+class TestHttpClient:
+    """Test cases for injecting HTTP clients."""
+
+    async def test_async_requests_use_given_client(self, settings: Settings) -> None:
+        """Test that async requests go through a caller-provided connection pool."""
+        requested: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requested.append(request.url.path)
+            return httpx.Response(200, json={"object": "list", "data": []})
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+            client = LLMClient(settings=settings.llm, async_http_client=http)
+
+            assert await client.acheck_connection() is True
+
+        assert requested == ["/models"]
+
+    def test_pool_size_bounds_connections(self, settings: Settings) -> None:
+        """Test that pool_size sizes the connection pools of both clients, keeping SDK defaults."""
+        settings.llm.pool_size = 7
+        client = LLMClient(settings=settings.llm)
+
+        for http in (client._client._client, client._async_client._client):
+            assert http.follow_redirects
+            pool = http._transport._pool
+            assert pool._max_connections == pool._max_keepalive_connections == 7
+
+
+class TestCheckConnection:
+    """Test cases for the LLMClient pre-flight connection check."""
+
+    def test_check_connection_uses_short_timeout(self, settings: Settings) -> None:
+        """Test that the pre-flight check lists models without retries."""
+        client = LLMClient(settings=settings.llm)
+        client._client = MagicMock()
+
+        assert client.check_connection(timeout=1.5) is True
+        client._client.with_options.assert_called_once_with(timeout=1.5, max_retries=0)
+
+    async def test_acheck_connection_failure(self, settings: Settings) -> None:
+        """Test that an unreachable endpoint is reported as False."""
+        client = LLMClient(settings=settings.llm, base_url="http://127.0.0.1:9")
+
+        assert await client.acheck_connection(timeout=0.5) is False
+
+
+class TestExtraBody:
+    """Test cases for the configured extra_body."""
+
+    def test_merged_into_requests(self, settings: Settings) -> None:
+        """Test that configured fields are sent and per-call fields take precedence."""
+        settings.llm.extra_body = {"top_k": 40, "min_p": 0.1}
+        client = LLMClient(settings=settings.llm)
+        client._client = MagicMock()
+
+        client.chat([{"role": "user", "content": "hi"}], extra_body={"top_k": 10})
+
+        kwargs = client._client.chat.completions.create.call_args.kwargs
+        assert kwargs["extra_body"] == {"top_k": 10, "min_p": 0.1}
+
+    def test_omitted_by_default(self, settings: Settings) -> None:
+        """Test that no extra_body is sent unless configured."""
+        client = LLMClient(settings=settings.llm)
+        client._client = MagicMock()
+
+        client.chat([{"role": "user", "content": "hi"}])
+
+        assert "extra_body" not in client._client.chat.completions.create.call_args.kwargs
+
+
+class TestStreamSetting:
+    """Test cases for the llm.stream setting."""
+
+    def test_generate_streams_when_enabled(self, settings: Settings) -> None:
+        """Test that generate() joins streamed deltas when streaming is on."""
+        settings.llm.stream = True
+        client = LLMClient(settings=settings.llm)
+        chunks = [
+            SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=text))])
+            for text in ["Hello", None, " world"]
+        ]
+        client._client = MagicMock()
+        client._client.chat.completions.create.return_value = iter(chunks)
+
+        assert client.generate("hi") == "Hello world"
+        assert client._client.chat.completions.create.call_args.kwargs["stream"] is True
@@ -0,0 +1,170 @@
+"""Tests for the planner agent."""
+
+import json
+from collections.abc import AsyncIterator, Iterator
+from unittest.mock import AsyncMock, MagicMock
+
+from pencraft.agents.planner import BlogOutline, PlannerAgent, Section, _dedupe
+from pencraft.config.settings import Settings
+from pencraft.llm.prompts import OUTLINE_INSTRUCTIONS
+
+OUTLINE_JSON = json.dumps(
+    {
+        "title": "Python Internals",
+        "meta_description": "How CPython runs your code.",
+        "layout_type": "deep-dive",
+        "tags": ["python"],
+        "categories": ["Programming"],
+        "seo_keywords": ["cpython"],
+        "sections": [
+            {
+                "title": "The Eval Loop",
+                "key_points": ["bytecode"],
+                "subsections": [{"title": "Frames", "key_points": ["stack"]}],
+            }
+        ],
+    }
+)
+
+
+class TestStructuredOutline:
+    """Test cases for planning with a JSON schema."""
+
+    def test_single_call_with_json_schema(self, settings: Settings) -> None:
+        """Test that a schema-enforcing backend is asked once for the structured outline."""
+        settings.llm.supports_json_schema = True
+        llm = MagicMock()
+        llm.generate.return_value = OUTLINE_JSON
+
+        result = PlannerAgent(llm, settings=settings).execute("Python", "notes")
+
+        assert result.success
+        assert llm.generate.call_count == 1
+        kwargs = llm.generate.call_args.kwargs
+        assert kwargs["response_format"]["json_schema"]["strict"] is True
+        outline = result.metadata["outline"]
+        assert outline["title"] == "Python Internals"
+        assert outline["sections"][0]["subsections"][0]["title"] == "Frames"
+
+    def test_extracted_with_second_call_by_default(self, settings: Settings) -> None:
+        """Test that other backends get a plain outline that is extracted afterwards."""
+        llm = MagicMock()
+        llm.generate.return_value = "## Outline"
+        llm.generate_stream.side_effect = lambda *_a, **_k: (d for d in [OUTLINE_JSON])
+
+        result = PlannerAgent(llm, settings=settings).execute("Python", "notes")
+
+        assert result.success
+        assert llm.generate.call_count == llm.generate_stream.call_count == 1
+        assert "response_format" not in llm.generate.call_args.kwargs
+        assert result.metadata["outline"]["title"] == "Python Internals"
+
+    def test_extraction_uses_reformatter_model(self, settings: Settings) -> None:
+        """Test that the extraction call goes to the configured reformatter model."""
+        settings.llm.reformatter_model = "small-model"
+        llm = MagicMock()
+        llm.generate.return_value = "## Outline"
+        llm.generate_stream.side_effect = lambda *_a, **_k: (d for d in [OUTLINE_JSON])
+
+        PlannerAgent(llm, settings=settings).execute("Python", "notes")
+
+        assert "model" not in llm.generate.call_args.kwargs
+        assert llm.generate_stream.call_args.kwargs["model"] == "small-model"
+
+    def test_fenced_extraction_reply(self, settings: Settings) -> None:
+        """Test that an extraction reply wrapped in a code block is unwrapped."""
+        llm = MagicMock()
+        llm.generate.return_value = "## Outline"
+        deltas = ["```json\n", OUTLINE_JSON[:40], OUTLINE_JSON[40:], "\n```\n"]
+        llm.generate_stream.side_effect = lambda *_a, **_k: (d for d in deltas)
+
+        result = PlannerAgent(llm, settings=settings).execute("Python", "notes")
+
+        assert result.metadata["outline"]["sections"][0]["title"] == "The Eval Loop"
+
+    def test_extraction_stream_stops_after_object(self, settings: Settings) -> None:
+        """Test that the extraction stream is not read past the JSON object."""
+        consumed: list[str] = []
+
+        def stream(*_args: object, **_kwargs: object) -> Iterator[str]:
+            for delta in [OUTLINE_JSON, "\nHope this helps!", " More text."]:
+                consumed.append(delta)
+                yield delta
+
+        llm = MagicMock()
+        llm.generate.return_value = "## Outline"
+        llm.generate_stream.side_effect = stream
+
+        result = PlannerAgent(llm, settings=settings).execute("Python", "notes")
+
+        assert result.metadata["outline"]["title"] == "Python Internals"
+        assert consumed == [OUTLINE_JSON]
+
+    async def test_async_extraction_stays_async(self, settings: Settings) -> None:
+        """Test that aexecute extracts the structure without blocking calls."""
+
+        async def astream(*_args: object, **_kwargs: object) -> AsyncIterator[str]:
+            yield OUTLINE_JSON
+
+        llm = MagicMock()
+        llm.agenerate = AsyncMock(return_value="## Outline")
+        llm.agenerate_stream.side_effect = astream
+
+        result = await PlannerAgent(llm, settings=settings).aexecute("Python", "notes")
+
+        assert result.metadata["outline"]["title"] == "Python Internals"
+        llm.generate.assert_not_called()
+        llm.generate_stream.assert_not_called()
+
+
+class TestOutlinePrompt:
+    """Test cases for the outline prompt layout."""
+
+    def test_topic_input_comes_last(self, settings: Settings) -> None:
+        """Test that prompts for different topics share the instruction prefix."""
+        agent = PlannerAgent(MagicMock(), settings=settings)
+
+        for json_schema in (False, True):
+            settings.llm.supports_json_schema = json_schema
+            first, _ = agent._outline_request("Python", "notes", 2000)
+            second, _ = agent._outline_request("Rust", "other notes", 3000)
+
+            assert first.startswith(OUTLINE_INSTRUCTIONS)
+            assert first.endswith("**Target Length:** 2000 words")
+            assert first[: first.index("Python")] == second[: second.index("Rust")]
+
+    def test_prompt_reused_for_same_inputs(self, settings: Settings) -> None:
+        """Test that re-planning the same inputs reuses the formatted prompt."""
+        agent = PlannerAgent(MagicMock(), settings=settings)
+
+        first, _ = agent._outline_request("Python", "notes", 2000)
+        second, _ = agent._outline_request("Python", "notes", 2000)
+
+        assert first is second
+
+
+class TestDedupe:
+    """Test cases for merging tags and categories."""
+
+    def test_order_kept_and_case_insensitive(self) -> None:
+        """Test that the first spelling wins and order is preserved."""
+        assert _dedupe(["AI", "Python "], ["python", "ai", "", "mcp"]) == ["AI", "Python", "mcp"]
+
+
+class TestBlogOutline:
+    """Test cases for BlogOutline conversions."""
+
+    def test_serialize_matches_separate_conversions(self) -> None:
+        """Test that the single-pass conversion equals to_dict() and to_markdown()."""
+        outline = BlogOutline(
+            title="Python",
+            meta_description="About Python",
+            sections=[
+                Section(title="Basics", key_points=["syntax"]),
+                Section(title="Internals", subsections=[Section(title="GC", key_points=["rc"])]),
+            ],
+            tags=["python"],
+        )
+
+        assert outline.serialize() == (outline.to_dict(), outline.to_markdown())
+        assert "#### 2.1. GC\n  - rc\n" in outline.to_markdown()
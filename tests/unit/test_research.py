@@ -0,0 +1,262 @@
+"""Tests for the research agent."""
+
+import asyncio
+import logging
+import threading
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from pencraft.agents.research import ResearchAgent
+from pencraft.config.settings import Settings
+from pencraft.llm.prompts import RESEARCH_PROMPT, RETRIEVAL_NECESSITY_PROMPT
+from pencraft.tools.scraper import ScrapedContent
+from pencraft.tools.search import SearchError, SearchResult, SearchTool
+from pencraft.utils import text as text_utils
+from pencraft.utils.ratelimit import TokenBucket
+
+
+def _agent(settings: Settings, gate_answer: str) -> tuple[ResearchAgent, MagicMock, MagicMock]:
+    """Build a research agent with mocked LLM, search and scraper."""
+    gate_prompt = RETRIEVAL_NECESSITY_PROMPT.format(topic="Python")
+
+    def generate(prompt: str, **_kwargs: object) -> str:
+        if prompt == gate_prompt:
+            return gate_answer
+        return "python basics"
+
+    llm = MagicMock()
+    llm.model = "test-model"
+    llm.generate.side_effect = generate
+    search_tool = SearchTool()
+    search_tool.search = MagicMock(  # type: ignore[method-assign]
+        return_value=[
+            SearchResult(title="Python", url="https://python.org", snippet="The language")
+        ]
+    )
+    scraper = MagicMock()
+    scraper.cached.return_value = None
+    agent = ResearchAgent(llm, settings=settings, search_tool=search_tool, scraper=scraper)
+    return agent, llm, scraper
+
+
+class TestRetrievalNecessity:
+    """Test cases for the retrieval necessity gate."""
+
+    def test_no_skips_scraping_and_synthesis(self, settings: Settings) -> None:
+        """Test that a NO answer skips scraping and the synthesis call."""
+        settings.research.detect_retrieval_necessity = True
+        agent, llm, scraper = _agent(settings, "NO")
+
+        result = agent.execute("Python", use_trends=False)
+
+        assert result.success
+        assert "https://python.org" in result.content
+        scraper.scrape.assert_not_called()
+        assert llm.generate.call_count == 2  # search queries + gate
+
+    def test_disabled_by_default(self, settings: Settings) -> None:
+        """Test that the gate is not asked unless enabled."""
+        agent, llm, scraper = _agent(settings, "NO")
+
+        agent.execute("Python", use_trends=False)
+
+        prompts = [call.args[0] for call in llm.generate.call_args_list]
+        assert RETRIEVAL_NECESSITY_PROMPT.format(topic="Python") not in prompts
+        scraper.scrape.assert_called_once_with("https://python.org")
+
+
+class TestParallelResearch:
+    """Test cases for running searches in parallel."""
+
+    def test_searches_overlap_and_keep_order(self, settings: Settings) -> None:
+        """Test that queries are searched concurrently and merged in query order."""
+        agent, _, _ = _agent(settings, "YES")
+        barrier = threading.Barrier(2, timeout=5)
+
+        def search(query: str, **_kwargs: object) -> list[SearchResult]:
+            barrier.wait()  # Only returns once both searches are in flight
+            return [SearchResult(title=query, url=f"https://{query}.org", snippet="")]
+
+        agent.search_tool.search = search  # type: ignore[method-assign]
+
+        result = agent.execute("Python", search_queries=["a", "b"], use_trends=False)
+
+        assert result.success
+        urls = [r["url"] for r in result.metadata["research_data"]["search_results"]]
+        assert urls == ["https://a.org", "https://b.org"]
+
+    async def test_async_searches_overlap_and_survive_failures(self, settings: Settings) -> None:
+        """Test that async searches run together and a failed query is skipped."""
+        agent, llm, _ = _agent(settings, "YES")
+        llm.agenerate = AsyncMock(return_value="summary")
+        agent.scraper.ascrape_many = AsyncMock(return_value=[])
+        started: list[str] = []
+        both_started = asyncio.Event()
+
+        async def asearch(query: str) -> list[SearchResult]:
+            started.append(query)
+            if len(started) == 2:
+                both_started.set()
+            await asyncio.wait_for(both_started.wait(), timeout=5)
+            if query == "broken":
+                raise RuntimeError("rate limited")
+            return [SearchResult(title=query, url=f"https://{query}.org", snippet="")]
+
+        agent._asearch = asearch  # type: ignore[method-assign]
+
+        result = await agent.aexecute("Python", search_queries=["broken", "a"])
+
+        assert result.success
+        urls = [r["url"] for r in result.metadata["research_data"]["search_results"]]
+        assert urls == ["https://a.org"]
+
+
+class TestDedupeByUrl:
+    """Test cases for deduplicating search results."""
+
+    def test_first_result_per_url_kept_in_order(self) -> None:
+        """Test that the first result for each URL wins and order is preserved."""
+        results = [
+            SearchResult(title="first", url="https://a.org", snippet=""),
+            SearchResult(title="b", url="https://b.org", snippet=""),
+            SearchResult(title="second", url="https://a.org", snippet=""),
+        ]
+
+        unique = ResearchAgent._dedupe_by_url(results)
+
+        assert [r.title for r in unique] == ["first", "b"]
+
+
+class TestResearchPrompt:
+    """Test cases for the synthesis prompt."""
+
+    def test_matches_full_template(self) -> None:
+        """Test that the prompt equals formatting the whole RESEARCH_PROMPT."""
+        assert ResearchAgent._research_prompt("Python", "") == RESEARCH_PROMPT.format(
+            topic="Python", additional_context="No additional context provided."
+        )
+
+    def test_scraped_pages_share_token_budget(
+        self, settings: Settings, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a short page leaves its unused budget to the next one."""
+        monkeypatch.setattr(text_utils, "_encoding", lambda _model: None)  # 4 chars a token
+        settings.research.context_tokens = 10
+        agent, _, _ = _agent(settings, "YES")
+        pages = [
+            ScrapedContent(url="https://a.org", title="A", content="a" * 8),
+            ScrapedContent(url="https://b.org", title="B", content="b" * 100),
+        ]
+
+        context = agent._scraped_context(pages)
+
+        assert "\n" + "a" * 8 + "..." in context
+        assert "\n" + "b" * 32 + "..." in context
+
+
+class TestRateLimiting:
+    """Test cases for pacing searches and scrapes."""
+
+    def test_limiter_built_from_settings(self, settings: Settings) -> None:
+        """Test that research.requests_per_second enables the rate limiter."""
+        assert _agent(settings, "YES")[0].rate_limiter is None
+
+        settings.research.requests_per_second = 2.0
+        agent, _, _ = _agent(settings, "YES")
+
+        assert agent.rate_limiter is not None
+        assert agent.rate_limiter.rate == 2.0
+
+    def test_calls_paced_and_rate_adapted(self, settings: Settings) -> None:
+        """Test that every search and scrape waits for a token and rate limits back off."""
+        limiter = MagicMock(spec=TokenBucket, rate=1.0)
+        agent, _, scraper = _agent(settings, "YES")
+        agent.rate_limiter = limiter
+        scraper.scrape.return_value = ScrapedContent(
+            url="https://python.org",
+            title="",
+            content="",
+            success=False,
+            error="HTTP error: Client error '429 Too Many Requests'",
+        )
+
+        agent.execute("Python", search_queries=["a", "b"], use_trends=False)
+
+        assert limiter.acquire.call_count == 3  # two searches, one scrape
+        assert limiter.reward.call_count == 2
+        limiter.penalize.assert_called_once()
+
+    async def test_async_calls_paced(self, settings: Settings) -> None:
+        """Test that async searches and scrapes wait for the shared limiter."""
+        limiter = MagicMock(spec=TokenBucket, rate=1.0)
+        agent, llm, scraper = _agent(settings, "YES")
+        agent.rate_limiter = limiter
+        llm.agenerate = AsyncMock(return_value="summary")
+        scraper.ascrape = AsyncMock(
+            return_value=ScrapedContent(url="https://python.org", title="P", content="text")
+        )
+
+        result = await agent.aexecute("Python", search_queries=["a"])
+
+        assert result.success
+        assert limiter.aacquire.await_count == 2
+        assert limiter.reward.call_count == 2
+        scraper.ascrape_many.assert_not_called()
+
+    def test_only_search_errors_back_off(self, settings: Settings) -> None:
+        """Test that failed searches slow down but searches finding nothing don't."""
+        limiter = MagicMock(spec=TokenBucket, rate=1.0)
+        agent, _, _ = _agent(settings, "YES")
+        agent.rate_limiter = limiter
+        agent.search_tool.search.side_effect = [  # type: ignore[attr-defined]
+            [],
+            SearchError("Search error for 'b': 202 Ratelimit"),
+        ]
+
+        assert agent._search("a") == []
+        limiter.penalize.assert_not_called()
+        assert agent._search("b") == []
+        limiter.penalize.assert_called_once()
+
+    async def test_cached_pages_skip_limiter(self, settings: Settings) -> None:
+        """Test that pages already scraped don't wait for a token."""
+        limiter = MagicMock(spec=TokenBucket, rate=1.0)
+        agent, _, scraper = _agent(settings, "YES")
+        agent.rate_limiter = limiter
+        page = ScrapedContent(url="https://python.org", title="P", content="text")
+        scraper.cached.return_value = page
+
+        assert await agent._ascrape("https://python.org") is page
+        assert agent._scrape("https://python.org") is page
+
+        limiter.aacquire.assert_not_called()
+        limiter.acquire.assert_not_called()
+        scraper.ascrape.assert_not_called()
+        scraper.scrape.assert_not_called()
+
+
+class TestAgentLog:
+    """Test cases for lazily formatted agent log messages."""
+
+    def test_arguments_formatted_for_progress(self, settings: Settings) -> None:
+        """Test that progress callbacks receive the formatted message."""
+        agent, _, _ = _agent(settings, "YES")
+        messages: list[str] = []
+        agent.on_progress = messages.append
+
+        agent.log("Found %d results for: %s", 3, "python")
+
+        assert messages == ["Found 3 results for: python"]
+
+    def test_arguments_not_formatted_when_unused(
+        self, settings: Settings, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test that nothing is formatted when the message is neither logged nor reported."""
+        agent, _, _ = _agent(settings, "YES")
+        caplog.set_level(logging.INFO, logger=agent._logger.name)
+        argument = MagicMock()
+
+        agent.log("Value: %s", argument, level=logging.DEBUG)
+
+        argument.__str__.assert_not_called()
@@ -0,0 +1,96 @@
+"""Tests for the web scraper."""
+
+import httpx
+
+from pencraft.tools.scraper import PREVIEW_CHARS, ScrapedContent, WebScraper
+
+PAGE = """<html><head><title>Example</title></head>
+<body><nav>menu</nav><article><h1>Heading</h1><p>Some article text here.</p></article></body>
+</html>"""
+
+
+class TestWebScraper:
+    """Test cases for WebScraper."""
+
+    async def test_ascrape_many_dedupes_and_caches(self) -> None:
+        """Test that duplicate URLs are fetched once and cached across calls."""
+        requested: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requested.append(str(request.url))
+            if request.url.path == "/missing":
+                return httpx.Response(404)
+            return httpx.Response(200, text=PAGE)
+
+        scraper = WebScraper()
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        scraper._get_async_client = lambda: client  # type: ignore[method-assign]
+
+        urls = ["https://a.test/", "https://b.test/missing", "https://a.test/"]
+        results = await scraper.ascrape_many(urls)
+
+        assert [r.url for r in results] == ["https://a.test/", "https://b.test/missing"]
+        assert results[0].success
+        assert results[0].title == "Example"
+        assert "menu" not in results[0].content
+        assert not results[1].success
+
+        await scraper.ascrape("https://a.test/")
+        assert requested == ["https://a.test/", "https://b.test/missing"]
+
+        await client.aclose()
+        scraper.close()
+
+    def test_scrape_reuses_cached_pages(self) -> None:
+        """Test that sync scrapes share the cache across calls."""
+        requested: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requested.append(str(request.url))
+            return httpx.Response(200, text=PAGE)
+
+        scraper = WebScraper()
+        scraper._client = httpx.Client(transport=httpx.MockTransport(handler))
+
+        first = scraper.scrape("https://a.test/")
+        second = scraper.scrape("https://a.test/")
+
+        assert first.success
+        assert second is first
+        assert requested == ["https://a.test/"]
+        scraper.close()
+
+
+class TestScrapedContent:
+    """Test cases for ScrapedContent."""
+
+    def test_preview_cut_once(self) -> None:
+        """Test that the prompt preview is cut on creation and kept out of to_dict()."""
+        content = ScrapedContent(url="https://a.test/", title="A", content="x" * 5000)
+
+        assert content.preview == "x" * PREVIEW_CHARS
+        assert "preview" not in content.to_dict()
+
+
+class TestScrapeCache:
+    """Test cases for the bounded page cache."""
+
+    def test_least_recently_used_page_evicted(self) -> None:
+        """Test that the cache keeps only the most recently used pages."""
+        scraper = WebScraper(cache_size=2)
+        pages = {
+            url: ScrapedContent(url=url, title="", content="")
+            for url in ("https://a.test/", "https://b.test/", "https://c.test/")
+        }
+
+        scraper._remember("https://a.test/", pages["https://a.test/"])
+        scraper._remember("https://b.test/", pages["https://b.test/"])
+        assert scraper.cached("https://a.test/") is pages["https://a.test/"]
+        scraper._remember("https://c.test/", pages["https://c.test/"])
+
+        assert scraper.cached("https://b.test/") is None
+        assert scraper.cached("https://a.test/") is pages["https://a.test/"]
+
+        scraper.clear_cache()
+        assert scraper.cached("https://a.test/") is None
+        scraper.close()
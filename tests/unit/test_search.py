@@ -0,0 +1,74 @@
+"""Tests for the search tool."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from pencraft.tools.search import SearchError, SearchTool
+
+
+def _ddgs(results: list[dict[str, str]]) -> MagicMock:
+    """Build a DDGS stand-in returning fixed text results."""
+    ddgs = MagicMock()
+    ddgs.return_value.__enter__.return_value.text.return_value = results
+    return ddgs
+
+
+class TestSearchCache:
+    """Test cases for the search result cache."""
+
+    def test_repeated_query_served_from_cache(self) -> None:
+        """Test that equivalent queries hit the cache and are counted."""
+        ddgs = _ddgs([{"title": "Python", "href": "https://www.python.org", "body": "x"}])
+        tool = SearchTool()
+
+        with patch("pencraft.tools.search.DDGS", ddgs):
+            first = tool.search("Python basics")
+            second = tool.search("  python   BASICS ")
+
+        assert ddgs.call_count == 1
+        assert second == first
+        assert second is not first
+        info = tool.cache_info()
+        assert (info.hits, info.misses, info.size) == (1, 1, 1)
+
+    def test_empty_results_not_cached(self) -> None:
+        """Test that failed or empty searches are retried."""
+        ddgs = _ddgs([])
+        tool = SearchTool()
+
+        with patch("pencraft.tools.search.DDGS", ddgs):
+            tool.search("Python")
+            tool.search("Python")
+
+        assert ddgs.call_count == 2
+        assert tool.cache_info().size == 0
+
+    def test_least_recently_used_query_evicted(self) -> None:
+        """Test that the cache keeps only the most recently used queries."""
+        ddgs = _ddgs([{"title": "Python", "href": "https://www.python.org", "body": "x"}])
+        tool = SearchTool(cache_size=2)
+
+        with patch("pencraft.tools.search.DDGS", ddgs):
+            for query in ["a", "b", "a", "c", "a", "b"]:
+                tool.search(query)
+
+        # "b" was evicted by "c" and searched again; "a" stayed cached throughout
+        assert ddgs.call_count == 4
+        info = tool.cache_info()
+        assert (info.hits, info.misses, info.size) == (2, 4, 2)
+
+
+class TestSearchErrors:
+    """Test cases for reporting provider failures."""
+
+    def test_errors_raised_on_request(self) -> None:
+        """Test that provider failures are told apart from empty results when asked."""
+        ddgs = MagicMock()
+        ddgs.return_value.__enter__.return_value.text.side_effect = RuntimeError("Ratelimit")
+        tool = SearchTool()
+
+        with patch("pencraft.tools.search.DDGS", ddgs):
+            assert tool.search("Python") == []
+            with pytest.raises(SearchError, match="Ratelimit"):
+                tool.search("Python", raise_errors=True)
@@ -1,5 +1,8 @@
 """Tests for configuration settings."""
 
+import os
+from pathlib import Path
+
 from pencraft.config.settings import Settings, load_settings
 
 
@@ -58,6 +61,30 @@ class TestSettings:
 
         assert settings.verbose is True
 
+    def test_config_file_round_trip(self, tmp_path: Path) -> None:
+        """Test that a saved config file loads back with its values."""
+        path = tmp_path / "pencraft.yaml"
+        Settings(blog={"min_word_count": 2500}).save_to_file(path)
+
+        settings = load_settings(config_file=path)
+
+        assert settings.blog.min_word_count == 2500
+
+    def test_loads_cached_until_file_changes(self, tmp_path: Path) -> None:
+        """Test that repeated loads are independent copies and an edited file is reread."""
+        path = tmp_path / "pencraft.yaml"
+        Settings(blog={"min_word_count": 2500}).save_to_file(path)
+
+        first = load_settings(config_file=path)
+        first.blog.min_word_count = 1
+        assert load_settings(config_file=path).blog.min_word_count == 2500
+
+        Settings(blog={"min_word_count": 2600}).save_to_file(path)
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert load_settings(config_file=path).blog.min_word_count == 2600
+
 
 class TestLLMSettings:
     """Test cases for LLM settings."""
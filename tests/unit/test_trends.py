@@ -0,0 +1,40 @@
+"""Tests for the Google Trends tool."""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+from pencraft.tools.trends import TrendsData, TrendsTool
+
+
+class TestTrendsTool:
+    """Test cases for TrendsTool."""
+
+    async def test_async_lookup_runs_in_thread(self) -> None:
+        """Test that the blocking lookup runs off the event loop thread."""
+        tool = TrendsTool()
+        threads: list[threading.Thread] = []
+
+        def lookup(topic: str, **_kwargs: object) -> TrendsData:
+            threads.append(threading.current_thread())
+            return TrendsData(topic=topic, interest_score=42)
+
+        tool.get_trends_data = lookup  # type: ignore[method-assign]
+
+        data = await tool.aget_trends_data("Python")
+
+        assert data.interest_score == 42
+        assert threads != [threading.current_thread()]
+
+    def test_client_per_thread(self) -> None:
+        """Test that threads never share a stateful pytrends client."""
+        tool = TrendsTool()
+        clients = []
+
+        with patch("pencraft.tools.trends.TrendReq", side_effect=lambda **_: MagicMock()):
+            main_client = tool._get_client()
+            worker = threading.Thread(target=lambda: clients.append(tool._get_client()))
+            worker.start()
+            worker.join()
+
+            assert tool._get_client() is main_client
+        assert clients[0] is not main_client
@@ -0,0 +1,277 @@
+"""Tests for utility helpers."""
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from pencraft.utils import serialization
+from pencraft.utils import text as text_utils
+from pencraft.utils.files import write_text_parts
+from pencraft.utils.ratelimit import ConcurrencyLimiter, TokenBucket
+from pencraft.utils.singleflight import SingleFlight
+from pencraft.utils.text import WordCounter, count_tokens, count_words, truncate_tokens
+
+
+class TestSingleFlight:
+    """Test cases for SingleFlight."""
+
+    async def test_concurrent_calls_coalesced(self) -> None:
+        """Test that concurrent callers with one key share a single call."""
+        flight = SingleFlight()
+        calls = 0
+
+        async def fetch() -> str:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "result"
+
+        key = SingleFlight.make_key("llm", "model", "prompt")
+        results = await asyncio.gather(*(flight.do(key, fetch) for _ in range(10)))
+
+        assert results == ["result"] * 10
+        assert calls == 1
+        await asyncio.sleep(0)
+        assert len(flight) == 0
+
+    async def test_key_released_after_call(self) -> None:
+        """Test that sequential calls are not cached."""
+        flight = SingleFlight()
+        calls = 0
+
+        async def fetch() -> int:
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert await flight.do("k", fetch) == 1
+        await asyncio.sleep(0)
+        assert await flight.do("k", fetch) == 2
+
+    async def test_errors_propagate_to_all_callers(self) -> None:
+        """Test that a failing call raises for every waiter."""
+        flight = SingleFlight()
+
+        async def fail() -> None:
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            flight.do("k", fail), flight.do("k", fail), return_exceptions=True
+        )
+
+        assert all(isinstance(r, ValueError) for r in results)
+
+    def test_make_key_distinguishes_parts(self) -> None:
+        """Test that part boundaries are part of the key."""
+        assert SingleFlight.make_key("ab", "c") != SingleFlight.make_key("a", "bc")
+        assert SingleFlight.make_key("a", None) == SingleFlight.make_key("a", "")
+
+
+class TestCountWords:
+    """Test cases for count_words."""
+
+    def test_matches_split(self) -> None:
+        """Test that counting matches str.split() on mixed whitespace."""
+        for text in ("", "   ", "one", " two  words\n", "tab\tand\u00a0nbsp\u2003em  end"):
+            assert count_words(text) == len(text.split())
+
+
+class TestWordCounter:
+    """Test cases for WordCounter."""
+
+    def test_matches_split_across_chunk_boundaries(self) -> None:
+        """Test that words split across chunks are counted once."""
+        text = "Streaming  tokens\narrive in\tpieces, mid-word and between words. "
+        for size in (1, 2, 3, 7, len(text)):
+            counter = WordCounter()
+            for start in range(0, len(text), size):
+                counter.feed(text[start : start + size])
+            assert counter.count == len(text.split())
+
+    def test_empty_and_whitespace_chunks(self) -> None:
+        """Test that empty and whitespace-only chunks add no words."""
+        counter = WordCounter()
+
+        assert counter.feed("") == 0
+        assert counter.feed("   ") == 0
+        assert counter.feed("one") == 1
+        assert counter.feed("\n") == 1
+        assert counter.feed("two") == 2
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeEncoding:
+    """Tokenizer stand-in with one token per word (including its leading space)."""
+
+    def encode(self, text: str, **_kwargs: object) -> list[str]:
+        return [("" if i == 0 else " ") + word for i, word in enumerate(text.split(" "))]
+
+    def decode(self, tokens: list[str]) -> str:
+        return "".join(tokens)
+
+
+class TestTokens:
+    """Test cases for token counting and truncation."""
+
+    def test_tokenizer_used_when_available(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that text is counted and cut with the model's tokenizer."""
+        monkeypatch.setattr(text_utils, "_encoding", lambda _model: FakeEncoding())
+
+        assert count_tokens("one two three", "gpt-4o") == 3
+        assert truncate_tokens("one two three", 2, "gpt-4o") == "one two"
+        assert truncate_tokens("one two", 5, "gpt-4o") == "one two"
+
+    def test_estimated_without_tokenizer(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the character-based fallback when no tokenizer is available."""
+        monkeypatch.setattr(text_utils, "_encoding", lambda _model: None)
+
+        assert count_tokens("x" * 9, "local-model") == 3
+        assert truncate_tokens("x" * 20, 2, "local-model") == "x" * 8
+        assert truncate_tokens("text", 0, "local-model") == ""
+
+
+class TestTokenBucket:
+    """Test cases for TokenBucket."""
+
+    def test_burst_then_paced(self) -> None:
+        """Test that the burst is free and further calls are spaced by the rate."""
+        clock = FakeClock()
+        bucket = TokenBucket(2.0, burst=2, clock=clock)
+
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == pytest.approx(0.5)
+        assert bucket.reserve() == pytest.approx(1.0)
+
+        clock.now = 10.0
+        assert bucket.reserve() == 0.0
+
+    def test_penalize_and_recover(self) -> None:
+        """Test multiplicative decrease and additive recovery of the rate."""
+        bucket = TokenBucket(4.0, clock=FakeClock())
+
+        bucket.penalize()
+        assert bucket.rate == 2.0
+        bucket.reward()
+        assert bucket.rate == pytest.approx(2.4)
+        for _ in range(20):
+            bucket.reward()
+        assert bucket.rate == 4.0
+
+        for _ in range(20):
+            bucket.penalize()
+        assert bucket.rate == bucket.min_rate == 0.25
+
+    def test_invalid_rate(self) -> None:
+        """Test that a non-positive rate is rejected."""
+        with pytest.raises(ValueError):
+            TokenBucket(0)
+
+
+class TestConcurrencyLimiter:
+    """Test cases for ConcurrencyLimiter."""
+
+    async def test_caps_operations_in_flight(self) -> None:
+        """Test that no more than the limit run at once."""
+        limiter = ConcurrencyLimiter(2)
+        running = peak = 0
+
+        async def work() -> None:
+            nonlocal running, peak
+            async with limiter.aslot():
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        await asyncio.gather(*(work() for _ in range(6)))
+
+        assert peak == 2
+
+    def test_usable_from_several_loops(self) -> None:
+        """Test that one limiter serves successive event loops."""
+        limiter = ConcurrencyLimiter(1)
+
+        async def work() -> int:
+            async with limiter.aslot():
+                await asyncio.sleep(0)
+            return 1
+
+        assert asyncio.run(work()) == asyncio.run(work()) == 1
+
+    def test_invalid_limit(self) -> None:
+        """Test that a limit below one is rejected."""
+        with pytest.raises(ValueError):
+            ConcurrencyLimiter(0)
+
+
+class TestWriteTextParts:
+    """Test cases for write_text_parts."""
+
+    def test_writes_parts_in_order(self, tmp_path: Path) -> None:
+        """Test that parts are written as if joined."""
+        path = tmp_path / "post.md"
+        parts = ["---\ntitle: Café\n---", "\n", "", "# Body " * 5000]
+
+        written = write_text_parts(path, parts)
+
+        expected = "".join(parts)
+        assert path.read_text(encoding="utf-8") == expected
+        assert written == len(expected.encode("utf-8"))
+
+    def test_truncates_existing_file(self, tmp_path: Path) -> None:
+        """Test that an existing file is overwritten."""
+        path = tmp_path / "post.md"
+        path.write_text("old content that is longer", encoding="utf-8")
+
+        write_text_parts(path, ["new"])
+
+        assert path.read_text(encoding="utf-8") == "new"
+
+    def test_more_parts_than_iov_max(self, tmp_path: Path) -> None:
+        """Test that more parts than one vectored write accepts are all written."""
+        path = tmp_path / "post.md"
+        parts = [f"{i}," for i in range(2000)]
+
+        written = write_text_parts(path, parts)
+
+        expected = "".join(parts)
+        assert path.read_text(encoding="utf-8") == expected
+        assert written == len(expected)
+
+
+class TestSerialization:
+    """Test cases for the JSON serialization helpers."""
+
+    def test_round_trip(self) -> None:
+        """Test that values survive dumps/loads unchanged."""
+        data = {"title": "Café", "tags": ["a", "b"], "count": 3}
+
+        assert serialization.loads(serialization.dumps(data)) == data
+        assert serialization.loads(serialization.dumps_bytes(data)) == data
+
+    def test_matches_stdlib_format(self) -> None:
+        """Test that output is compact or two-space indented, unescaped."""
+        data = {"b": 1, "a": "é"}
+
+        assert serialization.dumps(data, sort_keys=True) == '{"a":"é","b":1}'
+        assert serialization.dumps(data, indent=True) == json.dumps(
+            data, indent=2, ensure_ascii=False
+        )
+
+    def test_invalid_input_raises_decode_error(self) -> None:
+        """Test that parse errors are reported as JSONDecodeError."""
+        with pytest.raises(serialization.JSONDecodeError):
+            serialization.loads("{not json")
@@ -0,0 +1,280 @@
+"""Tests for the writer agent."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+from pencraft.agents.planner import BlogOutline, Section
+from pencraft.agents.writer import WriterAgent
+from pencraft.config.settings import Settings
+from pencraft.llm.prompts import SECTION_PROMPT
+
+OUTLINE = BlogOutline(
+    title="Python",
+    meta_description="About Python",
+    sections=[Section(title="Basics"), Section(title="Tooling")],
+)
+
+
+def _agent(settings: Settings) -> WriterAgent:
+    """Build a writer agent with a mocked LLM that streams section text."""
+
+    async def astream(*_args: object, **_kwargs: object) -> AsyncIterator[str]:
+        for chunk in ["Section ", "body."]:
+            yield chunk
+
+    llm = MagicMock()
+    llm.generate.return_value = "Text."
+    llm.agenerate = AsyncMock(return_value="Text.")
+    llm.generate_stream.side_effect = lambda *_a, **_k: iter(["Section ", "body."])
+    llm.agenerate_stream.side_effect = astream
+    return WriterAgent(llm, settings=settings)
+
+
+class TestWriterDraft:
+    """Test cases for streaming a post to a draft file."""
+
+    def test_draft_matches_content(self, settings: Settings, tmp_path: Path) -> None:
+        """Test that the draft file holds exactly the written post."""
+        settings.blog.include_citations = False
+        draft_path = tmp_path / "post.md.part"
+
+        result = _agent(settings).execute(OUTLINE, "notes", draft_path=draft_path)
+
+        assert result.success
+        assert "## Tooling\n\nSection body." in result.content
+        assert draft_path.read_text(encoding="utf-8") == result.content
+
+    async def test_async_draft_matches_content(self, settings: Settings, tmp_path: Path) -> None:
+        """Test that the async writer streams the same draft."""
+        settings.blog.include_citations = False
+        draft_path = tmp_path / "drafts" / "post.md.part"
+
+        result = await _agent(settings).aexecute(OUTLINE, "notes", draft_path=draft_path)
+
+        assert result.success
+        assert draft_path.read_text(encoding="utf-8") == result.content
+
+
+class TestParallelSections:
+    """Test cases for writing body sections concurrently."""
+
+    async def test_sections_overlap_and_keep_order(
+        self, settings: Settings, tmp_path: Path
+    ) -> None:
+        """Test that sections are written together and assembled in outline order."""
+        settings.blog.include_citations = False
+        settings.blog.allow_parallel_sections = True
+        agent = _agent(settings)
+        started: list[str] = []
+        all_started = asyncio.Event()
+
+        async def astream(prompt: str, **_kwargs: object) -> AsyncIterator[str]:
+            title = "Basics" if "**Current Section:** Basics" in prompt else "Tooling"
+            started.append(title)
+            if len(started) == 2:
+                all_started.set()
+            await asyncio.wait_for(all_started.wait(), timeout=5)
+            yield f"{title} body."
+
+        agent.llm.agenerate_stream.side_effect = astream  # type: ignore[attr-defined]
+        draft_path = tmp_path / "post.md.part"
+
+        result = await agent.aexecute(OUTLINE, "notes", draft_path=draft_path)
+
+        assert result.success
+        assert result.content.index("Basics body.") < result.content.index("Tooling body.")
+        assert draft_path.read_text(encoding="utf-8") == result.content
+
+
+class TestContextTail:
+    """Test cases for the previous-content context of section prompts."""
+
+    def test_tail_is_bounded(self) -> None:
+        """Test that only the last characters of the written text are kept."""
+        tail = WriterAgent._context_tail("a" * 1000)
+        tail = WriterAgent._context_tail(tail, "b" * 1000)
+
+        assert tail == "a" * 500 + "b" * 1000
+        assert WriterAgent._context_tail(tail, "c" * 2000) == "c" * 1500
+
+
+class TestSectionPrompt:
+    """Test cases for the section prompt layout."""
+
+    def test_post_context_before_section_input(self, settings: Settings) -> None:
+        """Test that sections of one post share everything up to the section input."""
+        agent = _agent(settings)
+
+        for section, previous in zip(OUTLINE.sections, ["Intro.", "Intro. Basics."], strict=True):
+            agent._write_section(OUTLINE, section, "notes", previous, target_words=300)
+
+        first, second = (call.args[0] for call in agent.llm.generate_stream.call_args_list)
+        prefix = first[: first.index("**Current Section:**")]
+        assert second.startswith(prefix)
+        assert "notes" in prefix
+        assert second.endswith("Intro. Basics.")
+
+    def test_matches_full_template(self) -> None:
+        """Test that the prompt equals formatting the whole SECTION_PROMPT."""
+        section = OUTLINE.sections[0]
+
+        prompt = WriterAgent._section_prompt(OUTLINE, section, "notes {x}", "Intro.", 300)
+
+        assert prompt == SECTION_PROMPT.format(
+            title=OUTLINE.title,
+            section_title=section.title,
+            section_outline=WriterAgent._section_brief(section),
+            previous_content="Intro.",
+            research_notes="notes {x}",
+            word_count=300,
+        )
+
+
+class TestBatchedSections:
+    """Test cases for writing all body sections in one request."""
+
+    def _agent(self, settings: Settings, batch_reply: str) -> WriterAgent:
+        settings.blog.include_citations = False
+        settings.blog.batch_sections = True
+        agent = _agent(settings)
+        agent.llm.generate.side_effect = (  # type: ignore[attr-defined]
+            lambda prompt, **_k: batch_reply if "Sections to write" in prompt else "Text."
+        )
+        return agent
+
+    def test_one_request_for_all_sections(self, settings: Settings) -> None:
+        """Test that sections come from a single JSON reply in outline order."""
+        reply = '```json\n{"Tooling": "Tooling body.", "Basics": "Basics body."}\n```'
+        agent = self._agent(settings, reply)
+
+        result = agent.execute(OUTLINE, "notes")
+
+        assert result.success
+        assert result.content.index("Basics body.") < result.content.index("Tooling body.")
+        agent.llm.generate_stream.assert_not_called()  # type: ignore[attr-defined]
+
+    def test_missing_sections_written_one_by_one(self, settings: Settings) -> None:
+        """Test that sections absent from the reply fall back to their own request."""
+        agent = self._agent(settings, '{"Basics": "Basics body."}')
+
+        result = agent.execute(OUTLINE, "notes")
+
+        assert "## Basics\n\nBasics body." in result.content
+        assert "## Tooling\n\nSection body." in result.content
+        assert agent.llm.generate_stream.call_count == 1  # type: ignore[attr-defined]
+
+    def test_skipped_when_over_output_budget(self, settings: Settings) -> None:
+        """Test that sections are written separately when they can't fit one reply."""
+        settings.llm.max_tokens = 100
+        agent = self._agent(settings, "{}")
+
+        agent.execute(OUTLINE, "notes")
+
+        prompts = [c.args[0] for c in agent.llm.generate.call_args_list]  # type: ignore[attr-defined]
+        assert not any("Sections to write" in p for p in prompts)
+        assert agent.llm.generate_stream.call_count == 2  # type: ignore[attr-defined]
+
+
+class TestConcurrentConclusion:
+    """Test cases for writing the conclusion alongside the body."""
+
+    async def test_conclusion_written_while_sections_stream(self, settings: Settings) -> None:
+        """Test that the conclusion request starts before the sections finish."""
+        settings.blog.include_citations = False
+        agent = _agent(settings)
+        events: list[str] = []
+
+        async def agenerate(prompt: str, **_kwargs: object) -> str:
+            events.append("conclusion" if "Sections Covered" in prompt else "intro")
+            return "Text."
+
+        async def astream(*_args: object, **_kwargs: object) -> AsyncIterator[str]:
+            await asyncio.sleep(0.01)
+            events.append("section")
+            yield "Section body."
+
+        agent.llm.agenerate = agenerate  # type: ignore[method-assign]
+        agent.llm.agenerate_stream.side_effect = astream  # type: ignore[attr-defined]
+
+        result = await agent.aexecute(OUTLINE, "notes")
+
+        assert result.success
+        assert result.content.endswith("## Conclusion\n\nText.")
+        assert events.index("conclusion") < events.index("section")
+
+
+class TestWordLimit:
+    """Test cases for stopping at blog.max_word_count."""
+
+    @staticmethod
+    def _conclusion_prompts(calls: list[Any]) -> list[str]:
+        """Get the conclusion prompts among the recorded LLM calls."""
+        return [c.args[0] for c in calls if "Sections Covered" in c.args[0]]
+
+    def test_sections_over_limit_not_written(self, settings: Settings) -> None:
+        """Test that sections past the limit are neither written nor concluded on."""
+        settings.blog.include_citations = False
+        settings.blog.max_word_count = 600  # 500 words per part: intro and one section
+        agent = _agent(settings)
+
+        result = agent.execute(OUTLINE, "notes")
+
+        assert result.success
+        assert "## Basics" in result.content
+        assert "## Tooling" not in result.content
+        assert agent.llm.generate_stream.call_count == 1  # type: ignore[attr-defined]
+        [prompt] = self._conclusion_prompts(agent.llm.generate.call_args_list)  # type: ignore[attr-defined]
+        assert "Basics" in prompt
+        assert "Tooling" not in prompt
+
+    async def test_parallel_sections_trimmed_before_writing(self, settings: Settings) -> None:
+        """Test that parallel sections are limited before any is generated."""
+        settings.blog.include_citations = False
+        settings.blog.allow_parallel_sections = True
+        settings.blog.max_word_count = 600
+        agent = _agent(settings)
+
+        result = await agent.aexecute(OUTLINE, "notes")
+
+        assert result.success
+        assert "## Tooling" not in result.content
+        assert agent.llm.agenerate_stream.call_count == 1  # type: ignore[attr-defined]
+        [prompt] = self._conclusion_prompts(agent.llm.agenerate.call_args_list)  # type: ignore[attr-defined]
+        assert "Tooling" not in prompt
+
+    async def test_long_output_stops_later_sections(self, settings: Settings) -> None:
+        """Test that running over the planned length skips the remaining sections."""
+        settings.blog.include_citations = False
+        settings.blog.max_word_count = 1600  # every section fits the plan
+        agent = _agent(settings)
+        agent.llm.agenerate.return_value = "word " * 2000  # type: ignore[attr-defined]
+
+        result = await agent.aexecute(OUTLINE, "notes")
+
+        assert result.success
+        assert "## Basics" not in result.content
+        agent.llm.agenerate_stream.assert_not_called()  # type: ignore[attr-defined]
+        prompts = self._conclusion_prompts(agent.llm.agenerate.call_args_list)  # type: ignore[attr-defined]
+        assert "Basics" not in prompts[-1]
+
+
+class TestStyleCheck:
+    """Test cases for the banned phrase check."""
+
+    def test_phrases_reported_once_in_blacklist_order(self, settings: Settings) -> None:
+        """Test that each banned phrase is reported once, whatever its case."""
+        agent = _agent(settings)
+        messages: list[str] = []
+        agent.on_progress = messages.append
+
+        agent._check_style(
+            "Moreover, we DELVE INTO it. Furthermore, moreover. A landscape office.", "Body"
+        )
+
+        assert messages == [
+            "⚠️ Style warnings in Body: Found banned phrase: 'Furthermore', "
+            "Found banned phrase: 'Moreover', Found banned phrase: 'Delve into'"
+        ]